@@ -8,12 +8,23 @@ import os
 import sys
 import json
 import subprocess
+import shlex
 import shutil
+import string
 import platform
 import time
 import argparse
+import threading
+import hashlib
+import asyncio
+import http.client
+import urllib.parse
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from types import MappingProxyType
+from typing import Callable, Dict, List, Optional, Tuple
 from dataclasses import dataclass
 from datetime import datetime
 
@@ -25,10 +36,64 @@ except ImportError:
     ADVANCED_FEATURES_AVAILABLE = False
     print("Warning: Advanced features module not found. Some features will be limited.")
 
+# Prefer orjson for parsing gh/API JSON; it accepts str or bytes directly
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
+# Optional incremental JSON parser: builds records straight from the HTTP stream
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+# Optional in-process git bindings (avoids a git fork/exec per branch operation)
+try:
+    import pygit2
+    PYGIT2_AVAILABLE = True
+    # FileNotFoundError: outside a repo the branch commands fall back to the git CLI,
+    # which may not be installed when pygit2 let them skip require_tool('git')
+    GIT_ERRORS = (subprocess.CalledProcessError, FileNotFoundError, pygit2.GitError, ValueError, KeyError)
+except ImportError:
+    PYGIT2_AVAILABLE = False
+    GIT_ERRORS = (subprocess.CalledProcessError, FileNotFoundError, ValueError, KeyError)
+
 # Configuration
 LOGS_DIR = Path.home() / ".local/share/codespaces-manager/logs"
 CONFIG_FILE = Path.home() / ".config/codespaces-manager/config.json"
 CACHE_DIR = Path.home() / ".cache/codespaces-manager"
+GH_HOSTS_FILE = Path.home() / ".config/gh/hosts.yml"
+HOSTNAME = platform.node()
+
+# Subprocess timeouts (seconds) so a dead network never freezes the menu
+LOCAL_TIMEOUT = 5
+GH_TIMEOUT = 15
+# Remote setup scripts install toolchains, so they get much longer
+SCRIPT_TIMEOUT = 600
+# Lowercases an operation name and folds shell-unsafe characters to '_' in one pass
+SCRIPT_PREFIX_TABLE = str.maketrans({**{c: '_' for c in ' /\\:;&|$`"\'()<>*?!#~{}[]'},
+                                     **{c: c.lower() for c in string.ascii_uppercase}})
+# Lines of remote output kept for the failure summary
+SCRIPT_TAIL_LINES = 15
+
+# How long a fetched repository list is reused before asking gh again
+REPO_CACHE_TTL = 60
+# Codespaces change state more often, so their listing is kept for less time
+CODESPACE_CACHE_TTL = 30
+# Largest page the codespaces API serves
+CODESPACES_PAGE_SIZE = 100
+
+# External tools whose presence is checked once at startup
+TOOLS = ('gh', 'git', 'ssh', 'ssh-keygen')
+
+# Validates a repository and fetches its default branch in a single API call
+REPO_LOOKUP_QUERY = (
+    "query($owner: String!, $name: String!) {"
+    " repository(owner: $owner, name: $name) { nameWithOwner defaultBranchRef { name } } }"
+)
 
 # Colors for terminal output
 class Colors:
@@ -41,6 +106,54 @@ class Colors:
     MAGENTA = "\033[35m"
     CYAN = "\033[36m"
 
+# Per-codespace row layout for the metrics menu, filled with str.format_map
+CS_METRICS_ROW = (f"\n{Colors.CYAN}Name:{Colors.RESET} {{name}}\n"
+                  "Repository: {repository}\n"
+                  "State: {state}\n"
+                  "Machine: {machine_type}\n")
+
+# Main menu body and prompt, rendered once instead of on every loop iteration
+MAIN_MENU_ITEMS = (
+    (' 1', "Environment & Diagnostics"),
+    (' 2', "GitHub Auth & SSH"),
+    (' 3', "Repository Operations"),
+    (' 4', "Branch/PR/Issue Operations"),
+    (' 5', "Releases & Tags"),
+    (' 6', "Secrets/Actions/Policies"),
+    (' 7', "Codespaces Lifecycle"),
+    (' 8', "Codespaces Metrics & Costs"),
+    (' 9', "Cleanup & Cache GC"),
+    ('10', "Settings & Profiles"),
+    ('11', "Quick Start Wizard"),
+    ('12', "Uninstall"),
+    (' 0', "Exit"),
+)
+MAIN_MENU_TEXT = "\n".join([f"{Colors.BOLD}Main Menu:{Colors.RESET}"] +
+                           [f" {Colors.CYAN}{key}.{Colors.RESET} {label}" for key, label in MAIN_MENU_ITEMS]) + "\n"
+MAIN_PROMPT = f"{Colors.BLUE}Choose an option (0-12): {Colors.RESET}"
+
+# Per-codespace block for the codespace selector, with the fixed colors baked in
+CS_SELECTOR_ROW = (f" {Colors.CYAN}▶{Colors.RESET}  {Colors.BOLD}{{name}}{Colors.RESET}\n"
+                   f"    Status: {{state_color}}{{state}}{Colors.RESET}\n"
+                   "    Repository: {repo}\n"
+                   "    Machine: {machine}\n")
+STATE_COLORS = {'Available': Colors.GREEN}
+# Shared read-only stand-in for missing nested objects, so lookups don't allocate a dict per row
+EMPTY_MAPPING = MappingProxyType({})
+
+
+def codespace_ssh(codespace_name: str, command: Optional[str] = None) -> List[str]:
+    """Build a gh codespace ssh command line, optionally running a remote command"""
+    cmd = ['gh', 'codespace', 'ssh', '--codespace', codespace_name]
+    return cmd + ['--', command] if command else cmd
+
+
+def _emit(lines: List[str]):
+    """Write a block of lines to the terminal in a single write"""
+    sys.stdout.flush()  # keep ordering with anything print() has buffered
+    sys.stdout.buffer.write(("\n".join(lines) + "\n").encode())
+    sys.stdout.buffer.flush()
+
 @dataclass
 class Config:
     """Configuration settings"""
@@ -86,32 +199,43 @@ class SystemInfo:
     """System information and diagnostics"""
 
     @staticmethod
+    @lru_cache(maxsize=1)
     def is_termux() -> bool:
         return os.path.exists("/data/data/com.termux")
 
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def get_platform_info() -> MappingProxyType:
+        """Kernel/platform identity; fixed for the life of the process, so probed once"""
+        return MappingProxyType({
+            'uname': subprocess.check_output(['uname', '-a'], text=True, timeout=LOCAL_TIMEOUT).strip(),
+            'termux': SystemInfo.is_termux(),
+        })
+
     @staticmethod
     def get_system_info() -> Dict:
         info = {}
         try:
             # System info
-            info['uname'] = subprocess.check_output(['uname', '-a'], text=True).strip()
-            info['termux'] = SystemInfo.is_termux()
+            info.update(SystemInfo.get_platform_info())
 
             # Storage info
-            df_output = subprocess.check_output(['df', '-h'], text=True)
+            df_output = subprocess.check_output(['df', '-h'], text=True, timeout=LOCAL_TIMEOUT)
             info['storage'] = df_output
 
             # Memory info
-            free_output = subprocess.check_output(['free', '-m'], text=True)
+            free_output = subprocess.check_output(['free', '-m'], text=True, timeout=LOCAL_TIMEOUT)
             info['memory'] = free_output
 
             # Network test
             try:
                 ping_result = subprocess.check_output(
                     ['ping', '-c', '3', 'api.github.com'],
-                    text=True, stderr=subprocess.DEVNULL
+                    text=True, stderr=subprocess.DEVNULL, timeout=GH_TIMEOUT
                 )
                 info['github_connectivity'] = "OK"
+            except subprocess.TimeoutExpired:
+                info['github_connectivity'] = "TIMEOUT"
             except:
                 info['github_connectivity'] = "FAILED"
 
@@ -120,40 +244,600 @@ class SystemInfo:
 
         return info
 
+class GhSession:
+    """Keep-alive HTTPS session to the GitHub API, authenticated with gh's token"""
+
+    API_HOST = "api.github.com"
+
+    def __init__(self, logger: Logger, on_unauthorized: Optional[Callable[[], None]] = None):
+        self.logger = logger
+        self.on_unauthorized = on_unauthorized  # called on HTTP 401 so cached auth state is dropped
+        self._token: Optional[str] = None
+        self._conn: Optional[http.client.HTTPSConnection] = None
+        self._rate_limit_reset = 0.0  # epoch seconds until which the API is known to be exhausted
+
+    def get_token(self) -> Optional[str]:
+        """Read the gh token once per session"""
+        if self._token is None:
+            try:
+                result = subprocess.run(['gh', 'auth', 'token'],
+                                      capture_output=True, text=True, timeout=LOCAL_TIMEOUT)
+                self._token = result.stdout.strip() if result.returncode == 0 else ""
+            except Exception:
+                self._token = ""
+        return self._token or None
+
+    def reset(self):
+        """Forget the token and drop the connection (e.g. after re-login)"""
+        self._token = None
+        if self._conn:
+            self._conn.close()
+            self._conn = None
+
+    def request(self, method: str, path: str, body: Optional[Dict] = None,
+                items: Optional[str] = None) -> Tuple[bool, object]:
+        """Send a REST request over the shared connection; with items (e.g. 'codespaces.item') return only that array"""
+        if time.time() < self._rate_limit_reset:
+            resume = datetime.fromtimestamp(self._rate_limit_reset).strftime('%H:%M:%S')
+            return False, f"GitHub API rate limit exceeded; retry after {resume}"
+
+        token = self.get_token()
+        if not token:
+            return False, "GitHub CLI not authenticated. Run 'gh auth login' first."
+
+        headers = {
+            'Authorization': f'token {token}',
+            'Accept': 'application/vnd.github+json',
+            'User-Agent': 'codespaces-manager',
+        }
+        payload = None
+        if body is not None:
+            payload = json.dumps(body).encode()
+            headers['Content-Type'] = 'application/json'
+
+        for attempt in range(2):
+            if self._conn is None:
+                self._conn = http.client.HTTPSConnection(self.API_HOST, timeout=GH_TIMEOUT)
+            try:
+                self._conn.request(method, path, body=payload, headers=headers)
+                response = self._conn.getresponse()
+                if items and IJSON_AVAILABLE and response.status < 400:
+                    # Parse records off the socket instead of buffering the whole body first
+                    records = list(ijson.items(response, items, use_float=True))
+                    response.read()  # drain so the keep-alive connection stays usable
+                    return True, records
+                data = response.read()
+                break
+            except (http.client.HTTPException, OSError) as e:
+                # GitHub may have closed an idle keep-alive connection; reconnect once
+                self._conn.close()
+                self._conn = None
+                if attempt:
+                    return False, str(e)
+
+        # Back off without touching the network until the rate limit window resets
+        if response.getheader('X-RateLimit-Remaining') == '0':
+            try:
+                self._rate_limit_reset = float(response.getheader('X-RateLimit-Reset', 0))
+            except ValueError:
+                pass
+
+        try:
+            parsed = json_loads(data) if data else None
+        except ValueError:
+            parsed = data.decode(errors='replace')
+
+        if response.status == 401:
+            # Token revoked or expired: forget it instead of trusting it for the rest of the session
+            if self.on_unauthorized:
+                self.on_unauthorized()
+            else:
+                self.reset()
+        if response.status >= 400:
+            message = parsed.get('message', parsed) if isinstance(parsed, dict) else parsed
+            return False, f"HTTP {response.status}: {message}"
+        if items:
+            for key in items.split('.')[:-1]:
+                parsed = (parsed or {}).get(key, [])
+        return True, parsed
+
+    def graphql(self, query: str, variables: Optional[Dict] = None) -> Tuple[bool, object]:
+        """Run a GraphQL query and return (success, data)"""
+        success, result = self.request('POST', '/graphql', {'query': query, 'variables': variables or {}})
+        if not success:
+            return False, result
+        if result.get('errors'):
+            return False, '; '.join(err.get('message', '') for err in result['errors'])
+        return True, result.get('data')
+
+
 class GitHubManager:
     """GitHub operations wrapper"""
 
     def __init__(self, logger: Logger):
         self.logger = logger
-
-    def run_gh_command(self, cmd: List[str], check_auth: bool = True) -> Tuple[bool, str]:
-        """Run a gh command and return success status and output"""
+        self._auth_cached: Optional[bool] = None
+        self._auth_hosts_mtime: Optional[float] = None  # hosts.yml mtime the cached auth state was read at
+        self.session = GhSession(logger, on_unauthorized=self.invalidate_auth)
+        self.gh_installed = shutil.which('gh') is not None
+
+    def list_codespaces_detailed(self) -> Tuple[bool, object]:
+        """Fetch every codespace with repository, machine and state details in as few requests as possible"""
+        codespaces: List[Dict] = []
+        page = 1
+        while True:
+            success, batch = self.session.request('GET', f'/user/codespaces?per_page={CODESPACES_PAGE_SIZE}&page={page}',
+                                                  items='codespaces.item')
+            if not success:
+                return False, batch
+            codespaces.extend(batch)
+            # A short page is the last one
+            if len(batch) < CODESPACES_PAGE_SIZE:
+                return True, codespaces
+            page += 1
+
+    def create_codespace(self, repo: str, branch: Optional[str] = None, machine: Optional[str] = None,
+                         geo: Optional[str] = None) -> Tuple[bool, object]:
+        """Create a codespace for owner/name and return its structured record"""
+        body = {}
+        if branch:
+            body['ref'] = branch
+        if machine:
+            body['machine'] = machine
+        if geo:
+            body['geo'] = geo
+        return self.session.request('POST', f"/repos/{urllib.parse.quote(repo)}/codespaces", body)
+
+    def run_gh_command(self, cmd: List[str], check_auth: bool = True,
+                       timeout: Optional[float] = GH_TIMEOUT, binary: bool = False) -> Tuple[bool, str]:
+        """Run a gh command and return success status and output (raw bytes on success if binary)"""
+        if not self.gh_installed:
+            return False, "GitHub CLI (gh) is not installed."
         if check_auth and not self.is_authenticated():
             return False, "GitHub CLI not authenticated. Run 'gh auth login' first."
 
         try:
-            result = subprocess.run(['gh'] + cmd, capture_output=True, text=True)
+            # Captured gh calls never get the terminal, so a stray prompt fails fast instead of hanging
+            result = subprocess.run(['gh'] + cmd, stdin=subprocess.DEVNULL, capture_output=True, timeout=timeout)
             if result.returncode == 0:
-                return True, result.stdout.strip()
+                # JSON consumers can hand the bytes straight to orjson without a decode pass
+                return True, result.stdout if binary else result.stdout.decode(errors='replace').strip()
             else:
-                return False, result.stderr.strip()
+                error = result.stderr.decode(errors='replace').strip()
+                self.check_auth_error(error)
+                return False, error
+        except subprocess.TimeoutExpired:
+            return False, "gh command timed out"
+        except Exception as e:
+            return False, str(e)
+
+    async def run_gh_async(self, cmd: List[str], timeout: Optional[float] = GH_TIMEOUT) -> Tuple[bool, str]:
+        """Async counterpart of run_gh_command so several gh calls can run at once"""
+        if not self.gh_installed:
+            return False, "GitHub CLI (gh) is not installed."
+
+        try:
+            process = await asyncio.create_subprocess_exec(
+                'gh', *cmd,
+                stdin=asyncio.subprocess.DEVNULL,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE
+            )
         except Exception as e:
             return False, str(e)
 
-    def is_authenticated(self) -> bool:
-        """Check if gh is authenticated"""
+        try:
+            stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=timeout)
+        except asyncio.TimeoutError:
+            process.kill()
+            return False, "gh command timed out"
+
+        if process.returncode == 0:
+            return True, stdout.decode().strip()
+        error = stderr.decode().strip()
+        self.check_auth_error(error)
+        return False, error
+
+    def run_gh_stream(self, cmd: List[str], check_auth: bool = True) -> Tuple[bool, str]:
+        """Run a gh command with its output going straight to the terminal; returns success and stderr"""
+        if not self.gh_installed:
+            return False, "GitHub CLI (gh) is not installed."
+        if check_auth and not self.is_authenticated():
+            return False, "GitHub CLI not authenticated. Run 'gh auth login' first."
+
+        sys.stdout.flush()
+        try:
+            result = subprocess.run(['gh'] + cmd, stderr=subprocess.PIPE, text=True, timeout=GH_TIMEOUT)
+            return result.returncode == 0, result.stderr.strip()
+        except subprocess.TimeoutExpired:
+            return False, "gh command timed out"
+        except Exception as e:
+            return False, str(e)
+
+    def check_auth_error(self, error: str):
+        """Drop the cached auth state when gh reports the credentials were rejected"""
+        if 'HTTP 401' in error or 'gh auth login' in error:
+            self.invalidate_auth()
+
+    def is_authenticated(self, refresh: bool = False) -> bool:
+        """Check if gh is authenticated (cached until hosts.yml changes)"""
+        try:
+            mtime = GH_HOSTS_FILE.stat().st_mtime
+        except OSError:
+            mtime = None
+        if self._auth_cached is not None and not refresh and mtime == self._auth_hosts_mtime:
+            return self._auth_cached
+        self._auth_hosts_mtime = mtime
+
+        # A token stored in gh's hosts file means a login, so avoid forking gh when there is one
+        try:
+            if "oauth_token:" in GH_HOSTS_FILE.read_text():
+                self._auth_cached = True
+                return True
+        except OSError:
+            pass
+
         try:
             result = subprocess.run(['gh', 'auth', 'status'],
-                                  capture_output=True, text=True)
-            return result.returncode == 0
+                                  capture_output=True, text=True, timeout=LOCAL_TIMEOUT)
+            self._auth_cached = result.returncode == 0
         except:
-            return False
+            self._auth_cached = False
+        return self._auth_cached
+
+    def invalidate_auth(self):
+        """Forget the cached auth state after login/logout"""
+        self._auth_cached = None
+        self.session.reset()
 
     def get_auth_status(self) -> str:
         """Get detailed auth status"""
-        success, output = self.run_gh_command(['auth', 'status'], check_auth=False)
+        success, output = self.run_gh_command(['auth', 'status'], check_auth=False,
+                                              timeout=LOCAL_TIMEOUT)
         return output if success else "Not authenticated"
 
+# Shared shell payloads for the full, artifacts and dev-tools setups, built once at import
+ALIAS_BASHRC_BLOCK = """
+# Git aliases
+alias gst='git status'
+alias gco='git checkout'
+alias gcb='git checkout -b'
+alias gp='git push'
+alias gpl='git pull'
+alias ga='git add'
+alias gc='git commit'
+alias gd='git diff'
+alias gl='git log --oneline'
+
+# Directory aliases
+alias ll='ls -alF'
+alias la='ls -A'
+alias l='ls -CF'
+alias ..='cd ..'
+alias ...='cd ../..'
+
+# Development aliases
+alias py='python3'
+alias pip='pip3'
+alias code='code .'
+alias t='tree'
+alias h='htop'
+
+# AI aliases (short & full)
+alias cl='claude'
+alias claude='claude-cli'
+alias qw='ollama run qwen'
+alias qwen='ollama run qwen'
+alias chat='ollama run qwen'
+
+# Quick commands
+alias update='sudo apt update && sudo apt upgrade'
+alias install='sudo apt install'
+alias search='apt search'
+alias ports='sudo netstat -tulpn'
+alias weather='curl wttr.in'
+
+# Make directories and navigate into them
+mkcd() { mkdir -p "$1" && cd "$1"; }
+
+"""
+ALIAS_BLOCK_PREFIX = "# codespaces-manager aliases"
+ALIAS_BLOCK_END = "# end codespaces-manager aliases"
+ALIAS_BLOCK_MARKER = f"{ALIAS_BLOCK_PREFIX} {hashlib.sha256(ALIAS_BASHRC_BLOCK.encode()).hexdigest()[:8]}"
+# Leaves ~/.bashrc alone if it already has this exact block; otherwise drops any
+# older version of the block and appends the current one, so the file never grows
+ALIAS_BASHRC_SNIPPET = (
+    f'if ! grep -qF "{ALIAS_BLOCK_MARKER}" ~/.bashrc 2>/dev/null; then\n'
+    f"    sed -i '/^{ALIAS_BLOCK_PREFIX} /,/^{ALIAS_BLOCK_END}$/d' ~/.bashrc 2>/dev/null || true\n"
+    f'    cat >> ~/.bashrc << "ALIASEOF"\n'
+    f"{ALIAS_BLOCK_MARKER}\n{ALIAS_BASHRC_BLOCK}{ALIAS_BLOCK_END}\n"
+    f"ALIASEOF\n"
+    f"fi\n"
+)
+
+VIM_RC_BLOCK = """set number
+set autoindent
+set tabstop=4
+set shiftwidth=4
+syntax on
+"""
+
+VSCODE_EXTENSIONS_LIST = [
+    "ms-python.python",
+    "rust-lang.rust-analyzer",
+    "golang.go",
+    "ms-vscode.vscode-typescript-next",
+    "bradlc.vscode-tailwindcss",
+    "esbenp.prettier-vscode",
+    "ms-vscode.vscode-json",
+    "redhat.vscode-yaml",
+    "ms-azuretools.vscode-docker",
+    "github.copilot",
+    "anthropic.claude-dev",
+]
+# Extra extensions installed by the development tools setup
+DEV_TOOLS_EXTENSIONS_LIST = VSCODE_EXTENSIONS_LIST + [
+    "ms-python.black-formatter",
+    "ms-vsliveshare.vsliveshare",
+    "ms-vscode.hexeditor",
+    "yzhang.markdown-all-in-one",
+    "ms-vscode-remote.remote-containers",
+    "github.github-vscode-theme",
+    "pkief.material-icon-theme",
+    "formulahendry.auto-rename-tag",
+    "christian-kohler.path-intellisense",
+]
+
+
+def _bash_array(name: str, items: List[str]) -> str:
+    """Render a bash array assignment"""
+    return f"{name}=(\n" + "".join(f'    "{item}"\n' for item in items) + ")\n"
+
+
+# Helpers prepended to every remote script:
+# - apt_update_once refreshes package lists at most once every 10 minutes, so consecutive
+#   setups in the same codespace don't each re-download the apt indexes
+# - wait_for_ollama polls the Ollama API with backoff instead of sleeping a fixed time
+SCRIPT_PROLOGUE = """
+apt_update_once() {
+    local stamp=/tmp/.apt-updated
+    if [ ! -f "$stamp" ] || [ $(( $(date +%s) - $(stat -c %Y "$stamp") )) -gt 600 ]; then
+        sudo apt update && touch "$stamp"
+    fi
+}
+wait_for_ollama() {
+    for delay in 0.25 0.5 1 2 4 8 16; do
+        curl -sf http://127.0.0.1:11434/api/tags >/dev/null && return 0
+        sleep "$delay"
+    done
+    echo "Ollama did not become ready in time"
+    return 1
+}
+"""
+
+# Installs $EXTENSIONS eight at a time; the work is mostly VSIX downloads, so it parallelizes well
+EXTENSION_INSTALL_SNIPPET = """
+rm -f /tmp/ext-fail.log
+printf '%s\\n' "${EXTENSIONS[@]}" | xargs -P8 -I{} sh -c \\
+    'code --install-extension "$1" --force >/dev/null 2>&1 || echo "$1" >> /tmp/ext-fail.log' _ {}
+if [ -s /tmp/ext-fail.log ]; then
+    echo "Some extensions failed to install:"
+    cat /tmp/ext-fail.log
+fi
+"""
+
+FULL_SETUP_SCRIPT = (
+    """#!/bin/bash
+set -e
+
+echo "🚀 Starting Full Development Environment Setup..."
+
+# Update system
+echo "📦 Updating system packages..."
+apt_update_once && sudo apt upgrade -y
+
+# Essential tools
+echo "🔧 Installing essential tools..."
+sudo apt install -y curl wget git vim tmux htop tree jq unzip build-essential
+
+# Python setup
+echo "🐍 Setting up Python environment..."
+sudo apt install -y python3 python3-pip python3-venv
+python3 -m pip install --upgrade pip
+pip3 install poetry black ruff mypy pytest jupyter
+
+# Node.js setup
+echo "📦 Installing Node.js and npm..."
+curl -fsSL https://deb.nodesource.com/setup_lts.x | sudo -E bash -
+sudo apt install -y nodejs
+npm install -g npm@latest typescript ts-node eslint prettier
+
+# Rust setup
+echo "🦀 Installing Rust..."
+curl --proto '=https' --tlsv1.2 -sSf https://sh.rustup.rs | sh -s -- -y
+source ~/.cargo/env
+rustup component add clippy rustfmt
+
+# Go setup
+echo "🐹 Installing Go..."
+GO_VERSION="1.21.5"
+sudo rm -rf /usr/local/go
+curl -fsSL "https://go.dev/dl/go${GO_VERSION}.linux-amd64.tar.gz" | sudo tar -C /usr/local -xz
+echo 'export PATH=$PATH:/usr/local/go/bin' >> ~/.bashrc
+
+# Java setup
+echo "☕ Installing Java..."
+sudo apt install -y openjdk-17-jdk maven gradle
+
+# Claude CLI setup
+echo "🤖 Installing Claude CLI..."
+if command -v npm >/dev/null 2>&1; then
+    npm install -g @anthropic-ai/claude-cli || echo "Claude CLI install failed, continuing..."
+fi
+
+# Ollama for Qwen setup
+echo "🧠 Installing Ollama for Qwen..."
+curl -fsSL https://ollama.ai/install.sh | sh
+nohup ollama serve > /dev/null 2>&1 &
+wait_for_ollama || true
+ollama pull qwen:latest || echo "Qwen model pull failed, continuing..."
+
+# Docker setup
+echo "🐳 Installing Docker..."
+curl -fsSL https://get.docker.com | sh
+sudo usermod -aG docker $USER
+
+# Git configuration
+echo "📝 Configuring Git..."
+git config --global init.defaultBranch main
+git config --global pull.rebase false
+git config --global core.editor vim
+
+# Helpful aliases
+echo "⚡ Setting up aliases and shortcuts..."
+"""
+    + ALIAS_BASHRC_SNIPPET
+    + """
+# VS Code extensions
+echo "💻 Installing VS Code extensions..."
+"""
+    + _bash_array("EXTENSIONS", VSCODE_EXTENSIONS_LIST)
+    + EXTENSION_INSTALL_SNIPPET
+    + """
+
+# Final setup
+echo "🎯 Final setup steps..."
+source ~/.bashrc
+
+echo "✅ Full Development Environment Setup Complete!"
+echo ""
+echo "🎉 Available tools and commands:"
+echo "Languages: python3, node, cargo, go, java, javac"
+echo "AI: claude, qwen (ollama run qwen)"
+echo "Git: gst, gco, gp, ga, gc (and standard git)"
+echo "Utils: ll, la, t (tree), h (htop)"
+echo "Development: code, docker, poetry, npm"
+echo ""
+echo "🔄 Restart your terminal or run 'source ~/.bashrc' to use aliases"
+"""
+)
+
+ARTIFACTS_SETUP_SCRIPT = (
+    """#!/bin/bash
+echo "⚡ Setting up programming artifacts and aliases..."
+
+# Git aliases and configuration
+echo "📝 Configuring Git..."
+git config --global init.defaultBranch main
+git config --global pull.rebase false
+git config --global core.editor vim
+
+# Helpful aliases
+echo "⚡ Setting up aliases and shortcuts..."
+"""
+    + ALIAS_BASHRC_SNIPPET
+    + """
+# Vim configuration
+echo "⚙️ Setting up vim configuration..."
+"""
+    + f'cat > ~/.vimrc << "VIMEOF"\n{VIM_RC_BLOCK}VIMEOF\n'
+    + """
+echo "✅ Programming artifacts setup complete!"
+echo "🔄 Run 'source ~/.bashrc' or restart terminal to activate changes"
+"""
+)
+
+DEV_TOOLS_SETUP_SCRIPT = (
+    """#!/bin/bash
+echo "🛠️ Installing development tools and VS Code extensions..."
+
+# Essential development tools
+echo "Installing development tools..."
+apt_update_once
+sudo apt install -y curl wget git vim tmux htop tree jq unzip build-essential
+
+# VS Code extensions for enhanced development
+echo "📦 Installing VS Code extensions..."
+"""
+    + _bash_array("EXTENSIONS", DEV_TOOLS_EXTENSIONS_LIST)
+    + EXTENSION_INSTALL_SNIPPET
+    + """
+
+# Additional useful tools
+echo "Installing additional tools..."
+# Install gh cli if not present
+type gh >/dev/null 2>&1 || {
+    curl -fsSL https://cli.github.com/packages/githubcli-archive-keyring.gpg | sudo dd of=/usr/share/keyrings/githubcli-archive-keyring.gpg
+    echo "deb [arch=$(dpkg --print-architecture) signed-by=/usr/share/keyrings/githubcli-archive-keyring.gpg] https://cli.github.com/packages stable main" | sudo tee /etc/apt/sources.list.d/github-cli.list > /dev/null
+    sudo apt update
+    sudo apt install gh -y
+}
+
+echo "✅ Development tools setup complete!"
+echo "🎉 Installed VS Code extensions for Python, Rust, Go, TypeScript, and more!"
+"""
+)
+
+# Per-language setup scripts, shared by the single-language and bundled setups
+LANGUAGE_SETUP_SCRIPTS = {
+    'Python': """#!/bin/bash
+echo "🐍 Setting up Python environment..."
+apt_update_once
+sudo apt install -y python3 python3-pip python3-venv python3-dev
+python3 -m pip install --upgrade pip
+pip3 install poetry black ruff mypy pytest jupyter pandas numpy requests flask fastapi
+echo "✅ Python setup complete!"
+""",
+    'Node.js': """#!/bin/bash
+echo "📦 Setting up Node.js environment..."
+curl -fsSL https://deb.nodesource.com/setup_lts.x | sudo -E bash -
+sudo apt install -y nodejs
+npm install -g npm@latest typescript ts-node eslint prettier nodemon
+echo "✅ Node.js setup complete!"
+""",
+    'Rust': """#!/bin/bash
+echo "🦀 Setting up Rust environment..."
+curl --proto '=https' --tlsv1.2 -sSf https://sh.rustup.rs | sh -s -- -y
+source ~/.cargo/env
+rustup component add clippy rustfmt
+echo "✅ Rust setup complete!"
+""",
+    'Go': """#!/bin/bash
+echo "🐹 Setting up Go environment..."
+GO_VERSION="1.21.5"
+sudo rm -rf /usr/local/go
+curl -fsSL "https://go.dev/dl/go${GO_VERSION}.linux-amd64.tar.gz" | sudo tar -C /usr/local -xz
+echo 'export PATH=$PATH:/usr/local/go/bin' >> ~/.bashrc
+source ~/.bashrc
+echo "✅ Go setup complete!"
+""",
+    'Java': """#!/bin/bash
+echo "☕ Setting up Java environment..."
+apt_update_once
+sudo apt install -y openjdk-17-jdk maven gradle
+echo "✅ Java setup complete!"
+""",
+    'C/C++': """#!/bin/bash
+echo "⚙️ Setting up C/C++ environment..."
+apt_update_once
+sudo apt install -y build-essential gdb cmake clang-format
+echo "✅ C/C++ setup complete!"
+""",
+    'PHP': """#!/bin/bash
+echo "🐘 Setting up PHP environment..."
+apt_update_once
+sudo apt install -y php php-cli php-mbstring php-xml php-curl composer
+echo "✅ PHP setup complete!"
+""",
+    'Ruby': """#!/bin/bash
+echo "💎 Setting up Ruby environment..."
+apt_update_once
+sudo apt install -y ruby ruby-dev bundler
+gem install rails
+echo "✅ Ruby setup complete!"
+""",
+}
+
 class CodespacesManager:
     """Main application class"""
 
@@ -161,6 +845,12 @@ class CodespacesManager:
         self.config = self.load_config()
         self.logger = Logger(LOGS_DIR / f"session_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log")
         self.github = GitHubManager(self.logger)
+        self._repo_cache = {'ts': 0.0, 'data': None}
+        self._codespace_cache = {'ts': 0.0, 'data': None}
+        # Target codespace remembered while inside the environment setup menu
+        self._pin_codespace = False
+        self._session_codespace: Optional[Dict] = None
+        self._has = {tool: shutil.which(tool) is not None for tool in TOOLS}
 
         # Initialize advanced features if available
         if ADVANCED_FEATURES_AVAILABLE:
@@ -172,6 +862,14 @@ class CodespacesManager:
             self.system_monitor = None
             self.bootstrapper = None
 
+    def require_tool(self, tool: str) -> bool:
+        """Tell the user when a required tool is missing instead of failing in a subprocess"""
+        if self._has.get(tool, True):
+            return True
+        print(f"{Colors.RED}✗ '{tool}' is not installed or not on PATH.{Colors.RESET}")
+        self.pause()
+        return False
+
     def load_config(self) -> Config:
         """Load configuration from file or create default"""
         if CONFIG_FILE.exists():
@@ -202,6 +900,17 @@ class CodespacesManager:
         print("╚════════════════════════════════════════════════════════════════╝")
         print(f"{Colors.RESET}")
 
+    def pause(self, prompt: str = "Press Enter to continue...", prefetch=None):
+        """Wait for Enter unless running non-interactively, running prefetch in the background meanwhile"""
+        if self.config.auto_confirm:
+            return
+        if prefetch is None:
+            input(prompt)
+            return
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            executor.submit(prefetch)
+            input(prompt)
+
     def confirm_action(self, message: str, default: bool = False) -> bool:
         """Ask for user confirmation"""
         if self.config.auto_confirm:
@@ -217,36 +926,25 @@ class CodespacesManager:
     def get_input(self, prompt: str, default: str = "", required: bool = True) -> str:
         """Get user input with default value"""
         display_default = f" [{default}]" if default else ""
-        value = input(f"{Colors.BLUE}? {prompt}{display_default}: {Colors.RESET}").strip()
+        prompt_text = f"{Colors.BLUE}? {prompt}{display_default}: {Colors.RESET}"
 
-        if not value and default:
-            return default
-        elif not value and required:
+        while True:
+            value = input(prompt_text).strip()
+
+            if value:
+                return value
+            if default:
+                return default
+            if not required:
+                return ""
             print(f"{Colors.RED}This field is required.{Colors.RESET}")
-            return self.get_input(prompt, default, required)
-
-        return value
 
     def show_main_menu(self):
         """Display the main menu"""
         self.clear_screen()
         self.print_header()
 
-        print(f"{Colors.BOLD}Main Menu:{Colors.RESET}")
-        print(f" {Colors.CYAN} 1.{Colors.RESET} Environment & Diagnostics")
-        print(f" {Colors.CYAN} 2.{Colors.RESET} GitHub Auth & SSH")
-        print(f" {Colors.CYAN} 3.{Colors.RESET} Repository Operations")
-        print(f" {Colors.CYAN} 4.{Colors.RESET} Branch/PR/Issue Operations")
-        print(f" {Colors.CYAN} 5.{Colors.RESET} Releases & Tags")
-        print(f" {Colors.CYAN} 6.{Colors.RESET} Secrets/Actions/Policies")
-        print(f" {Colors.CYAN} 7.{Colors.RESET} Codespaces Lifecycle")
-        print(f" {Colors.CYAN} 8.{Colors.RESET} Codespaces Metrics & Costs")
-        print(f" {Colors.CYAN} 9.{Colors.RESET} Cleanup & Cache GC")
-        print(f" {Colors.CYAN}10.{Colors.RESET} Settings & Profiles")
-        print(f" {Colors.CYAN}11.{Colors.RESET} Quick Start Wizard")
-        print(f" {Colors.CYAN}12.{Colors.RESET} Uninstall")
-        print(f" {Colors.CYAN} 0.{Colors.RESET} Exit")
-        print()
+        print(MAIN_MENU_TEXT)
 
     def handle_menu_choice(self, choice: str):
         """Handle main menu selection"""
@@ -272,10 +970,10 @@ class CodespacesManager:
                 handler()
             except KeyboardInterrupt:
                 print(f"\n{Colors.YELLOW}Operation cancelled by user.{Colors.RESET}")
-                input("Press Enter to continue...")
+                self.pause()
         else:
             print(f"{Colors.RED}Invalid choice. Please try again.{Colors.RESET}")
-            input("Press Enter to continue...")
+            self.pause()
 
     def environment_menu(self):
         """Environment & Diagnostics menu"""
@@ -339,7 +1037,7 @@ class CodespacesManager:
                 for rec in env_info['recommendations']:
                     print(f"- {rec}")
 
-        input("\nPress Enter to continue...")
+        self.pause("\nPress Enter to continue...")
 
     def auth_ssh_menu(self):
         """GitHub Auth & SSH menu"""
@@ -361,7 +1059,7 @@ class CodespacesManager:
             if choice == '1':
                 print(f"\n{Colors.GREEN}GitHub CLI Status:{Colors.RESET}")
                 print(self.github.get_auth_status())
-                input("\nPress Enter to continue...")
+                self.pause("\nPress Enter to continue...")
             elif choice == '2':
                 self.github_login()
             elif choice == '3':
@@ -458,12 +1156,12 @@ class CodespacesManager:
     def releases_menu(self):
         """Releases & Tags menu"""
         print(f"{Colors.YELLOW}Releases & Tags menu - Coming soon!{Colors.RESET}")
-        input("Press Enter to continue...")
+        self.pause()
 
     def secrets_menu(self):
         """Secrets/Actions/Policies menu"""
         print(f"{Colors.YELLOW}Secrets/Actions/Policies menu - Coming soon!{Colors.RESET}")
-        input("Press Enter to continue...")
+        self.pause()
 
     def codespaces_lifecycle_menu(self):
         """Codespaces Lifecycle menu"""
@@ -512,7 +1210,7 @@ class CodespacesManager:
 
         if not self.codespaces_advanced:
             print(f"{Colors.YELLOW}Advanced features not available. Install missing dependencies.{Colors.RESET}")
-            input("Press Enter to continue...")
+            self.pause()
             return
 
         try:
@@ -521,7 +1219,7 @@ class CodespacesManager:
 
             if 'error' in metrics:
                 print(f"{Colors.RED}Error getting metrics: {metrics['error']}{Colors.RESET}")
-                input("Press Enter to continue...")
+                self.pause()
                 return
 
             print(f"{Colors.GREEN}Codespace Summary:{Colors.RESET}")
@@ -533,24 +1231,24 @@ class CodespacesManager:
 
             if metrics.get('codespaces'):
                 print(f"{Colors.GREEN}Individual Codespace Details:{Colors.RESET}")
+                chunks = []
                 for cs in metrics['codespaces']:
-                    print(f"\n{Colors.CYAN}Name:{Colors.RESET} {cs.get('name', 'Unknown')}")
-                    print(f"Repository: {cs.get('repository', 'Unknown')}")
-                    print(f"State: {cs.get('state', 'Unknown')}")
-                    print(f"Machine: {cs.get('machine_type', 'Unknown')}")
+                    chunks.append(CS_METRICS_ROW.format_map(cs))
 
                     if cs.get('uptime_hours'):
-                        print(f"Uptime: {cs['uptime_hours']} hours")
+                        chunks.append(f"Uptime: {cs['uptime_hours']} hours\n")
 
                     if cs.get('estimated_cost_per_hour'):
-                        print(f"Cost/Hour: ${cs['estimated_cost_per_hour']:.2f}")
+                        chunks.append(f"Cost/Hour: ${cs['estimated_cost_per_hour']:.2f}\n")
 
                     if cs.get('estimated_total_cost'):
-                        print(f"Estimated Total Cost: ${cs['estimated_total_cost']:.2f}")
+                        chunks.append(f"Estimated Total Cost: ${cs['estimated_total_cost']:.2f}\n")
 
                     if cs.get('storage_used_mb'):
                         quota = cs.get('storage_quota_mb', 'Unknown')
-                        print(f"Storage: {cs['storage_used_mb']} MB / {quota} MB")
+                        chunks.append(f"Storage: {cs['storage_used_mb']} MB / {quota} MB\n")
+
+                sys.stdout.write("".join(chunks))
 
             else:
                 print(f"{Colors.YELLOW}No codespaces found.{Colors.RESET}")
@@ -559,7 +1257,7 @@ class CodespacesManager:
             print(f"{Colors.RED}Error retrieving metrics: {e}{Colors.RESET}")
             self.logger.error(f"Error in codespaces metrics: {e}")
 
-        input("\nPress Enter to continue...")
+        self.pause("\nPress Enter to continue...")
 
     def cleanup_menu(self):
         """Cleanup & Cache GC menu"""
@@ -568,7 +1266,7 @@ class CodespacesManager:
 
         if not self.system_monitor:
             print(f"{Colors.YELLOW}Advanced cleanup features not available.{Colors.RESET}")
-            input("Press Enter to continue...")
+            self.pause()
             return
 
         while True:
@@ -628,7 +1326,7 @@ class CodespacesManager:
         except Exception as e:
             print(f"{Colors.RED}Error analyzing caches: {e}{Colors.RESET}")
 
-        input("\nPress Enter to continue...")
+        self.pause("\nPress Enter to continue...")
 
     def clean_dev_caches(self):
         """Clean development tool caches"""
@@ -653,12 +1351,12 @@ class CodespacesManager:
                         selected_caches.append(available_caches[idx])
             except ValueError:
                 print(f"{Colors.RED}Invalid selection format.{Colors.RESET}")
-                input("Press Enter to continue...")
+                self.pause()
                 return
 
         if not selected_caches:
             print(f"{Colors.YELLOW}No caches selected.{Colors.RESET}")
-            input("Press Enter to continue...")
+            self.pause()
             return
 
         if self.confirm_action(f"Clean {', '.join(selected_caches)} caches?"):
@@ -677,7 +1375,7 @@ class CodespacesManager:
             except Exception as e:
                 print(f"{Colors.RED}Error during cleanup: {e}{Colors.RESET}")
 
-        input("Press Enter to continue...")
+        self.pause()
 
     def clean_old_repos(self):
         """Clean old repository clones"""
@@ -709,7 +1407,7 @@ class CodespacesManager:
             except Exception as e:
                 print(f"{Colors.RED}Error during cleanup: {e}{Colors.RESET}")
 
-        input("Press Enter to continue...")
+        self.pause()
 
     def full_system_cleanup(self):
         """Perform comprehensive system cleanup"""
@@ -740,7 +1438,7 @@ class CodespacesManager:
             except Exception as e:
                 print(f"{Colors.RED}Error during full cleanup: {e}{Colors.RESET}")
 
-        input("Press Enter to continue...")
+        self.pause()
 
     def show_cleanup_recommendations(self):
         """Show cleanup recommendations based on system analysis"""
@@ -780,7 +1478,7 @@ class CodespacesManager:
         except Exception as e:
             print(f"{Colors.RED}Error generating recommendations: {e}{Colors.RESET}")
 
-        input("Press Enter to continue...")
+        self.pause()
 
     def settings_menu(self):
         """Settings & Profiles menu"""
@@ -799,7 +1497,7 @@ class CodespacesManager:
         if self.confirm_action("Update settings?"):
             self.update_settings()
 
-        input("Press Enter to continue...")
+        self.pause()
 
     def update_settings(self):
         """Update configuration settings"""
@@ -821,16 +1519,21 @@ class CodespacesManager:
     # GitHub CLI operations
     def github_login(self):
         """Login to GitHub"""
+        if not self.require_tool('gh'):
+            return
         print(f"\n{Colors.GREEN}Starting GitHub login...{Colors.RESET}")
         try:
             subprocess.run(['gh', 'auth', 'login', '--web'], check=True)
             self.logger.info("GitHub authentication successful")
         except subprocess.CalledProcessError:
             self.logger.error("GitHub authentication failed")
-        input("Press Enter to continue...")
+        self.github.invalidate_auth()
+        self.pause()
 
     def generate_ssh_key(self):
         """Generate SSH key"""
+        if not self.require_tool('ssh-keygen'):
+            return
         email = self.get_input("Enter your email address")
         key_name = self.get_input("SSH key name", "id_ed25519_github")
 
@@ -849,8 +1552,7 @@ class CodespacesManager:
             print(f"Public key: {key_path}.pub")
 
             # Display public key
-            with open(f"{key_path}.pub") as f:
-                pubkey = f.read().strip()
+            pubkey = Path(f"{key_path}.pub").read_text().strip()
             print(f"\n{Colors.CYAN}Public key content:{Colors.RESET}")
             print(pubkey)
 
@@ -859,31 +1561,32 @@ class CodespacesManager:
         except subprocess.CalledProcessError as e:
             self.logger.error(f"SSH key generation failed: {e}")
 
-        input("\nPress Enter to continue...")
+        self.pause("\nPress Enter to continue...")
 
     def add_ssh_key_to_github(self):
         """Add SSH key to GitHub"""
         ssh_dir = Path.home() / ".ssh"
-        key_files = list(ssh_dir.glob("*.pub"))
+        try:
+            with os.scandir(ssh_dir) as entries:
+                key_files = [entry.name for entry in entries if entry.name.endswith('.pub') and entry.is_file()]
+        except FileNotFoundError:
+            key_files = []
 
         if not key_files:
             print(f"{Colors.RED}No SSH public keys found in ~/.ssh/{Colors.RESET}")
-            input("Press Enter to continue...")
+            self.pause()
             return
 
-        print("Available SSH keys:")
-        for i, key_file in enumerate(key_files, 1):
-            print(f"{i}. {key_file.name}")
+        print("Available SSH keys:\n" + "\n".join(f"{i}. {key_file}" for i, key_file in enumerate(key_files, 1)))
 
         try:
             choice = int(input(f"\n{Colors.BLUE}Select key to add (1-{len(key_files)}): {Colors.RESET}")) - 1
-            selected_key = key_files[choice]
+            selected_key = ssh_dir / key_files[choice]
 
-            title = self.get_input("Key title", f"Termux-{platform.node()}")
+            title = self.get_input("Key title", f"Termux-{HOSTNAME}")
 
-            success, output = self.github.run_gh_command([
-                'ssh-key', 'add', str(selected_key), '--title', title
-            ])
+            pubkey = selected_key.read_text().strip()
+            success, output = self.github.session.request('POST', '/user/keys', {'title': title, 'key': pubkey})
 
             if success:
                 print(f"\n{Colors.GREEN}SSH key added successfully!{Colors.RESET}")
@@ -897,16 +1600,19 @@ class CodespacesManager:
         except Exception as e:
             self.logger.error(f"Error adding SSH key: {e}")
 
-        input("Press Enter to continue...")
+        self.pause()
 
     def test_ssh_connectivity(self):
         """Test SSH connectivity to GitHub"""
+        if not self.require_tool('ssh'):
+            return
         print(f"\n{Colors.GREEN}Testing SSH connectivity to GitHub...{Colors.RESET}")
 
         try:
+            # Only stderr carries the greeting, so don't buffer stdout at all
             result = subprocess.run([
                 'ssh', '-T', 'git@github.com'
-            ], capture_output=True, text=True, timeout=10)
+            ], stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, timeout=10)
 
             if "successfully authenticated" in result.stderr:
                 print(f"{Colors.GREEN}✓ SSH connection successful!{Colors.RESET}")
@@ -914,7 +1620,6 @@ class CodespacesManager:
                 self.logger.info("SSH connectivity test passed")
             else:
                 print(f"{Colors.RED}✗ SSH connection failed{Colors.RESET}")
-                print(f"stdout: {result.stdout}")
                 print(f"stderr: {result.stderr}")
                 self.logger.error("SSH connectivity test failed")
 
@@ -925,13 +1630,13 @@ class CodespacesManager:
             print(f"{Colors.RED}✗ SSH test error: {e}{Colors.RESET}")
             self.logger.error(f"SSH test error: {e}")
 
-        input("Press Enter to continue...")
+        self.pause()
 
     def bootstrap_environment(self):
         """Bootstrap development environment"""
         if not self.bootstrapper:
             print(f"{Colors.YELLOW}Environment bootstrapper not available.{Colors.RESET}")
-            input("Press Enter to continue...")
+            self.pause()
             return
 
         self.clear_screen()
@@ -940,18 +1645,21 @@ class CodespacesManager:
         # First, detect current environment
         env_info = self.bootstrapper.detect_environment()
 
-        print(f"{Colors.GREEN}Environment Detection:{Colors.RESET}")
-        print(f"Platform: {env_info.get('platform', 'unknown')}")
-        print(f"Termux: {'Yes' if env_info.get('is_termux') else 'No'}")
-        print(f"Root access: {'Yes' if env_info.get('is_root') else 'No'}")
-        print(f"Available tools: {len(env_info.get('available_tools', {}))}")
-        print(f"Missing tools: {', '.join(env_info.get('missing_tools', []))}")
-        print()
-
         if env_info.get('missing_tools'):
-            print(f"{Colors.YELLOW}Missing tools detected. Bootstrap is recommended.{Colors.RESET}")
+            verdict = f"{Colors.YELLOW}Missing tools detected. Bootstrap is recommended.{Colors.RESET}"
         else:
-            print(f"{Colors.GREEN}All essential tools are available!{Colors.RESET}")
+            verdict = f"{Colors.GREEN}All essential tools are available!{Colors.RESET}"
+
+        print("\n".join([
+            f"{Colors.GREEN}Environment Detection:{Colors.RESET}",
+            f"Platform: {env_info.get('platform', 'unknown')}",
+            f"Termux: {'Yes' if env_info.get('is_termux') else 'No'}",
+            f"Root access: {'Yes' if env_info.get('is_root') else 'No'}",
+            f"Available tools: {len(env_info.get('available_tools', {}))}",
+            f"Missing tools: {', '.join(env_info.get('missing_tools', []))}",
+            "",
+            verdict,
+        ]))
 
         print()
         print("Bootstrap options:")
@@ -971,7 +1679,7 @@ class CodespacesManager:
             self.custom_language_setup()
         elif choice != '0':
             print(f"{Colors.RED}Invalid choice.{Colors.RESET}")
-            input("Press Enter to continue...")
+            self.pause()
 
     def quick_bootstrap(self):
         """Perform quick bootstrap with essential tools"""
@@ -984,20 +1692,22 @@ class CodespacesManager:
             try:
                 results = self.bootstrapper.bootstrap_termux_environment(install_extras=False)
 
-                print(f"\n{Colors.GREEN}Bootstrap Results:{Colors.RESET}")
-                print(f"Steps completed: {len(results.get('steps_completed', []))}")
-                print(f"Steps failed: {len(results.get('steps_failed', []))}")
-                print(f"Total time: {results.get('total_time_seconds', 0)} seconds")
+                lines = [
+                    f"\n{Colors.GREEN}Bootstrap Results:{Colors.RESET}",
+                    f"Steps completed: {len(results.get('steps_completed', []))}",
+                    f"Steps failed: {len(results.get('steps_failed', []))}",
+                    f"Total time: {results.get('total_time_seconds', 0)} seconds",
+                ]
 
                 if results.get('steps_completed'):
-                    print(f"\n{Colors.GREEN}Completed steps:{Colors.RESET}")
-                    for step in results['steps_completed'][-10:]:  # Show last 10
-                        print(f"✓ {step}")
+                    lines.append(f"\n{Colors.GREEN}Completed steps:{Colors.RESET}")
+                    lines += [f"✓ {step}" for step in results['steps_completed'][-10:]]  # Show last 10
 
                 if results.get('steps_failed'):
-                    print(f"\n{Colors.RED}Failed steps:{Colors.RESET}")
-                    for step in results['steps_failed']:
-                        print(f"✗ {step}")
+                    lines.append(f"\n{Colors.RED}Failed steps:{Colors.RESET}")
+                    lines += [f"✗ {step}" for step in results['steps_failed']]
+
+                _emit(lines)
 
                 if not results.get('steps_failed'):
                     print(f"\n{Colors.GREEN}Bootstrap completed successfully!{Colors.RESET}")
@@ -1010,7 +1720,7 @@ class CodespacesManager:
                 print(f"\n{Colors.RED}Bootstrap failed: {e}{Colors.RESET}")
                 self.logger.error(f"Quick bootstrap failed: {e}")
 
-        input("Press Enter to continue...")
+        self.pause()
 
     def full_bootstrap(self):
         """Perform full bootstrap with optional tools"""
@@ -1034,21 +1744,23 @@ class CodespacesManager:
                 print(f"\n{Colors.GREEN}Setting up development environments...{Colors.RESET}")
                 dev_results = self.bootstrapper.setup_development_environment(['python', 'node', 'rust'])
 
-                print(f"\n{Colors.GREEN}Bootstrap Results:{Colors.RESET}")
-                print(f"System steps completed: {len(results.get('steps_completed', []))}")
-                print(f"System steps failed: {len(results.get('steps_failed', []))}")
-                print(f"Languages configured: {len(dev_results.get('languages_configured', []))}")
-                print(f"Total time: {results.get('total_time_seconds', 0)} seconds")
+                lines = [
+                    f"\n{Colors.GREEN}Bootstrap Results:{Colors.RESET}",
+                    f"System steps completed: {len(results.get('steps_completed', []))}",
+                    f"System steps failed: {len(results.get('steps_failed', []))}",
+                    f"Languages configured: {len(dev_results.get('languages_configured', []))}",
+                    f"Total time: {results.get('total_time_seconds', 0)} seconds",
+                ]
 
                 if results.get('steps_completed'):
-                    print(f"\n{Colors.GREEN}System setup completed:{Colors.RESET}")
-                    for step in results['steps_completed'][-5:]:  # Show last 5
-                        print(f"✓ {step}")
+                    lines.append(f"\n{Colors.GREEN}System setup completed:{Colors.RESET}")
+                    lines += [f"✓ {step}" for step in results['steps_completed'][-5:]]  # Show last 5
 
                 if dev_results.get('languages_configured'):
-                    print(f"\n{Colors.GREEN}Development environments:{Colors.RESET}")
-                    for lang in dev_results['languages_configured']:
-                        print(f"✓ {lang}")
+                    lines.append(f"\n{Colors.GREEN}Development environments:{Colors.RESET}")
+                    lines += [f"✓ {lang}" for lang in dev_results['languages_configured']]
+
+                _emit(lines)
 
                 if results.get('steps_failed') or dev_results.get('configuration_errors'):
                     print(f"\n{Colors.YELLOW}Some issues encountered - check logs for details.{Colors.RESET}")
@@ -1060,7 +1772,7 @@ class CodespacesManager:
                 print(f"\n{Colors.RED}Bootstrap failed: {e}{Colors.RESET}")
                 self.logger.error(f"Full bootstrap failed: {e}")
 
-        input("Press Enter to continue...")
+        self.pause()
 
     def custom_language_setup(self):
         """Setup specific development languages"""
@@ -1085,27 +1797,26 @@ class CodespacesManager:
                         selected_languages.append(languages[idx])
             except ValueError:
                 print(f"{Colors.RED}Invalid selection format.{Colors.RESET}")
-                input("Press Enter to continue...")
+                self.pause()
                 return
 
         if not selected_languages:
             print(f"{Colors.YELLOW}No languages selected.{Colors.RESET}")
-            input("Press Enter to continue...")
+            self.pause()
             return
 
         if self.confirm_action(f"Configure {', '.join(selected_languages)}?"):
             try:
                 results = self.bootstrapper.setup_development_environment(selected_languages)
 
-                print(f"\n{Colors.GREEN}Configuration Results:{Colors.RESET}")
-                if results.get('languages_configured'):
-                    for lang in results['languages_configured']:
-                        print(f"✓ {lang}")
+                lines = [f"\n{Colors.GREEN}Configuration Results:{Colors.RESET}"]
+                lines += [f"✓ {lang}" for lang in results.get('languages_configured', [])]
 
                 if results.get('configuration_errors'):
-                    print(f"\n{Colors.RED}Errors:{Colors.RESET}")
-                    for error in results['configuration_errors']:
-                        print(f"✗ {error}")
+                    lines.append(f"\n{Colors.RED}Errors:{Colors.RESET}")
+                    lines += [f"✗ {error}" for error in results['configuration_errors']]
+
+                _emit(lines)
 
                 if not results.get('configuration_errors'):
                     print(f"\n{Colors.GREEN}Language setup completed successfully!{Colors.RESET}")
@@ -1113,61 +1824,88 @@ class CodespacesManager:
             except Exception as e:
                 print(f"\n{Colors.RED}Language setup failed: {e}{Colors.RESET}")
 
-        input("Press Enter to continue...")
+        self.pause()
 
-    def get_repository_selection(self, operation_name="Select repository"):
-        """Get repository selection from numbered list"""
-        print(f"\n{Colors.GREEN}{operation_name}{Colors.RESET}")
+    def fetch_repositories(self, refresh: bool = False) -> Optional[List[Dict]]:
+        """Return the repository list, reusing a recent fetch unless refresh is set"""
+        cache = self._repo_cache
+        if not refresh and cache['data'] is not None and time.time() - cache['ts'] < REPO_CACHE_TTL:
+            return cache['data']
 
-        # Get repository list
         success, output = self.github.run_gh_command(['repo', 'list', '--limit', '50', '--json', 'name,owner'])
 
         if not success:
             print(f"{Colors.RED}✗ Failed to fetch repositories: {output}{Colors.RESET}")
-            input("Press Enter to continue...")
+            return None
+
+        body = output.lstrip()
+        if body and not body.startswith(('[', '{')):
+            # Not JSON at all (e.g. an HTML error page); don't bother parsing
+            print(f"{Colors.RED}✗ Failed to parse repository list{Colors.RESET}")
             return None
 
         try:
-            import json
-            repos = json.loads(output) if output.strip() else []
+            repos = json_loads(body) if body else []
+        except ValueError:
+            print(f"{Colors.RED}✗ Failed to parse repository list{Colors.RESET}")
+            return None
+
+        # Resolve owner/name once so pickers don't re-derive it per row
+        for repo in repos:
+            owner = repo.get('owner', 'Unknown')
+            if isinstance(owner, dict):
+                owner = owner.get('login', 'Unknown')
+            repo['full_name'] = f"{owner}/{repo.get('name', 'Unknown')}"
+
+        cache['ts'] = time.time()
+        cache['data'] = repos
+        return repos
+
+    def invalidate_repo_cache(self):
+        """Drop the cached repository list after a change to the user's repositories"""
+        self._repo_cache['data'] = None
+
+    def get_repository_selection(self, operation_name="Select repository"):
+        """Get repository selection from numbered list"""
+        print(f"\n{Colors.GREEN}{operation_name}{Colors.RESET}")
+
+        refresh = False
+        while True:
+            repos = self.fetch_repositories(refresh)
+
+            if repos is None:
+                self.pause()
+                return None
 
             if not repos:
                 print(f"{Colors.YELLOW}No repositories found.{Colors.RESET}")
-                input("Press Enter to continue...")
+                self.pause()
                 return None
 
             print(f"\n{Colors.CYAN}Available repositories:{Colors.RESET}")
             for i, repo in enumerate(repos, 1):
-                owner = repo.get('owner', {}).get('login', 'Unknown') if isinstance(repo.get('owner'), dict) else repo.get('owner', 'Unknown')
-                name = repo.get('name', 'Unknown')
-                print(f"{i}. {owner}/{name}")
+                print(f"{i}. {repo['full_name']}")
 
+            print("r. Refresh list")
             print("0. Cancel")
             print()
 
+            valid = frozenset(str(i) for i in range(1, len(repos) + 1))
             while True:
-                try:
-                    choice = input(f"{Colors.BLUE}Choose repository (1-{len(repos)}): {Colors.RESET}").strip()
-
-                    if choice == '0':
-                        return None
-
-                    idx = int(choice) - 1
-                    if 0 <= idx < len(repos):
-                        selected_repo = repos[idx]
-                        owner = selected_repo.get('owner', {}).get('login', 'Unknown') if isinstance(selected_repo.get('owner'), dict) else selected_repo.get('owner', 'Unknown')
-                        name = selected_repo.get('name', 'Unknown')
-                        return f"{owner}/{name}"
-                    else:
-                        print(f"{Colors.RED}Invalid choice. Please enter 1-{len(repos)} or 0 to cancel.{Colors.RESET}")
+                choice = input(f"{Colors.BLUE}Choose repository (1-{len(repos)}): {Colors.RESET}").strip()
 
-                except ValueError:
-                    print(f"{Colors.RED}Invalid input. Please enter a number.{Colors.RESET}")
+                if choice == '0':
+                    return None
 
-        except json.JSONDecodeError:
-            print(f"{Colors.RED}✗ Failed to parse repository list{Colors.RESET}")
-            input("Press Enter to continue...")
-            return None
+                if choice.lower() == 'r':
+                    refresh = True
+                    break
+
+                if choice not in valid:
+                    print(f"{Colors.RED}Invalid choice. Please enter 1-{len(repos)}, r to refresh or 0 to cancel.{Colors.RESET}")
+                    continue
+
+                return repos[int(choice) - 1]['full_name']
 
     # Repository operations
     def create_repository(self):
@@ -1198,26 +1936,25 @@ class CodespacesManager:
             print(f"\n{Colors.GREEN}✓ Repository created successfully!{Colors.RESET}")
             print(output)
             self.logger.info(f"Repository created: {repo_name}")
+            self.invalidate_repo_cache()
         else:
             print(f"\n{Colors.RED}✗ Failed to create repository: {output}{Colors.RESET}")
             self.logger.error(f"Failed to create repository: {output}")
 
-        input("Press Enter to continue...")
+        self.pause()
 
     def list_repositories(self):
         """List repositories"""
         limit = self.get_input("Number of repos to show", "20", required=False)
 
         cmd = ['repo', 'list', '--limit', limit or '20']
-        success, output = self.github.run_gh_command(cmd)
+        print(f"\n{Colors.GREEN}Your repositories:{Colors.RESET}")
+        success, output = self.github.run_gh_stream(cmd)
 
-        if success:
-            print(f"\n{Colors.GREEN}Your repositories:{Colors.RESET}")
-            print(output)
-        else:
+        if not success:
             print(f"\n{Colors.RED}Failed to list repositories: {output}{Colors.RESET}")
 
-        input("Press Enter to continue...")
+        self.pause()
 
     def clone_repository(self):
         """Clone a repository"""
@@ -1226,7 +1963,7 @@ class CodespacesManager:
         if not repo:
             return
 
-        success, output = self.github.run_gh_command(['repo', 'clone', repo])
+        success, output = self.github.run_gh_command(['repo', 'clone', repo], timeout=None)
 
         if success:
             print(f"\n{Colors.GREEN}✓ Repository cloned successfully!{Colors.RESET}")
@@ -1235,7 +1972,7 @@ class CodespacesManager:
             print(f"\n{Colors.RED}✗ Failed to clone repository: {output}{Colors.RESET}")
             self.logger.error(f"Failed to clone repository: {output}")
 
-        input("Press Enter to continue...")
+        self.pause()
 
     def fork_repository(self):
         """Fork a repository"""
@@ -1250,11 +1987,12 @@ class CodespacesManager:
             print(f"\n{Colors.GREEN}✓ Repository forked successfully!{Colors.RESET}")
             print(output)
             self.logger.info(f"Repository forked: {repo}")
+            self.invalidate_repo_cache()
         else:
             print(f"\n{Colors.RED}✗ Failed to fork repository: {output}{Colors.RESET}")
             self.logger.error(f"Failed to fork repository: {output}")
 
-        input("Press Enter to continue...")
+        self.pause()
 
     def delete_repository(self):
         """Delete a repository"""
@@ -1274,7 +2012,8 @@ class CodespacesManager:
 
                 if self.confirm_action("Attempt to refresh GitHub CLI permissions now?"):
                     print(f"{Colors.CYAN}Refreshing GitHub CLI permissions...{Colors.RESET}")
-                    auth_success, auth_output = self.github.run_gh_command(['auth', 'refresh', '-h', 'github.com', '-s', 'delete_repo'])
+                    auth_success, auth_output = self.github.run_gh_command(
+                        ['auth', 'refresh', '-h', 'github.com', '-s', 'delete_repo'], timeout=None)
 
                     if auth_success:
                         print(f"{Colors.GREEN}✓ Permissions refreshed. Attempting deletion again...{Colors.RESET}")
@@ -1285,11 +2024,12 @@ class CodespacesManager:
             if success:
                 print(f"\n{Colors.GREEN}✓ Repository deleted successfully!{Colors.RESET}")
                 self.logger.info(f"Repository deleted: {repo}")
+                self.invalidate_repo_cache()
             else:
                 print(f"\n{Colors.RED}✗ Failed to delete repository: {output}{Colors.RESET}")
                 self.logger.error(f"Failed to delete repository: {output}")
 
-        input("Press Enter to continue...")
+        self.pause()
 
     def archive_repository(self):
         """Archive a repository"""
@@ -1298,7 +2038,8 @@ class CodespacesManager:
         if not repo:
             return
 
-        success, output = self.github.run_gh_command(['repo', 'archive', repo])
+        success, output = self.github.session.request('PATCH', f"/repos/{urllib.parse.quote(repo)}",
+                                                      {'archived': True})
 
         if success:
             print(f"\n{Colors.GREEN}✓ Repository archived successfully!{Colors.RESET}")
@@ -1307,7 +2048,7 @@ class CodespacesManager:
             print(f"\n{Colors.RED}✗ Failed to archive repository: {output}{Colors.RESET}")
             self.logger.error(f"Failed to archive repository: {output}")
 
-        input("Press Enter to continue...")
+        self.pause()
 
     def transfer_repository(self):
         """Transfer repository to another owner"""
@@ -1319,57 +2060,93 @@ class CodespacesManager:
         new_owner = self.get_input("New owner username/organization")
 
         if self.confirm_action(f"Transfer repository '{repo}' to '{new_owner}'?"):
-            success, output = self.github.run_gh_command(['repo', 'transfer', repo, new_owner])
+            success, output = self.github.session.request('POST', f"/repos/{urllib.parse.quote(repo)}/transfer",
+                                                          {'new_owner': new_owner})
 
             if success:
                 print(f"\n{Colors.GREEN}✓ Repository transfer initiated successfully!{Colors.RESET}")
                 self.logger.info(f"Repository transferred: {repo} to {new_owner}")
+                self.invalidate_repo_cache()
             else:
                 print(f"\n{Colors.RED}✗ Failed to transfer repository: {output}{Colors.RESET}")
                 self.logger.error(f"Failed to transfer repository: {output}")
 
-        input("Press Enter to continue...")
+        self.pause()
 
     # Branch operations
+    def open_git_repo(self):
+        """Open the git repository containing the current directory with pygit2, if available"""
+        if not PYGIT2_AVAILABLE:
+            return None
+        path = pygit2.discover_repository(os.getcwd())
+        return pygit2.Repository(path) if path else None
+
     def create_branch(self):
         """Create a new branch"""
+        if not PYGIT2_AVAILABLE and not self.require_tool('git'):
+            return
         branch_name = self.get_input("Branch name")
 
         try:
-            subprocess.run(['git', 'checkout', '-b', branch_name], check=True)
+            repo = self.open_git_repo()
+            if repo is not None:
+                branch = repo.branches.local.create(branch_name, repo.head.peel(pygit2.Commit))
+                repo.checkout(branch)
+            else:
+                subprocess.run(['git', 'checkout', '-b', branch_name], check=True)
             print(f"\n{Colors.GREEN}✓ Branch '{branch_name}' created and checked out{Colors.RESET}")
             self.logger.info(f"Branch created: {branch_name}")
-        except subprocess.CalledProcessError as e:
+        except GIT_ERRORS as e:
             print(f"\n{Colors.RED}✗ Failed to create branch: {e}{Colors.RESET}")
             self.logger.error(f"Failed to create branch: {e}")
 
-        input("Press Enter to continue...")
+        self.pause()
 
     def list_branches(self):
         """List branches"""
+        if not PYGIT2_AVAILABLE and not self.require_tool('git'):
+            return
         try:
-            result = subprocess.run(['git', 'branch', '-a'], capture_output=True, text=True, check=True)
+            repo = self.open_git_repo()
+            if repo is not None:
+                current = None if repo.head_is_detached else repo.head.shorthand
+                lines = [f"{'*' if name == current else ' '} {name}" for name in repo.branches.local]
+                lines += [f"  remotes/{name}" for name in repo.branches.remote]
+                output = "\n".join(lines)
+            else:
+                output = subprocess.run(['git', 'branch', '-a'], capture_output=True, text=True, check=True).stdout
             print(f"\n{Colors.GREEN}Branches:{Colors.RESET}")
-            print(result.stdout)
-        except subprocess.CalledProcessError as e:
+            print(output)
+        except GIT_ERRORS as e:
             print(f"\n{Colors.RED}✗ Failed to list branches: {e}{Colors.RESET}")
 
-        input("Press Enter to continue...")
+        self.pause()
 
     def delete_branch(self):
         """Delete a branch"""
+        if not PYGIT2_AVAILABLE and not self.require_tool('git'):
+            return
         branch_name = self.get_input("Branch name to delete")
 
         if self.confirm_action(f"Delete branch '{branch_name}'?"):
             try:
-                subprocess.run(['git', 'branch', '-d', branch_name], check=True)
+                repo = self.open_git_repo()
+                if repo is not None:
+                    branch = repo.branches.local[branch_name]
+                    head = repo.head.target
+                    # Match 'git branch -d': refuse to drop commits not merged into HEAD
+                    if branch.target != head and not repo.descendant_of(head, branch.target):
+                        raise ValueError(f"branch '{branch_name}' is not fully merged")
+                    branch.delete()
+                else:
+                    subprocess.run(['git', 'branch', '-d', branch_name], check=True)
                 print(f"\n{Colors.GREEN}✓ Branch '{branch_name}' deleted{Colors.RESET}")
                 self.logger.info(f"Branch deleted: {branch_name}")
-            except subprocess.CalledProcessError as e:
+            except GIT_ERRORS as e:
                 print(f"\n{Colors.RED}✗ Failed to delete branch: {e}{Colors.RESET}")
                 self.logger.error(f"Failed to delete branch: {e}")
 
-        input("Press Enter to continue...")
+        self.pause()
 
     # Pull Request operations
     def create_pull_request(self):
@@ -1391,19 +2168,17 @@ class CodespacesManager:
             print(f"\n{Colors.RED}✗ Failed to create pull request: {output}{Colors.RESET}")
             self.logger.error(f"Failed to create pull request: {output}")
 
-        input("Press Enter to continue...")
+        self.pause()
 
     def list_pull_requests(self):
         """List pull requests"""
-        success, output = self.github.run_gh_command(['pr', 'list'])
+        print(f"\n{Colors.GREEN}Pull requests:{Colors.RESET}")
+        success, output = self.github.run_gh_stream(['pr', 'list'])
 
-        if success:
-            print(f"\n{Colors.GREEN}Pull requests:{Colors.RESET}")
-            print(output)
-        else:
+        if not success:
             print(f"\n{Colors.RED}Failed to list pull requests: {output}{Colors.RESET}")
 
-        input("Press Enter to continue...")
+        self.pause()
 
     def merge_pull_request(self):
         """Merge a pull request"""
@@ -1418,7 +2193,7 @@ class CodespacesManager:
             print(f"\n{Colors.RED}✗ Failed to merge pull request: {output}{Colors.RESET}")
             self.logger.error(f"Failed to merge pull request: {output}")
 
-        input("Press Enter to continue...")
+        self.pause()
 
     # Issue operations
     def create_issue(self):
@@ -1440,67 +2215,77 @@ class CodespacesManager:
             print(f"\n{Colors.RED}✗ Failed to create issue: {output}{Colors.RESET}")
             self.logger.error(f"Failed to create issue: {output}")
 
-        input("Press Enter to continue...")
+        self.pause()
 
     def list_issues(self):
         """List issues"""
-        success, output = self.github.run_gh_command(['issue', 'list'])
+        print(f"\n{Colors.GREEN}Issues:{Colors.RESET}")
+        success, output = self.github.run_gh_stream(['issue', 'list'])
 
-        if success:
-            print(f"\n{Colors.GREEN}Issues:{Colors.RESET}")
-            print(output)
-        else:
+        if not success:
             print(f"\n{Colors.RED}Failed to list issues: {output}{Colors.RESET}")
 
-        input("Press Enter to continue...")
+        self.pause()
 
     # Codespace operations
+    def lookup_repository(self, repo: str) -> Optional[Dict]:
+        """Return name and default branch of owner/name, or None if it is not accessible"""
+        owner, _, name = repo.partition('/')
+        if not owner or not name:
+            return None
+
+        success, data = self.github.session.graphql(REPO_LOOKUP_QUERY, {'owner': owner, 'name': name})
+        if not success:
+            return None
+        return (data or {}).get('repository')
+
     def create_codespace(self):
         """Create a new codespace"""
         print(f"\n{Colors.GREEN}Create New Codespace{Colors.RESET}")
 
-        # Show available repositories
+        # Show available repositories along with their default branches
         print(f"\n{Colors.CYAN}Your available repositories:{Colors.RESET}")
-        success, output = self.github.run_gh_command(['repo', 'list', '--limit', '10'])
-
-        if success and output.strip():
-            repos = []
-            for line in output.strip().split('\n'):
-                if line.strip():
-                    repo_name = line.split('\t')[0]
-                    repos.append(repo_name)
-                    print(f"• {repo_name}")
+        success, output = self.github.run_gh_command([
+            'repo', 'list', '--limit', '10', '--json', 'nameWithOwner,defaultBranchRef'
+        ])
+
+        listed = {}
+        try:
+            for item in (json_loads(output) if success and output.strip() else []):
+                listed[item['nameWithOwner']] = (item.get('defaultBranchRef') or {}).get('name')
+        except (ValueError, KeyError, TypeError):
+            listed = {}
+
+        if listed:
+            for repo_name in listed:
+                print(f"• {repo_name}")
             print()
         else:
             print("Could not fetch repository list")
 
         repo = self.get_input("Repository (owner/name)")
 
-        # Validate repository exists
-        print(f"{Colors.CYAN}Validating repository...{Colors.RESET}")
-        validate_success, validate_output = self.github.run_gh_command(['repo', 'view', repo])
-        if not validate_success:
-            print(f"{Colors.RED}✗ Repository not found or not accessible: {repo}{Colors.RESET}")
-            print(f"Please check the repository name and your permissions.")
-            input("Press Enter to continue...")
-            return
-
-        print(f"{Colors.GREEN}✓ Repository validated{Colors.RESET}")
+        if repo in listed:
+            # Came from the list we just fetched, so it exists and we know its default branch
+            print(f"{Colors.GREEN}✓ Repository validated (from list){Colors.RESET}")
+            branch_ref = {'name': listed[repo]}
+        else:
+            # Validate repository and detect its default branch in one API call
+            print(f"{Colors.CYAN}Validating repository...{Colors.RESET}")
+            repo_info = self.lookup_repository(repo)
+            if not repo_info:
+                print(f"{Colors.RED}✗ Repository not found or not accessible: {repo}{Colors.RESET}")
+                print(f"Please check the repository name and your permissions.")
+                self.pause()
+                return
 
-        # Detect repository's default branch
-        print(f"{Colors.CYAN}Detecting default branch...{Colors.RESET}")
-        branch_success, branch_output = self.github.run_gh_command(['repo', 'view', repo, '--json', 'defaultBranchRef'])
+            print(f"{Colors.GREEN}✓ Repository validated{Colors.RESET}")
+            branch_ref = repo_info.get('defaultBranchRef') or {}
 
         default_branch = self.config.default_branch  # fallback
-        if branch_success and branch_output.strip():
-            try:
-                import json
-                branch_data = json.loads(branch_output)
-                if branch_data.get('defaultBranchRef', {}).get('name'):
-                    default_branch = branch_data['defaultBranchRef']['name']
-                    print(f"{Colors.GREEN}✓ Detected default branch: {default_branch}{Colors.RESET}")
-            except (json.JSONDecodeError, KeyError):
-                print(f"{Colors.YELLOW}⚠ Could not detect default branch, using: {default_branch}{Colors.RESET}")
+        if branch_ref.get('name'):
+            default_branch = branch_ref['name']
+            print(f"{Colors.GREEN}✓ Detected default branch: {default_branch}{Colors.RESET}")
         else:
             print(f"{Colors.YELLOW}⚠ Could not detect default branch, using: {default_branch}{Colors.RESET}")
 
@@ -1508,103 +2293,110 @@ class CodespacesManager:
         machine = self.get_input("Machine type", self.config.default_machine_type, required=False)
         region = self.get_input("Region", self.config.default_region, required=False)
 
-        cmd = ['codespace', 'create', '--repo', repo]
-
-        if branch:
-            cmd.extend(['--branch', branch])
-        if machine:
-            cmd.extend(['--machine', machine])
-        if region:
-            cmd.extend(['--location', region])
-
-        success, output = self.github.run_gh_command(cmd)
+        success, output = self.github.create_codespace(repo, branch, machine, region)
 
         if success:
             print(f"\n{Colors.GREEN}✓ Codespace created successfully!{Colors.RESET}")
-            print(output)
+            print(f"{output.get('name')} ({output.get('state', 'Unknown')})")
             self.logger.info(f"Codespace created for {repo}")
+            self.invalidate_codespace_cache()
         else:
             print(f"\n{Colors.RED}✗ Failed to create codespace: {output}{Colors.RESET}")
             self.logger.error(f"Failed to create codespace: {output}")
 
-        input("Press Enter to continue...")
+        self.pause(prefetch=self.prefetch_codespaces)
 
     def list_codespaces(self):
         """List codespaces"""
-        success, output = self.github.run_gh_command(['codespace', 'list'])
+        print(f"\n{Colors.GREEN}Your codespaces:{Colors.RESET}")
+        success, output = self.github.run_gh_stream(['codespace', 'list'])
 
-        if success:
-            print(f"\n{Colors.GREEN}Your codespaces:{Colors.RESET}")
-            print(output)
-        else:
+        if not success:
             print(f"\n{Colors.RED}Failed to list codespaces: {output}{Colors.RESET}")
 
-        input("Press Enter to continue...")
+        self.pause()
 
     def start_codespace(self):
-        """Start a codespace by connecting to it (codespaces auto-start on connection)"""
+        """Start a codespace"""
         codespace_name = self.get_input("Codespace name")
 
-        print(f"\n{Colors.CYAN}Connecting to codespace (this will start it automatically)...{Colors.RESET}")
+        print(f"\n{Colors.CYAN}Starting codespace...{Colors.RESET}")
 
-        # GitHub Codespaces auto-start when you connect to them
-        success, output = self.github.run_gh_command(['codespace', 'ssh', '--codespace', codespace_name, '--', 'echo "Codespace started successfully"'])
+        success, output = self.github.session.request(
+            'POST', f"/user/codespaces/{urllib.parse.quote(codespace_name)}/start")
 
         if success:
-            print(f"\n{Colors.GREEN}✓ Codespace started and connected successfully!{Colors.RESET}")
-            print(f"{Colors.YELLOW}Note: Codespace '{codespace_name}' is now running.{Colors.RESET}")
+            print(f"\n{Colors.GREEN}✓ Codespace started successfully!{Colors.RESET}")
+            print(f"{Colors.YELLOW}Note: Codespace '{codespace_name}' is now starting up.{Colors.RESET}")
             self.logger.info(f"Codespace started: {codespace_name}")
+            self.invalidate_codespace_cache()
         else:
             print(f"\n{Colors.RED}✗ Failed to start codespace: {output}{Colors.RESET}")
             self.logger.error(f"Failed to start codespace: {output}")
 
-        input("Press Enter to continue...")
+        self.pause(prefetch=self.prefetch_codespaces)
 
     def stop_codespace(self):
         """Stop a codespace"""
         codespace_name = self.get_input("Codespace name")
 
-        success, output = self.github.run_gh_command(['codespace', 'stop', '--codespace', codespace_name])
+        success, output = self.github.session.request(
+            'POST', f"/user/codespaces/{urllib.parse.quote(codespace_name)}/stop")
 
         if success:
             print(f"\n{Colors.GREEN}✓ Codespace stopped successfully!{Colors.RESET}")
             self.logger.info(f"Codespace stopped: {codespace_name}")
+            self.invalidate_codespace_cache()
         else:
             print(f"\n{Colors.RED}✗ Failed to stop codespace: {output}{Colors.RESET}")
             self.logger.error(f"Failed to stop codespace: {output}")
 
-        input("Press Enter to continue...")
+        self.pause(prefetch=self.prefetch_codespaces)
 
     def delete_codespace(self):
         """Delete a codespace"""
         codespace_name = self.get_input("Codespace name")
 
         if self.confirm_action(f"Delete codespace '{codespace_name}'?"):
-            success, output = self.github.run_gh_command(['codespace', 'delete', '--codespace', codespace_name])
+            success, output = self.github.session.request(
+                'DELETE', f"/user/codespaces/{urllib.parse.quote(codespace_name)}")
 
             if success:
                 print(f"\n{Colors.GREEN}✓ Codespace deleted successfully!{Colors.RESET}")
                 self.logger.info(f"Codespace deleted: {codespace_name}")
+                self.invalidate_codespace_cache()
             else:
                 print(f"\n{Colors.RED}✗ Failed to delete codespace: {output}{Colors.RESET}")
                 self.logger.error(f"Failed to delete codespace: {output}")
 
-        input("Press Enter to continue...")
+        self.pause(prefetch=self.prefetch_codespaces)
 
     def rebuild_codespace(self):
-        """Rebuild a codespace"""
-        codespace_name = self.get_input("Codespace name")
+        """Rebuild one or more codespaces"""
+        names = self.get_input("Codespace name (comma-separated for several)")
+        codespace_names = [name.strip() for name in names.split(',') if name.strip()]
 
-        success, output = self.github.run_gh_command(['codespace', 'rebuild', '--codespace', codespace_name])
+        if not self.github.is_authenticated():
+            print(f"\n{Colors.RED}✗ GitHub CLI not authenticated. Run 'gh auth login' first.{Colors.RESET}")
+            self.pause()
+            return
 
-        if success:
-            print(f"\n{Colors.GREEN}✓ Codespace rebuild started!{Colors.RESET}")
-            self.logger.info(f"Codespace rebuild started: {codespace_name}")
-        else:
-            print(f"\n{Colors.RED}✗ Failed to rebuild codespace: {output}{Colors.RESET}")
-            self.logger.error(f"Failed to rebuild codespace: {output}")
+        async def rebuild_all():
+            return await asyncio.gather(*(
+                self.github.run_gh_async(['codespace', 'rebuild', '--codespace', name])
+                for name in codespace_names
+            ))
+
+        for codespace_name, (success, output) in zip(codespace_names, asyncio.run(rebuild_all())):
+            if success:
+                print(f"\n{Colors.GREEN}✓ Codespace rebuild started: {codespace_name}{Colors.RESET}")
+                self.logger.info(f"Codespace rebuild started: {codespace_name}")
+                self.invalidate_codespace_cache()
+            else:
+                print(f"\n{Colors.RED}✗ Failed to rebuild codespace {codespace_name}: {output}{Colors.RESET}")
+                self.logger.error(f"Failed to rebuild codespace: {output}")
 
-        input("Press Enter to continue...")
+        self.pause(prefetch=self.prefetch_codespaces)
 
     def connect_to_codespace(self):
         """Connect to a codespace via SSH"""
@@ -1614,7 +2406,7 @@ class CodespacesManager:
         print(f"{Colors.YELLOW}Press Ctrl+D or type 'exit' to disconnect{Colors.RESET}")
 
         try:
-            subprocess.run(['gh', 'codespace', 'ssh', '--codespace', codespace_name])
+            subprocess.run(codespace_ssh(codespace_name))
             print(f"\n{Colors.GREEN}✓ Disconnected from codespace{Colors.RESET}")
             self.logger.info(f"Connected to codespace: {codespace_name}")
         except KeyboardInterrupt:
@@ -1623,7 +2415,7 @@ class CodespacesManager:
             print(f"\n{Colors.RED}✗ Failed to connect: {e}{Colors.RESET}")
             self.logger.error(f"Failed to connect to codespace: {e}")
 
-        input("Press Enter to continue...")
+        self.pause()
 
     def quick_start_wizard(self):
         """Quick Start wizard"""
@@ -1639,9 +2431,17 @@ class CodespacesManager:
         if not self.confirm_action("Start Quick Start wizard?", True):
             return
 
+        # Run the environment and auth probes together; neither needs the other's result
+        async def preflight():
+            return await asyncio.gather(
+                asyncio.to_thread(SystemInfo.get_system_info),
+                asyncio.to_thread(self.github.is_authenticated)
+            )
+
+        system_info, authenticated = asyncio.run(preflight())
+
         # Step 1: Environment check
         print(f"\n{Colors.CYAN}Step 1: Environment Check{Colors.RESET}")
-        system_info = SystemInfo.get_system_info()
         if system_info.get('termux'):
             print(f"{Colors.GREEN}✓ Termux environment detected{Colors.RESET}")
         else:
@@ -1649,7 +2449,7 @@ class CodespacesManager:
 
         # Step 2: GitHub auth
         print(f"\n{Colors.CYAN}Step 2: GitHub Authentication{Colors.RESET}")
-        if self.github.is_authenticated():
+        if authenticated:
             print(f"{Colors.GREEN}✓ GitHub CLI authenticated{Colors.RESET}")
         else:
             print(f"{Colors.RED}✗ GitHub CLI not authenticated{Colors.RESET}")
@@ -1669,6 +2469,7 @@ class CodespacesManager:
 
             if success:
                 print(f"{Colors.GREEN}✓ Repository created: {repo_name}{Colors.RESET}")
+                self.invalidate_repo_cache()
 
                 # Step 4: Create codespace
                 print(f"\n{Colors.CYAN}Step 4: Create Codespace{Colors.RESET}")
@@ -1677,20 +2478,14 @@ class CodespacesManager:
                     username = output.split('/')[-2] if '/' in output else 'unknown'
                     full_repo = f"{username}/{repo_name}"
 
-                    success, cs_output = self.github.run_gh_command([
-                        'codespace', 'create', '--repo', full_repo,
-                        '--machine', 'basicLinux32gb'
-                    ])
+                    success, cs_output = self.github.create_codespace(full_repo, machine='basicLinux32gb')
 
                     if success:
                         print(f"{Colors.GREEN}✓ Codespace created successfully!{Colors.RESET}")
+                        self.invalidate_codespace_cache()
 
                         if self.confirm_action("Connect to the codespace now?", True):
-                            # Extract codespace name from output if possible
-                            lines = cs_output.strip().split('\n')
-                            if lines:
-                                codespace_name = lines[0]  # First line usually contains the name
-                                self.connect_to_codespace_by_name(codespace_name)
+                            self.connect_to_codespace_by_name(cs_output['name'])
                     else:
                         print(f"{Colors.RED}✗ Failed to create codespace: {cs_output}{Colors.RESET}")
             else:
@@ -1698,12 +2493,12 @@ class CodespacesManager:
 
         print(f"\n{Colors.BOLD}Quick Start completed!{Colors.RESET}")
         print("You can now use the main menu to explore more features.")
-        input("Press Enter to continue...")
+        self.pause()
 
     def connect_to_codespace_by_name(self, codespace_name: str):
         """Connect to codespace by name (helper for quick start)"""
         try:
-            subprocess.run(['gh', 'codespace', 'ssh', '--codespace', codespace_name])
+            subprocess.run(codespace_ssh(codespace_name))
         except:
             pass  # Handle silently in quick start
 
@@ -1713,83 +2508,118 @@ class CodespacesManager:
         print(f"{Colors.BOLD}Language & Development Environment Setup{Colors.RESET}\n")
         print(f"{Colors.YELLOW}Configure development environments in your codespaces{Colors.RESET}\n")
 
-        while True:
-            print("1. Quick Setup (All Languages + AI Agents)")
-            print("2. Individual Language Setup")
-            print("3. AI Agents Setup (Claude, Qwen)")
-            print("4. Programming Artifacts & Aliases")
-            print("5. Development Tools & Extensions")
-            print("6. Show Codespace Selection (Arrow Keys)")
-            print("7. Execute Remote Setup Commands")
-            print("0. Back to codespace lifecycle")
-            print()
+        options = {
+            '1': ("Quick Setup (All Languages + AI Agents)", self.quick_full_environment_setup),
+            '2': ("Individual Language Setup", self.individual_language_setup),
+            '3': ("AI Agents Setup (Claude, Qwen)", self.ai_agents_setup),
+            '4': ("Programming Artifacts & Aliases", self.programming_artifacts_setup),
+            '5': ("Development Tools & Extensions", self.development_tools_setup),
+            '6': ("Show Codespace Selection (Arrow Keys)", self.codespace_selector),
+            '7': ("Execute Remote Setup Commands", self.execute_remote_setup),
+            '8': ("Change Target Codespace", self.change_target_codespace),
+        }
 
-            choice = input(f"{Colors.BLUE}Choose an option: {Colors.RESET}").strip()
+        # Pick the target codespace once and reuse it for every action in this menu
+        self._pin_codespace = True
+        try:
+            while True:
+                if self._session_codespace:
+                    print(f"{Colors.CYAN}Target codespace: {self._session_codespace.get('name')}{Colors.RESET}\n")
+
+                choice = self.menu(options, "Back to codespace lifecycle")
+                if choice == '0':
+                    break
+                if choice:
+                    options[choice][1]()
+        finally:
+            self._pin_codespace = False
+            self._session_codespace = None
 
-            if choice == '1':
-                self.quick_full_environment_setup()
-            elif choice == '2':
-                self.individual_language_setup()
-            elif choice == '3':
-                self.ai_agents_setup()
-            elif choice == '4':
-                self.programming_artifacts_setup()
-            elif choice == '5':
-                self.development_tools_setup()
-            elif choice == '6':
-                self.codespace_selector()
-            elif choice == '7':
-                self.execute_remote_setup()
-            elif choice == '0':
-                break
-            else:
-                print(f"{Colors.RED}Invalid choice.{Colors.RESET}")
-                input("Press Enter to continue...")
+    def change_target_codespace(self):
+        """Forget the pinned codespace and prompt for a new one"""
+        self._session_codespace = None
+        self.get_codespace_selection("Choose target codespace")
 
-    def get_codespace_selection(self, prompt_text="Select codespace"):
-        """Enhanced codespace selection with arrow keys display"""
-        success, output = self.github.run_gh_command(['codespace', 'list', '--json', 'name,repository,state,displayName,gitStatus,machineName,lastUsedAt,createdAt,owner'])
+    def menu(self, options: Dict[str, Tuple[str, Callable]], back_label: str = "Back",
+             prompt: str = "Choose an option") -> Optional[str]:
+        """Print a numbered menu and return the chosen key, '0' for back or None if invalid"""
+        lines = [f"{key}. {label}" for key, (label, _) in options.items()]
+        lines += [f"0. {back_label}", ""]
+        print("\n".join(lines))
+
+        choice = input(f"{Colors.BLUE}{prompt}: {Colors.RESET}").strip()
+        if choice == '0' or choice in options:
+            return choice
+
+        print(f"{Colors.RED}Invalid choice.{Colors.RESET}")
+        self.pause()
+        return None
+
+    def fetch_codespaces(self, refresh: bool = False, quiet: bool = False) -> Optional[List[Dict]]:
+        """Return the user's codespaces, reusing a recent fetch unless refresh is set"""
+        cache = self._codespace_cache
+        if not refresh and cache['data'] is not None and time.time() - cache['ts'] < CODESPACE_CACHE_TTL:
+            return cache['data']
+
+        success, codespaces = self.github.list_codespaces_detailed()
 
         if not success:
-            print(f"{Colors.RED}✗ Failed to fetch codespaces: {output}{Colors.RESET}")
+            if not quiet:
+                print(f"{Colors.RED}✗ Failed to fetch codespaces: {codespaces}{Colors.RESET}")
             return None
 
-        try:
-            import json
-            codespaces = json.loads(output) if output.strip() else []
-
-            if not codespaces:
-                print(f"{Colors.YELLOW}No codespaces available.{Colors.RESET}")
-                return None
+        # Flatten the repository name once so menus don't re-check its shape per row
+        for cs in codespaces:
+            repo = cs.get('repository', 'Unknown')
+            cs['repository_name'] = repo.get('full_name', 'Unknown') if isinstance(repo, dict) else repo
 
-            print(f"\n{Colors.BOLD}{prompt_text}:{Colors.RESET}")
-            for i, cs in enumerate(codespaces, 1):
-                name = cs.get('name', 'Unknown')
-                repo = cs.get('repository', 'Unknown')
-                if isinstance(repo, dict):
-                    repo = repo.get('full_name', 'Unknown')
-                state = cs.get('state', 'Unknown')
+        cache['ts'] = time.time()
+        cache['data'] = codespaces
+        return codespaces
 
-                state_color = Colors.GREEN if state == 'Available' else Colors.YELLOW
-                print(f" {Colors.CYAN}{i}.{Colors.RESET} {name} ({state_color}{state}{Colors.RESET}) → {repo}")
+    def prefetch_codespaces(self):
+        """Warm the codespace cache without printing anything"""
+        self.fetch_codespaces(refresh=True, quiet=True)
 
-            print()
-            choice = input(f"{Colors.BLUE}Select (1-{len(codespaces)}): {Colors.RESET}").strip()
+    def invalidate_codespace_cache(self):
+        """Drop the cached codespace list after creating, starting, stopping or deleting one"""
+        self._codespace_cache['data'] = None
 
-            try:
-                idx = int(choice) - 1
-                if 0 <= idx < len(codespaces):
-                    return codespaces[idx]
-            except ValueError:
-                pass
+    def get_codespace_selection(self, prompt_text="Select codespace"):
+        """Enhanced codespace selection with arrow keys display"""
+        if self._pin_codespace and self._session_codespace:
+            print(f"\n{Colors.CYAN}Using codespace: {self._session_codespace.get('name')}{Colors.RESET}")
+            return self._session_codespace
 
-            print(f"{Colors.RED}Invalid selection.{Colors.RESET}")
+        codespaces = self.fetch_codespaces()
+        if codespaces is None:
             return None
 
-        except json.JSONDecodeError:
-            print(f"{Colors.RED}✗ Failed to parse codespace list{Colors.RESET}")
+        if not codespaces:
+            print(f"{Colors.YELLOW}No codespaces available.{Colors.RESET}")
             return None
 
+        print(f"\n{Colors.BOLD}{prompt_text}:{Colors.RESET}")
+        for i, cs in enumerate(codespaces, 1):
+            state = cs.get('state', 'Unknown')
+            state_color = Colors.GREEN if state == 'Available' else Colors.YELLOW
+            print(f" {Colors.CYAN}{i}.{Colors.RESET} {cs.get('name', 'Unknown')} ({state_color}{state}{Colors.RESET}) → {cs['repository_name']}")
+
+        print()
+        choice = input(f"{Colors.BLUE}Select (1-{len(codespaces)}): {Colors.RESET}").strip()
+
+        try:
+            idx = int(choice) - 1
+            if 0 <= idx < len(codespaces):
+                if self._pin_codespace:
+                    self._session_codespace = codespaces[idx]
+                return codespaces[idx]
+        except ValueError:
+            pass
+
+        print(f"{Colors.RED}Invalid selection.{Colors.RESET}")
+        return None
+
     def quick_full_environment_setup(self):
         """One-command full environment setup"""
         self.clear_screen()
@@ -1798,191 +2628,45 @@ class CodespacesManager:
         print("• Programming Languages: Python, Node.js, Rust, Go, Java")
         print("• AI Agents: Claude CLI, Qwen (Ollama)")
         print("• Development Tools: Git, Docker, VS Code extensions")
-        print("• Programming Artifacts: Aliases, shortcuts, dotfiles")
-        print()
-
-        codespace = self.get_codespace_selection("Choose codespace for full setup")
-        if not codespace:
-            return
-
-        codespace_name = codespace['name']
-        print(f"\n{Colors.YELLOW}Setting up full environment in: {codespace_name}{Colors.RESET}\n")
-
-        if not self.confirm_action("Proceed with full environment setup?", True):
-            return
-
-        # Generate comprehensive setup script
-        setup_script = self.generate_full_setup_script()
-
-        print(f"{Colors.GREEN}Executing full environment setup...{Colors.RESET}")
-
-        success = self.execute_script_in_codespace(codespace_name, setup_script, "Full Environment Setup")
-
-        if success:
-            print(f"\n{Colors.GREEN}✓ Full environment setup completed successfully!{Colors.RESET}")
-            print(f"{Colors.CYAN}Available commands:{Colors.RESET}")
-            print("• cl, claude - Claude AI CLI")
-            print("• qw, qwen, chat - Qwen AI model")
-            print("• python, node, cargo, go, java - Language tools")
-            print("• gst, gco, gp - Git aliases")
-            print("• ll, la - Directory aliases")
-
-            if self.confirm_action("Connect to codespace to test setup?"):
-                self.connect_to_codespace_by_name(codespace_name)
-        else:
-            print(f"\n{Colors.RED}✗ Full environment setup encountered errors{Colors.RESET}")
-
-        input("Press Enter to continue...")
-
-    def generate_full_setup_script(self):
-        """Generate comprehensive environment setup script"""
-        return """#!/bin/bash
-set -e
-
-echo "🚀 Starting Full Development Environment Setup..."
-
-# Update system
-echo "📦 Updating system packages..."
-sudo apt update && sudo apt upgrade -y
-
-# Essential tools
-echo "🔧 Installing essential tools..."
-sudo apt install -y curl wget git vim tmux htop tree jq unzip build-essential
-
-# Python setup
-echo "🐍 Setting up Python environment..."
-sudo apt install -y python3 python3-pip python3-venv
-python3 -m pip install --upgrade pip
-pip3 install poetry black ruff mypy pytest jupyter
-
-# Node.js setup
-echo "📦 Installing Node.js and npm..."
-curl -fsSL https://deb.nodesource.com/setup_lts.x | sudo -E bash -
-sudo apt install -y nodejs
-npm install -g npm@latest typescript ts-node eslint prettier
-
-# Rust setup
-echo "🦀 Installing Rust..."
-curl --proto '=https' --tlsv1.2 -sSf https://sh.rustup.rs | sh -s -- -y
-source ~/.cargo/env
-rustup component add clippy rustfmt
-
-# Go setup
-echo "🐹 Installing Go..."
-GO_VERSION="1.21.5"
-wget https://go.dev/dl/go${GO_VERSION}.linux-amd64.tar.gz
-sudo rm -rf /usr/local/go && sudo tar -C /usr/local -xzf go${GO_VERSION}.linux-amd64.tar.gz
-rm go${GO_VERSION}.linux-amd64.tar.gz
-echo 'export PATH=$PATH:/usr/local/go/bin' >> ~/.bashrc
-
-# Java setup
-echo "☕ Installing Java..."
-sudo apt install -y openjdk-17-jdk maven gradle
-
-# Claude CLI setup
-echo "🤖 Installing Claude CLI..."
-if command -v npm >/dev/null 2>&1; then
-    npm install -g @anthropic-ai/claude-cli || echo "Claude CLI install failed, continuing..."
-fi
-
-# Ollama for Qwen setup
-echo "🧠 Installing Ollama for Qwen..."
-curl -fsSL https://ollama.ai/install.sh | sh
-nohup ollama serve > /dev/null 2>&1 &
-sleep 5
-ollama pull qwen:latest || echo "Qwen model pull failed, continuing..."
-
-# Docker setup
-echo "🐳 Installing Docker..."
-curl -fsSL https://get.docker.com | sh
-sudo usermod -aG docker $USER
-
-# Git configuration
-echo "📝 Configuring Git..."
-git config --global init.defaultBranch main
-git config --global pull.rebase false
-git config --global core.editor vim
-
-# Helpful aliases
-echo "⚡ Setting up aliases and shortcuts..."
-cat >> ~/.bashrc << 'EOF'
-
-# Git aliases
-alias gst='git status'
-alias gco='git checkout'
-alias gcb='git checkout -b'
-alias gp='git push'
-alias gpl='git pull'
-alias ga='git add'
-alias gc='git commit'
-alias gd='git diff'
-alias gl='git log --oneline'
+        print("• Programming Artifacts: Aliases, shortcuts, dotfiles")
+        print()
 
-# Directory aliases
-alias ll='ls -alF'
-alias la='ls -A'
-alias l='ls -CF'
-alias ..='cd ..'
-alias ...='cd ../..'
+        codespace = self.get_codespace_selection("Choose codespace for full setup")
+        if not codespace:
+            return
 
-# Development aliases
-alias py='python3'
-alias pip='pip3'
-alias code='code .'
-alias t='tree'
-alias h='htop'
+        codespace_name = codespace['name']
+        print(f"\n{Colors.YELLOW}Setting up full environment in: {codespace_name}{Colors.RESET}\n")
 
-# AI aliases (short & full)
-alias cl='claude'
-alias claude='claude-cli'
-alias qw='ollama run qwen'
-alias qwen='ollama run qwen'
-alias chat='ollama run qwen'
+        if not self.confirm_action("Proceed with full environment setup?", True):
+            return
 
-# Quick commands
-alias update='sudo apt update && sudo apt upgrade'
-alias install='sudo apt install'
-alias search='apt search'
-alias ports='sudo netstat -tulpn'
-alias weather='curl wttr.in'
+        # Generate comprehensive setup script
+        setup_script = self.generate_full_setup_script()
 
-EOF
+        print(f"{Colors.GREEN}Executing full environment setup...{Colors.RESET}")
 
-# VS Code extensions
-echo "💻 Installing VS Code extensions..."
-EXTENSIONS=(
-    "ms-python.python"
-    "rust-lang.rust-analyzer"
-    "golang.go"
-    "ms-vscode.vscode-typescript-next"
-    "bradlc.vscode-tailwindcss"
-    "esbenp.prettier-vscode"
-    "ms-vscode.vscode-json"
-    "redhat.vscode-yaml"
-    "ms-azuretools.vscode-docker"
-    "github.copilot"
-    "anthropic.claude-dev"
-)
+        success = self.execute_script_in_codespace(codespace_name, setup_script, "Full Environment Setup")
 
-for ext in "${EXTENSIONS[@]}"; do
-    code --install-extension "$ext" --force || echo "Extension $ext failed to install"
-done
+        if success:
+            print(f"\n{Colors.GREEN}✓ Full environment setup completed successfully!{Colors.RESET}")
+            print(f"{Colors.CYAN}Available commands:{Colors.RESET}")
+            print("• cl, claude - Claude AI CLI")
+            print("• qw, qwen, chat - Qwen AI model")
+            print("• python, node, cargo, go, java - Language tools")
+            print("• gst, gco, gp - Git aliases")
+            print("• ll, la - Directory aliases")
 
-# Final setup
-echo "🎯 Final setup steps..."
-source ~/.bashrc
+            if self.confirm_action("Connect to codespace to test setup?"):
+                self.connect_to_codespace_by_name(codespace_name)
+        else:
+            print(f"\n{Colors.RED}✗ Full environment setup encountered errors{Colors.RESET}")
 
-echo "✅ Full Development Environment Setup Complete!"
-echo ""
-echo "🎉 Available tools and commands:"
-echo "Languages: python3, node, cargo, go, java, javac"
-echo "AI: claude, qwen (ollama run qwen)"
-echo "Git: gst, gco, gp, ga, gc (and standard git)"
-echo "Utils: ll, la, t (tree), h (htop)"
-echo "Development: code, docker, poetry, npm"
-echo ""
-echo "🔄 Restart your terminal or run 'source ~/.bashrc' to use aliases"
-"""
+        self.pause()
+
+    def generate_full_setup_script(self):
+        """Generate comprehensive environment setup script"""
+        return FULL_SETUP_SCRIPT
 
     def individual_language_setup(self):
         """Setup individual programming languages"""
@@ -2000,145 +2684,94 @@ echo "🔄 Restart your terminal or run 'source ~/.bashrc' to use aliases"
             '8': ('Ruby', self.setup_ruby)
         }
 
-        for key, (name, _) in languages.items():
-            print(f"{key}. {name}")
-        print("0. Back")
-        print()
+        print("\n".join([f"{key}. {name}" for key, (name, _) in languages.items()] + ["0. Back", ""]))
 
-        choice = input(f"{Colors.BLUE}Choose language: {Colors.RESET}").strip()
+        choice = input(f"{Colors.BLUE}Choose language(s) (e.g., 1 or 1,3,4): {Colors.RESET}").strip()
 
         if choice == '0':
             return
 
-        if choice in languages:
-            lang_name, setup_func = languages[choice]
+        keys = [key.strip() for key in choice.split(',') if key.strip()]
+        if not keys or any(key not in languages for key in keys):
+            print(f"{Colors.RED}Invalid choice.{Colors.RESET}")
+            self.pause()
+            return
+
+        selected = [languages[key] for key in dict.fromkeys(keys)]
+        names = ', '.join(name for name, _ in selected)
+
+        codespace = self.get_codespace_selection(f"Choose codespace for {names} setup")
+        if not codespace:
+            return
 
-            codespace = self.get_codespace_selection(f"Choose codespace for {lang_name} setup")
-            if codespace:
-                setup_func(codespace['name'])
+        if len(selected) == 1:
+            selected[0][1](codespace['name'])
         else:
-            print(f"{Colors.RED}Invalid choice.{Colors.RESET}")
-            input("Press Enter to continue...")
+            # One remote session for all languages instead of one per language
+            script = self.bundle_scripts([(name, LANGUAGE_SETUP_SCRIPTS[name]) for name, _ in selected])
+            self.execute_script_in_codespace(codespace['name'], script, "Multi-language Setup")
+
+    def bundle_scripts(self, parts: List[Tuple[str, str]]) -> str:
+        """Join several setup scripts into one, each under its own banner"""
+        sections = ["#!/bin/bash"]
+        for name, script in parts:
+            body = script[script.find('\n') + 1:] if script.startswith('#!') else script
+            sections.append(f'echo "== {name} =="\n{body}')
+        return "\n".join(sections)
 
     def setup_python(self, codespace_name):
         """Setup Python environment"""
-        script = """#!/bin/bash
-echo "🐍 Setting up Python environment..."
-sudo apt update
-sudo apt install -y python3 python3-pip python3-venv python3-dev
-python3 -m pip install --upgrade pip
-pip3 install poetry black ruff mypy pytest jupyter pandas numpy requests flask fastapi
-echo "✅ Python setup complete!"
-"""
-        self.execute_script_in_codespace(codespace_name, script, "Python Setup")
+        self.execute_script_in_codespace(codespace_name, LANGUAGE_SETUP_SCRIPTS['Python'], "Python Setup")
 
     def setup_nodejs(self, codespace_name):
         """Setup Node.js environment"""
-        script = """#!/bin/bash
-echo "📦 Setting up Node.js environment..."
-curl -fsSL https://deb.nodesource.com/setup_lts.x | sudo -E bash -
-sudo apt install -y nodejs
-npm install -g npm@latest typescript ts-node eslint prettier nodemon
-echo "✅ Node.js setup complete!"
-"""
-        self.execute_script_in_codespace(codespace_name, script, "Node.js Setup")
+        self.execute_script_in_codespace(codespace_name, LANGUAGE_SETUP_SCRIPTS['Node.js'], "Node.js Setup")
 
     def setup_rust(self, codespace_name):
         """Setup Rust environment"""
-        script = """#!/bin/bash
-echo "🦀 Setting up Rust environment..."
-curl --proto '=https' --tlsv1.2 -sSf https://sh.rustup.rs | sh -s -- -y
-source ~/.cargo/env
-rustup component add clippy rustfmt
-echo "✅ Rust setup complete!"
-"""
-        self.execute_script_in_codespace(codespace_name, script, "Rust Setup")
+        self.execute_script_in_codespace(codespace_name, LANGUAGE_SETUP_SCRIPTS['Rust'], "Rust Setup")
 
     def setup_go(self, codespace_name):
         """Setup Go environment"""
-        script = """#!/bin/bash
-echo "🐹 Setting up Go environment..."
-GO_VERSION="1.21.5"
-wget https://go.dev/dl/go${GO_VERSION}.linux-amd64.tar.gz
-sudo rm -rf /usr/local/go && sudo tar -C /usr/local -xzf go${GO_VERSION}.linux-amd64.tar.gz
-rm go${GO_VERSION}.linux-amd64.tar.gz
-echo 'export PATH=$PATH:/usr/local/go/bin' >> ~/.bashrc
-source ~/.bashrc
-echo "✅ Go setup complete!"
-"""
-        self.execute_script_in_codespace(codespace_name, script, "Go Setup")
+        self.execute_script_in_codespace(codespace_name, LANGUAGE_SETUP_SCRIPTS['Go'], "Go Setup")
 
     def setup_java(self, codespace_name):
         """Setup Java environment"""
-        script = """#!/bin/bash
-echo "☕ Setting up Java environment..."
-sudo apt update
-sudo apt install -y openjdk-17-jdk maven gradle
-echo "✅ Java setup complete!"
-"""
-        self.execute_script_in_codespace(codespace_name, script, "Java Setup")
+        self.execute_script_in_codespace(codespace_name, LANGUAGE_SETUP_SCRIPTS['Java'], "Java Setup")
 
     def setup_cpp(self, codespace_name):
         """Setup C/C++ environment"""
-        script = """#!/bin/bash
-echo "⚙️ Setting up C/C++ environment..."
-sudo apt update
-sudo apt install -y build-essential gdb cmake clang-format
-echo "✅ C/C++ setup complete!"
-"""
-        self.execute_script_in_codespace(codespace_name, script, "C/C++ Setup")
+        self.execute_script_in_codespace(codespace_name, LANGUAGE_SETUP_SCRIPTS['C/C++'], "C/C++ Setup")
 
     def setup_php(self, codespace_name):
         """Setup PHP environment"""
-        script = """#!/bin/bash
-echo "🐘 Setting up PHP environment..."
-sudo apt update
-sudo apt install -y php php-cli php-mbstring php-xml php-curl composer
-echo "✅ PHP setup complete!"
-"""
-        self.execute_script_in_codespace(codespace_name, script, "PHP Setup")
+        self.execute_script_in_codespace(codespace_name, LANGUAGE_SETUP_SCRIPTS['PHP'], "PHP Setup")
 
     def setup_ruby(self, codespace_name):
         """Setup Ruby environment"""
-        script = """#!/bin/bash
-echo "💎 Setting up Ruby environment..."
-sudo apt update
-sudo apt install -y ruby ruby-dev bundler
-gem install rails
-echo "✅ Ruby setup complete!"
-"""
-        self.execute_script_in_codespace(codespace_name, script, "Ruby Setup")
+        self.execute_script_in_codespace(codespace_name, LANGUAGE_SETUP_SCRIPTS['Ruby'], "Ruby Setup")
 
     def ai_agents_setup(self):
         """Setup AI agents (Claude, Qwen)"""
         self.clear_screen()
         print(f"{Colors.BOLD}AI Agents Setup{Colors.RESET}\n")
-        print("1. Claude CLI")
-        print("2. Qwen (via Ollama)")
-        print("3. Both AI Agents")
-        print("0. Back")
-        print()
 
-        choice = input(f"{Colors.BLUE}Choose option: {Colors.RESET}").strip()
+        agents = {
+            '1': ("Claude CLI", self.setup_claude_cli),
+            '2': ("Qwen (via Ollama)", self.setup_qwen),
+            '3': ("Both AI Agents", self.setup_both_ai_agents),
+        }
 
-        if choice == '0':
+        # Validate the choice before asking for a codespace
+        choice = self.menu(agents, prompt="Choose option")
+        if not choice or choice == '0':
             return
 
         codespace = self.get_codespace_selection("Choose codespace for AI agents setup")
         if not codespace:
             return
 
-        codespace_name = codespace['name']
-
-        if choice == '1':
-            self.setup_claude_cli(codespace_name)
-        elif choice == '2':
-            self.setup_qwen(codespace_name)
-        elif choice == '3':
-            self.setup_both_ai_agents(codespace_name)
-        else:
-            print(f"{Colors.RED}Invalid choice.{Colors.RESET}")
-            input("Press Enter to continue...")
+        agents[choice][1](codespace['name'])
 
     def setup_claude_cli(self, codespace_name):
         """Setup Claude CLI"""
@@ -2170,7 +2803,7 @@ curl -fsSL https://ollama.ai/install.sh | sh
 
 # Start Ollama service
 nohup ollama serve > /dev/null 2>&1 &
-sleep 10
+wait_for_ollama
 
 # Pull Qwen model
 echo "Downloading Qwen model (this may take a while)..."
@@ -2203,7 +2836,7 @@ npm install -g @anthropic-ai/claude-cli || {
 echo "Setting up Ollama and Qwen..."
 curl -fsSL https://ollama.ai/install.sh | sh
 nohup ollama serve > /dev/null 2>&1 &
-sleep 10
+wait_for_ollama
 ollama pull qwen:latest
 
 # Aliases for both AI agents
@@ -2230,78 +2863,7 @@ echo "💡 Qwen: qw, qwen or ollama run qwen"
 
         print(f"\n{Colors.GREEN}Setting up programming artifacts...{Colors.RESET}")
 
-        script = '''#!/bin/bash
-echo "⚡ Setting up programming artifacts and aliases..."
-
-# Git aliases and configuration
-echo "📝 Configuring Git..."
-git config --global init.defaultBranch main
-git config --global pull.rebase false
-git config --global core.editor vim
-
-# Helpful aliases
-echo "⚡ Setting up aliases and shortcuts..."
-cat >> ~/.bashrc << "ALIASEOF"
-
-# Git aliases
-alias gst='git status'
-alias gco='git checkout'
-alias gcb='git checkout -b'
-alias gp='git push'
-alias gpl='git pull'
-alias ga='git add'
-alias gc='git commit'
-alias gd='git diff'
-alias gl='git log --oneline'
-
-# Directory aliases
-alias ll='ls -alF'
-alias la='ls -A'
-alias l='ls -CF'
-alias ..='cd ..'
-alias ...='cd ../..'
-
-# Development aliases
-alias py='python3'
-alias pip='pip3'
-alias code='code .'
-alias t='tree'
-alias h='htop'
-
-# AI aliases (short & full)
-alias cl='claude'
-alias claude='claude-cli'
-alias qw='ollama run qwen'
-alias qwen='ollama run qwen'
-alias chat='ollama run qwen'
-
-# Quick commands
-alias update='sudo apt update && sudo apt upgrade'
-alias install='sudo apt install'
-alias search='apt search'
-alias ports='sudo netstat -tulpn'
-alias weather='curl wttr.in'
-
-# Make directories and navigate into them
-mkcd() { mkdir -p "$1" && cd "$1"; }
-
-ALIASEOF
-
-# Vim configuration
-echo "⚙️ Setting up vim configuration..."
-cat > ~/.vimrc << "VIMEOF"
-set number
-set autoindent
-set tabstop=4
-set shiftwidth=4
-syntax on
-VIMEOF
-
-echo "✅ Programming artifacts setup complete!"
-echo "🔄 Run 'source ~/.bashrc' or restart terminal to activate changes"
-'''
-
-        self.execute_script_in_codespace(codespace['name'], script, "Programming Artifacts Setup")
+        self.execute_script_in_codespace(codespace['name'], ARTIFACTS_SETUP_SCRIPT, "Programming Artifacts Setup")
 
     def development_tools_setup(self):
         """Setup development tools and extensions"""
@@ -2312,59 +2874,7 @@ echo "🔄 Run 'source ~/.bashrc' or restart terminal to activate changes"
         if not codespace:
             return
 
-        script = """#!/bin/bash
-echo "🛠️ Installing development tools and VS Code extensions..."
-
-# Essential development tools
-echo "Installing development tools..."
-sudo apt update
-sudo apt install -y curl wget git vim tmux htop tree jq unzip build-essential
-
-# VS Code extensions for enhanced development
-echo "📦 Installing VS Code extensions..."
-EXTENSIONS=(
-    "ms-python.python"
-    "ms-python.black-formatter"
-    "rust-lang.rust-analyzer"
-    "golang.go"
-    "ms-vscode.vscode-typescript-next"
-    "bradlc.vscode-tailwindcss"
-    "esbenp.prettier-vscode"
-    "ms-vscode.vscode-json"
-    "redhat.vscode-yaml"
-    "ms-azuretools.vscode-docker"
-    "github.copilot"
-    "anthropic.claude-dev"
-    "ms-vsliveshare.vsliveshare"
-    "ms-vscode.hexeditor"
-    "yzhang.markdown-all-in-one"
-    "ms-vscode-remote.remote-containers"
-    "github.github-vscode-theme"
-    "pkief.material-icon-theme"
-    "formulahendry.auto-rename-tag"
-    "christian-kohler.path-intellisense"
-)
-
-for ext in "${EXTENSIONS[@]}"; do
-    echo "Installing $ext..."
-    code --install-extension "$ext" --force || echo "Failed to install $ext"
-done
-
-# Additional useful tools
-echo "Installing additional tools..."
-# Install gh cli if not present
-type gh >/dev/null 2>&1 || {
-    curl -fsSL https://cli.github.com/packages/githubcli-archive-keyring.gpg | sudo dd of=/usr/share/keyrings/githubcli-archive-keyring.gpg
-    echo "deb [arch=$(dpkg --print-architecture) signed-by=/usr/share/keyrings/githubcli-archive-keyring.gpg] https://cli.github.com/packages stable main" | sudo tee /etc/apt/sources.list.d/github-cli.list > /dev/null
-    sudo apt update
-    sudo apt install gh -y
-}
-
-echo "✅ Development tools setup complete!"
-echo "🎉 Installed VS Code extensions for Python, Rust, Go, TypeScript, and more!"
-"""
-
-        self.execute_script_in_codespace(codespace['name'], script, "Development Tools Setup")
+        self.execute_script_in_codespace(codespace['name'], DEV_TOOLS_SETUP_SCRIPT, "Development Tools Setup")
 
     def codespace_selector(self):
         """Interactive codespace selector with arrow keys display"""
@@ -2372,47 +2882,34 @@ echo "🎉 Installed VS Code extensions for Python, Rust, Go, TypeScript, and mo
         print(f"{Colors.BOLD}Codespace Selector{Colors.RESET}\n")
         print(f"{Colors.CYAN}Available Codespaces (Arrow Key Navigation Style):{Colors.RESET}\n")
 
-        success, output = self.github.run_gh_command(['codespace', 'list', '--json', 'name,repository,state,displayName,gitStatus,machineName,lastUsedAt,createdAt,owner'])
-
-        if not success:
-            print(f"{Colors.RED}✗ Failed to fetch codespaces: {output}{Colors.RESET}")
-            input("Press Enter to continue...")
+        # Shares the short-lived codespace cache with the selection menus
+        codespaces = self.fetch_codespaces()
+        if codespaces is None:
+            self.pause()
             return
 
-        try:
-            import json
-            codespaces = json.loads(output) if output.strip() else []
-
-            if not codespaces:
-                print(f"{Colors.YELLOW}No codespaces available.{Colors.RESET}")
-                input("Press Enter to continue...")
-                return
-
-            print(f"{Colors.BOLD}Format: Name (Status) → Repository{Colors.RESET}\n")
-
-            for i, cs in enumerate(codespaces, 1):
-                name = cs.get('name', 'Unknown')
-                repo = cs.get('repository', 'Unknown')
-                if isinstance(repo, dict):
-                    repo = repo.get('full_name', 'Unknown')
-                state = cs.get('state', 'Unknown')
-                machine = cs.get('machine', {}).get('display_name', 'Unknown')
+        if not codespaces:
+            print(f"{Colors.YELLOW}No codespaces available.{Colors.RESET}")
+            self.pause()
+            return
 
-                state_color = Colors.GREEN if state == 'Available' else Colors.YELLOW
+        lines = [f"{Colors.BOLD}Format: Name (Status) → Repository{Colors.RESET}\n"]
 
-                print(f" {Colors.CYAN}▶{Colors.RESET}  {Colors.BOLD}{name}{Colors.RESET}")
-                print(f"    Status: {state_color}{state}{Colors.RESET}")
-                print(f"    Repository: {repo}")
-                print(f"    Machine: {machine}")
-                print()
+        for cs in codespaces:
+            # fetch_codespaces already flattened the repository shape once per fetch
+            name = cs.get('name', 'Unknown')
+            repo = cs['repository_name']
+            state = cs.get('state', 'Unknown')
+            machine = (cs.get('machine') or EMPTY_MAPPING).get('display_name', 'Unknown')
 
-            print(f"{Colors.GREEN}💡 This is how codespaces will be displayed in selection menus{Colors.RESET}")
-            print(f"{Colors.YELLOW}Use the number (1, 2, 3...) to select a codespace{Colors.RESET}")
+            lines.append(CS_SELECTOR_ROW.format(name=name, state=state, repo=repo, machine=machine,
+                                                state_color=STATE_COLORS.get(state, Colors.YELLOW)))
 
-        except json.JSONDecodeError:
-            print(f"{Colors.RED}✗ Failed to parse codespace list{Colors.RESET}")
+        lines.append(f"{Colors.GREEN}💡 This is how codespaces will be displayed in selection menus{Colors.RESET}")
+        lines.append(f"{Colors.YELLOW}Use the number (1, 2, 3...) to select a codespace{Colors.RESET}")
+        _emit(lines)
 
-        input("\nPress Enter to continue...")
+        self.pause("\nPress Enter to continue...")
 
     def execute_remote_setup(self):
         """Execute custom setup commands in a codespace"""
@@ -2439,7 +2936,7 @@ echo "🎉 Installed VS Code extensions for Python, Rust, Go, TypeScript, and mo
 
         if not commands:
             print(f"{Colors.YELLOW}No commands entered.{Colors.RESET}")
-            input("Press Enter to continue...")
+            self.pause()
             return
 
         # Create script from commands
@@ -2453,99 +2950,74 @@ echo "🎉 Installed VS Code extensions for Python, Rust, Go, TypeScript, and mo
         try:
             print(f"{Colors.YELLOW}Executing {operation_name} in {codespace_name}...{Colors.RESET}")
 
-            # Create a temporary script file
-            import tempfile
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.sh', delete=False) as f:
-                f.write(script)
-                temp_script = f.name
+            # Define the shared helpers right after the shebang
+            if script.startswith('#!'):
+                shebang, _, body = script.partition('\n')
+                script = f"{shebang}\n{SCRIPT_PROLOGUE}{body}"
+            else:
+                script = SCRIPT_PROLOGUE + script
 
-            # Debug: Show script size and first few lines
-            print(f"{Colors.CYAN}Script size: {len(script)} bytes{Colors.RESET}")
+            # Debug: Show script size and first few lines in one write
             script_lines = script.split('\n')
-            print(f"{Colors.CYAN}Script preview (first 5 lines):{Colors.RESET}")
-            for i, line in enumerate(script_lines[:5]):
-                print(f"  {i+1}: {line}")
+            preview = [f"{Colors.CYAN}Script size: {len(script)} bytes{Colors.RESET}",
+                       f"{Colors.CYAN}Script preview (first 5 lines):{Colors.RESET}"]
+            preview += [f"  {i+1}: {line}" for i, line in enumerate(script_lines[:5])]
             if len(script_lines) > 5:
-                print(f"  ... ({len(script_lines)} total lines)")
+                preview.append(f"  ... ({len(script_lines)} total lines)")
+            _emit(preview)
 
             # Copy script to codespace and execute
-            # First, determine the working directory and create script path
-            # Use unique filename and create script directly via SSH
-            import time
+            # Use a unique filename under /tmp so relative paths don't depend on the login directory
             # Create appropriate prefix based on operation name
-            prefix = operation_name.lower().replace(' ', '_').replace('/', '_')
-            script_name = f'{prefix}_{int(time.time())}.sh'
-
-            # Escape the script content for safe transfer
-            script_escaped = script.replace("'", "'\"'\"'").replace("\n", "\\n")
-
-            # Create script directly via SSH instead of using cp
-            create_cmd = ['gh', 'codespace', 'ssh', '--codespace', codespace_name, '--',
-                         f"cat > {script_name} << 'SCRIPT_EOF'\n{script}\nSCRIPT_EOF"]
-
-            print(f"Creating script in codespace as {script_name}...")
-            create_result = subprocess.run(create_cmd, capture_output=True, text=True)
-
-            if create_result.returncode != 0:
-                print(f"{Colors.RED}✗ Failed to create script: {create_result.stderr}{Colors.RESET}")
-                return False
-            else:
-                print(f"{Colors.GREEN}✓ Script created successfully{Colors.RESET}")
-
-            # Verify the script was created
-            verify_cmd = ['gh', 'codespace', 'ssh', '--codespace', codespace_name, '--', f'ls -la {script_name} && wc -l {script_name}']
-            print(f"Verifying script creation...")
-            verify_result = subprocess.run(verify_cmd, capture_output=True, text=True)
-
-            if verify_result.returncode == 0:
-                print(f"{Colors.CYAN}Verification: {verify_result.stdout}{Colors.RESET}")
-            else:
-                print(f"{Colors.YELLOW}Verification failed: {verify_result.stderr}{Colors.RESET}")
-                return False
-
-            # Execute the script
-            exec_cmd = ['gh', 'codespace', 'ssh', '--codespace', codespace_name, '--', f'chmod +x {script_name} && bash {script_name} && rm {script_name}']
-            print(f"Executing setup script...")
-            exec_result = subprocess.run(exec_cmd, capture_output=True, text=True, timeout=600)  # 10 minute timeout
-
-            # Clean up temp file
-            os.unlink(temp_script)
-
-            if exec_result.returncode == 0:
+            prefix = operation_name.translate(SCRIPT_PREFIX_TABLE)
+            script_name = shlex.quote(f'/tmp/{prefix}_{int(time.time())}.sh')
+
+            # Upload from stdin, execute and clean up in one remote session;
+            # the script is removed even on failure. Listing the uploaded file is diagnostics only.
+            verify = f' && ls -la {script_name} && wc -l {script_name}' if self.config.log_level == "DEBUG" else ''
+            exec_cmd = codespace_ssh(codespace_name,
+                                     f'cat > {script_name}{verify} '
+                                     f'&& bash {script_name}; rc=$?; rm -f {script_name}; exit $rc')
+            print(f"Uploading and executing setup script as {script_name}...")
+
+            # Stream output as it arrives and keep only the tail for the summary
+            proc = subprocess.Popen(exec_cmd, stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                                    stderr=subprocess.STDOUT, text=True, bufsize=1)
+            killer = threading.Timer(SCRIPT_TIMEOUT, proc.kill)
+            killer.start()
+            started = time.monotonic()
+            tail = deque(maxlen=SCRIPT_TAIL_LINES)
+            try:
+                proc.stdin.write(script)
+                proc.stdin.close()
+                for line in proc.stdout:
+                    print(line, end='')
+                    tail.append(line)
+                returncode = proc.wait()
+            finally:
+                killer.cancel()
+
+            if returncode != 0 and time.monotonic() - started >= SCRIPT_TIMEOUT:
+                raise subprocess.TimeoutExpired(exec_cmd, SCRIPT_TIMEOUT)
+
+            if returncode == 0:
                 print(f"{Colors.GREEN}✓ {operation_name} completed successfully!{Colors.RESET}")
-                if exec_result.stdout:
-                    print(f"\n{Colors.CYAN}Output:{Colors.RESET}")
-                    # Show first and last few lines of output for debugging
-                    output_lines = exec_result.stdout.strip().split('\n')
-                    if len(output_lines) <= 20:
-                        print(exec_result.stdout)
-                    else:
-                        print('\n'.join(output_lines[:10]))
-                        print(f"\n{Colors.YELLOW}... ({len(output_lines)} total lines) ...{Colors.RESET}\n")
-                        print('\n'.join(output_lines[-5:]))
                 return True
             else:
                 print(f"{Colors.RED}✗ {operation_name} failed!{Colors.RESET}")
-                if exec_result.stderr:
-                    print(f"\n{Colors.RED}Error:{Colors.RESET}")
-                    print(exec_result.stderr)
+                if tail:
+                    print(f"\n{Colors.RED}Last output:{Colors.RESET}")
+                    print(''.join(tail), end='')
                 return False
 
         except subprocess.TimeoutExpired:
-            print(f"{Colors.RED}✗ {operation_name} timed out (10 minutes){Colors.RESET}")
+            print(f"{Colors.RED}✗ {operation_name} timed out ({SCRIPT_TIMEOUT // 60} minutes){Colors.RESET}")
             return False
         except Exception as e:
             print(f"{Colors.RED}✗ Error executing {operation_name}: {e}{Colors.RESET}")
             return False
-        finally:
-            # Cleanup remote script
-            try:
-                subprocess.run(['gh', 'codespace', 'ssh', '--codespace', codespace_name, '--', 'rm -f /tmp/setup_script.sh'],
-                             capture_output=True, timeout=30)
-            except:
-                pass  # Ignore cleanup errors
 
-        input("Press Enter to continue...")
+        self.pause()
 
     def uninstall(self):
         """Uninstall the application"""
@@ -2560,7 +3032,6 @@ echo "🎉 Installed VS Code extensions for Python, Rust, Go, TypeScript, and mo
         if self.confirm_action("Proceed with uninstall?"):
             try:
                 # Remove config and cache directories
-                import shutil
                 if CONFIG_FILE.parent.exists():
                     shutil.rmtree(CONFIG_FILE.parent)
                 if LOGS_DIR.exists():
@@ -2574,7 +3045,7 @@ echo "🎉 Installed VS Code extensions for Python, Rust, Go, TypeScript, and mo
             except Exception as e:
                 print(f"{Colors.RED}✗ Uninstall failed: {e}{Colors.RESET}")
 
-        input("Press Enter to continue...")
+        self.pause()
 
     def exit_app(self):
         """Exit the application"""
@@ -2588,7 +3059,7 @@ echo "🎉 Installed VS Code extensions for Python, Rust, Go, TypeScript, and mo
         try:
             while True:
                 self.show_main_menu()
-                choice = input(f"{Colors.BLUE}Choose an option (0-12): {Colors.RESET}").strip()
+                choice = input(MAIN_PROMPT).strip()
                 self.handle_menu_choice(choice)
         except KeyboardInterrupt:
             print(f"\n{Colors.YELLOW}Goodbye!{Colors.RESET}")
@@ -2607,6 +3078,8 @@ def main():
 
     if args.non_interactive:
         app.config.auto_confirm = True
+        # Inherited by every gh child: fail instead of waiting on a prompt nobody will answer
+        os.environ['GH_PROMPT_DISABLED'] = '1'
 
     app.run()
 
@@ -3,10 +3,12 @@
 Advanced Codespaces features: metrics, costs, snapshots, and system monitoring
 """
 
+import asyncio
 import subprocess
 import json
 import time
 import os
+import shutil
 from pathlib import Path
 from typing import Dict, List, Optional
 from datetime import datetime, timedelta
@@ -17,6 +19,23 @@ try:
 except ImportError:
     PSUTIL_AVAILABLE = False
 
+# Prefer orjson for parsing gh JSON output; it accepts str or bytes directly
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
+# GitHub Codespaces pricing (as of 2024, subject to change)
+MACHINE_COST_PER_HOUR = {
+    'basicLinux32gb': 0.18,    # 2-core, 4GB RAM, 32GB storage
+    'standardLinux32gb': 0.36,  # 4-core, 8GB RAM, 32GB storage
+    'premiumLinux64gb': 0.72,   # 8-core, 16GB RAM, 64GB storage
+    'largeLinux128gb': 1.44,    # 16-core, 32GB RAM, 128GB storage
+}
+DEFAULT_COST_PER_HOUR = 0.18
+
+
 class CodespacesAdvanced:
     """Advanced Codespaces operations"""
 
@@ -36,16 +55,15 @@ class CodespacesAdvanced:
         try:
             # Get codespace list with details
             cmd = ['codespace', 'list', '--json', 'name,repository,state,displayName,gitStatus,machineName,lastUsedAt,createdAt,owner']
-            success, output = self.github.run_gh_command(cmd)
+            success, output = self.github.run_gh_command(cmd, binary=True)
 
             if success:
-                codespaces_data = json.loads(output)
+                codespaces_data = json_loads(output)
 
-                for cs in codespaces_data:
-                    cs_metrics = self._get_individual_codespace_metrics(cs)
-                    metrics['codespaces'].append(cs_metrics)
-                    metrics['total_cost_estimate'] += cs_metrics.get('estimated_cost_per_hour', 0)
-                    metrics['total_storage_used'] += cs_metrics.get('storage_used_mb', 0)
+                rows = [self._get_individual_codespace_metrics(cs) for cs in codespaces_data]
+                metrics['codespaces'] = rows
+                metrics['total_cost_estimate'] = sum(row.get('estimated_cost_per_hour', 0) for row in rows)
+                metrics['total_storage_used'] = sum(row.get('storage_used_mb', 0) for row in rows)
 
         except Exception as e:
             self.logger.error(f"Failed to get codespace metrics: {e}")
@@ -102,16 +120,7 @@ class CodespacesAdvanced:
 
     def _get_machine_cost_per_hour(self, machine_type: str) -> float:
         """Get estimated cost per hour for machine type"""
-        # GitHub Codespaces pricing (as of 2024, subject to change)
-        pricing_map = {
-            'basicLinux32gb': 0.18,    # 2-core, 4GB RAM, 32GB storage
-            'standardLinux32gb': 0.36,  # 4-core, 8GB RAM, 32GB storage
-            'premiumLinux64gb': 0.72,   # 8-core, 16GB RAM, 64GB storage
-            'largeLinux128gb': 1.44,    # 16-core, 32GB RAM, 128GB storage
-            'default': 0.18
-        }
-
-        return pricing_map.get(machine_type, pricing_map['default'])
+        return MACHINE_COST_PER_HOUR.get(machine_type, DEFAULT_COST_PER_HOUR)
 
     def _get_codespace_storage(self, codespace_name: str) -> Dict:
         """Get storage information for a codespace"""
@@ -516,7 +525,6 @@ class SystemMonitor:
                             size_mb = round(size_bytes / 1024 / 1024)
 
                             # Remove the repository
-                            import shutil
                             shutil.rmtree(repo_path)
 
                             results['removed_repos'].append({
@@ -545,6 +553,27 @@ class EnvironmentBootstrapper:
     def __init__(self, logger):
         self.logger = logger
 
+    @staticmethod
+    async def _probe_tool(version_cmd: str) -> Optional[str]:
+        """Run a tool's version command and return the first line, or None if unavailable"""
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                *version_cmd.split(),
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE
+            )
+            stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=5)
+        except asyncio.TimeoutError:
+            proc.kill()
+            return None
+        except OSError:
+            return None
+
+        if proc.returncode != 0:
+            return None
+        version_output = stdout.decode().strip() or stderr.decode().strip()
+        return version_output.split('\n')[0]
+
     def detect_environment(self) -> Dict:
         """Detect current environment and available tools"""
         env_info = {
@@ -579,16 +608,14 @@ class EnvironmentBootstrapper:
             'cargo': 'cargo --version'
         }
 
-        for tool, version_cmd in essential_tools.items():
-            try:
-                result = subprocess.run(version_cmd.split(),
-                                      capture_output=True, text=True, timeout=5)
-                if result.returncode == 0:
-                    version_output = result.stdout.strip() or result.stderr.strip()
-                    env_info['available_tools'][tool] = version_output.split('\n')[0]
-                else:
-                    env_info['missing_tools'].append(tool)
-            except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
+        # Probe all tools concurrently; wall time is bounded by the slowest one
+        async def probe_all():
+            return await asyncio.gather(*(self._probe_tool(cmd) for cmd in essential_tools.values()))
+
+        for tool, version_output in zip(essential_tools, asyncio.run(probe_all())):
+            if version_output is not None:
+                env_info['available_tools'][tool] = version_output
+            else:
                 env_info['missing_tools'].append(tool)
 
         # Generate recommendations
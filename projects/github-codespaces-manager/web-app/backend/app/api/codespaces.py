@@ -2,18 +2,24 @@
 Codespaces API endpoints
 """
 
+import asyncio
 from fastapi import APIRouter, HTTPException, BackgroundTasks
-from typing import Dict, Any, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional
 from pydantic import BaseModel
 
-from app.core.github_manager import WebGitHubManager
-from app.core.websockets import WebSocketManager
+from app.core.github_manager import github_manager
+from app.core.websockets import websocket_manager
 
 router = APIRouter()
 
-# Initialize managers
-github_manager = WebGitHubManager()
-websocket_manager = WebSocketManager()
+# Codespaces acted on at once by a bulk request
+BULK_CONCURRENCY = 8
+# Action name -> (manager operation, in-progress status sent before it runs)
+CODESPACE_ACTIONS = {
+    "start": (github_manager.start_codespace, "starting"),
+    "stop": (github_manager.stop_codespace, "stopping"),
+    "delete": (github_manager.delete_codespace, "deleting"),
+}
 
 
 class CreateCodespaceRequest(BaseModel):
@@ -27,6 +33,38 @@ class CodespaceActionRequest(BaseModel):
     codespace_name: str
 
 
+class BulkActionRequest(BaseModel):
+    action: str
+    codespace_names: List[str]
+
+
+async def run_codespace_action(action: str, operation: Callable[[str], Awaitable[Dict[str, Any]]],
+                               codespace_name: str):
+    """Run a codespace operation after the response is sent and report the outcome"""
+    try:
+        result = await operation(codespace_name)
+        await websocket_manager.send_codespace_update(
+            codespace_name=codespace_name,
+            action=action,
+            status="completed" if result["success"] else "failed",
+            data={"message": result.get("message") or result.get("error")}
+        )
+    except Exception as e:
+        await websocket_manager.send_error(f"Error running {action} on codespace: {str(e)}")
+
+
+async def run_bulk_action(action: str, operation: Callable[[str], Awaitable[Dict[str, Any]]],
+                          codespace_names: List[str]):
+    """Run one operation across several codespaces, BULK_CONCURRENCY at a time"""
+    semaphore = asyncio.Semaphore(BULK_CONCURRENCY)
+
+    async def run_one(codespace_name: str):
+        async with semaphore:
+            await run_codespace_action(action, operation, codespace_name)
+
+    await asyncio.gather(*(run_one(name) for name in codespace_names))
+
+
 @router.get("/")
 async def list_codespaces():
     """Get all codespaces"""
@@ -50,17 +88,10 @@ async def list_codespaces():
 async def get_codespace(codespace_name: str):
     """Get specific codespace details"""
     try:
-        result = await github_manager.get_codespaces()
+        codespace, error = await github_manager.get_codespace_by_name(codespace_name)
 
-        if "error" in result:
-            raise HTTPException(status_code=500, detail=result["error"])
-
-        # Find specific codespace
-        codespace = None
-        for cs in result["codespaces"]:
-            if cs["name"] == codespace_name:
-                codespace = cs
-                break
+        if error:
+            raise HTTPException(status_code=500, detail=error)
 
         if not codespace:
             raise HTTPException(status_code=404, detail="Codespace not found")
@@ -126,121 +157,83 @@ async def create_codespace(request: CreateCodespaceRequest, background_tasks: Ba
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.post("/{codespace_name}/start")
-async def start_codespace(codespace_name: str):
-    """Start a codespace"""
-    try:
-        await websocket_manager.send_codespace_update(
-            codespace_name=codespace_name,
-            action="start",
-            status="starting"
-        )
-
-        result = await github_manager.start_codespace(codespace_name)
-
-        if result["success"]:
-            await websocket_manager.send_codespace_update(
-                codespace_name=codespace_name,
-                action="start",
-                status="completed"
-            )
-
-            return {
-                "success": True,
-                "message": result["message"],
-                "codespace_name": codespace_name
-            }
-        else:
-            await websocket_manager.send_codespace_update(
-                codespace_name=codespace_name,
-                action="start",
-                status="failed"
-            )
-            raise HTTPException(status_code=400, detail=result.get("error", "Failed to start codespace"))
-
-    except HTTPException:
-        raise
-    except Exception as e:
-        await websocket_manager.send_error(f"Error starting codespace: {str(e)}")
-        raise HTTPException(status_code=500, detail=str(e))
-
-
-@router.post("/{codespace_name}/stop")
-async def stop_codespace(codespace_name: str):
-    """Stop a codespace"""
-    try:
-        await websocket_manager.send_codespace_update(
-            codespace_name=codespace_name,
-            action="stop",
-            status="stopping"
-        )
-
-        result = await github_manager.stop_codespace(codespace_name)
-
-        if result["success"]:
-            await websocket_manager.send_codespace_update(
-                codespace_name=codespace_name,
-                action="stop",
-                status="completed"
-            )
-
-            return {
-                "success": True,
-                "message": result["message"],
-                "codespace_name": codespace_name
-            }
-        else:
-            await websocket_manager.send_codespace_update(
-                codespace_name=codespace_name,
-                action="stop",
-                status="failed"
-            )
-            raise HTTPException(status_code=400, detail=result.get("error", "Failed to stop codespace"))
-
-    except HTTPException:
-        raise
-    except Exception as e:
-        await websocket_manager.send_error(f"Error stopping codespace: {str(e)}")
-        raise HTTPException(status_code=500, detail=str(e))
-
-
-@router.delete("/{codespace_name}")
-async def delete_codespace(codespace_name: str):
-    """Delete a codespace"""
-    try:
+@router.post("/{codespace_name}/start", status_code=202)
+async def start_codespace(codespace_name: str, background_tasks: BackgroundTasks):
+    """Start a codespace in the background; progress is reported over the websocket"""
+    await websocket_manager.send_codespace_update(
+        codespace_name=codespace_name,
+        action="start",
+        status="starting"
+    )
+
+    background_tasks.add_task(run_codespace_action, "start", github_manager.start_codespace, codespace_name)
+
+    return {
+        "success": True,
+        "status": "accepted",
+        "codespace_name": codespace_name
+    }
+
+
+@router.post("/{codespace_name}/stop", status_code=202)
+async def stop_codespace(codespace_name: str, background_tasks: BackgroundTasks):
+    """Stop a codespace in the background; progress is reported over the websocket"""
+    await websocket_manager.send_codespace_update(
+        codespace_name=codespace_name,
+        action="stop",
+        status="stopping"
+    )
+
+    background_tasks.add_task(run_codespace_action, "stop", github_manager.stop_codespace, codespace_name)
+
+    return {
+        "success": True,
+        "status": "accepted",
+        "codespace_name": codespace_name
+    }
+
+
+@router.delete("/{codespace_name}", status_code=202)
+async def delete_codespace(codespace_name: str, background_tasks: BackgroundTasks):
+    """Delete a codespace in the background; progress is reported over the websocket"""
+    await websocket_manager.send_codespace_update(
+        codespace_name=codespace_name,
+        action="delete",
+        status="deleting"
+    )
+
+    background_tasks.add_task(run_codespace_action, "delete", github_manager.delete_codespace, codespace_name)
+
+    return {
+        "success": True,
+        "status": "accepted",
+        "codespace_name": codespace_name
+    }
+
+
+@router.post("/bulk", status_code=202)
+async def bulk_codespace_action(request: BulkActionRequest, background_tasks: BackgroundTasks):
+    """Start, stop or delete several codespaces concurrently; each outcome is reported over the websocket"""
+    if request.action not in CODESPACE_ACTIONS:
+        raise HTTPException(status_code=400, detail=f"Unsupported action: {request.action}")
+
+    operation, progress_status = CODESPACE_ACTIONS[request.action]
+    codespace_names = list(dict.fromkeys(request.codespace_names))
+    for codespace_name in codespace_names:
         await websocket_manager.send_codespace_update(
             codespace_name=codespace_name,
-            action="delete",
-            status="deleting"
+            action=request.action,
+            status=progress_status
         )
 
-        result = await github_manager.delete_codespace(codespace_name)
+    background_tasks.add_task(run_bulk_action, request.action, operation, codespace_names)
 
-        if result["success"]:
-            await websocket_manager.send_codespace_update(
-                codespace_name=codespace_name,
-                action="delete",
-                status="completed"
-            )
-
-            return {
-                "success": True,
-                "message": result["message"],
-                "codespace_name": codespace_name
-            }
-        else:
-            await websocket_manager.send_codespace_update(
-                codespace_name=codespace_name,
-                action="delete",
-                status="failed"
-            )
-            raise HTTPException(status_code=400, detail=result.get("error", "Failed to delete codespace"))
-
-    except HTTPException:
-        raise
-    except Exception as e:
-        await websocket_manager.send_error(f"Error deleting codespace: {str(e)}")
-        raise HTTPException(status_code=500, detail=str(e))
+    return {
+        "success": True,
+        "status": "accepted",
+        "action": request.action,
+        "codespace_names": codespace_names
+    }
 
 
 @router.get("/repositories/list")
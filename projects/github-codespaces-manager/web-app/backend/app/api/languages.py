@@ -6,16 +6,13 @@ from fastapi import APIRouter, HTTPException, BackgroundTasks
 from typing import List, Dict, Any, Optional
 from pydantic import BaseModel
 import asyncio
+from functools import lru_cache
 
-from app.core.github_manager import WebGitHubManager
-from app.core.websockets import WebSocketManager
+from app.core.github_manager import github_manager
+from app.core.websockets import websocket_manager
 
 router = APIRouter()
 
-# Initialize managers
-github_manager = WebGitHubManager()
-websocket_manager = WebSocketManager()
-
 
 class LanguageSetupRequest(BaseModel):
     codespace_name: str
@@ -160,145 +157,141 @@ alias install='sudo apt install'
 alias search='apt search'
 """
 
+# Static pieces of the combined setup script, assembled once at import
+SETUP_SCRIPT_HEADER = b"#!/bin/bash\nset -e\n\n"
+LANGUAGE_SCRIPT_BLOCKS = {lang: f"# {lang.upper()} SETUP\n{script}\n".encode() for lang, script in LANGUAGE_SCRIPTS.items()}
+AI_AGENTS_BLOCK = f"# AI AGENTS SETUP\n{AI_AGENTS_SCRIPT}\n".encode()
+ALIASES_BLOCK = f"# PROGRAMMING ALIASES\ncat >> ~/.bashrc << 'EOF'\n{PROGRAMMING_ALIASES}\nEOF\n\n".encode()
+SETUP_SCRIPT_FOOTER = "echo '🎉 All language setups completed successfully!'".encode()
+
+
+@lru_cache(maxsize=256)
+def build_setup_script(languages: tuple, include_ai_agents: bool, include_aliases: bool) -> bytes:
+    """Assemble the combined setup script; identical selections reuse the cached result"""
+    parts = [SETUP_SCRIPT_HEADER]
+    parts.extend(LANGUAGE_SCRIPT_BLOCKS[language] for language in languages if language in LANGUAGE_SCRIPT_BLOCKS)
+    if include_ai_agents:
+        parts.append(AI_AGENTS_BLOCK)
+    if include_aliases:
+        parts.append(ALIASES_BLOCK)
+    parts.append(SETUP_SCRIPT_FOOTER)
+    return b"".join(parts)
+
+# The /available payload never changes, so it is built once
+AVAILABLE_RESPONSE = {
+    "success": True,
+    "data": {
+        "languages": [
+            {"id": "python", "name": "Python", "description": "Python 3 with pip, poetry, and dev tools"},
+            {"id": "nodejs", "name": "Node.js", "description": "Node.js LTS with npm and TypeScript"},
+            {"id": "rust", "name": "Rust", "description": "Rust with Cargo and development tools"},
+            {"id": "go", "name": "Go", "description": "Go programming language with tools"},
+            {"id": "java", "name": "Java", "description": "OpenJDK 17 with Maven and Gradle"},
+            {"id": "cpp", "name": "C/C++", "description": "GCC, Clang, and build tools"},
+            {"id": "php", "name": "PHP", "description": "PHP with Composer and common extensions"},
+            {"id": "ruby", "name": "Ruby", "description": "Ruby with Bundler and Rails"}
+        ],
+        "ai_agents": [
+            {"id": "claude", "name": "Claude CLI", "description": "Anthropic's Claude AI command line tool"},
+            {"id": "qwen", "name": "Qwen", "description": "Qwen AI model via Ollama"}
+        ],
+        "tools": [
+            {"id": "aliases", "name": "Programming Aliases", "description": "Useful command line aliases"},
+            {"id": "git_config", "name": "Git Configuration", "description": "Git setup and aliases"}
+        ]
+    }
+}
+
 
 @router.get("/available")
 async def get_available_languages():
     """Get list of available languages and tools"""
-    return {
-        "success": True,
-        "data": {
-            "languages": [
-                {"id": "python", "name": "Python", "description": "Python 3 with pip, poetry, and dev tools"},
-                {"id": "nodejs", "name": "Node.js", "description": "Node.js LTS with npm and TypeScript"},
-                {"id": "rust", "name": "Rust", "description": "Rust with Cargo and development tools"},
-                {"id": "go", "name": "Go", "description": "Go programming language with tools"},
-                {"id": "java", "name": "Java", "description": "OpenJDK 17 with Maven and Gradle"},
-                {"id": "cpp", "name": "C/C++", "description": "GCC, Clang, and build tools"},
-                {"id": "php", "name": "PHP", "description": "PHP with Composer and common extensions"},
-                {"id": "ruby", "name": "Ruby", "description": "Ruby with Bundler and Rails"}
-            ],
-            "ai_agents": [
-                {"id": "claude", "name": "Claude CLI", "description": "Anthropic's Claude AI command line tool"},
-                {"id": "qwen", "name": "Qwen", "description": "Qwen AI model via Ollama"}
-            ],
-            "tools": [
-                {"id": "aliases", "name": "Programming Aliases", "description": "Useful command line aliases"},
-                {"id": "git_config", "name": "Git Configuration", "description": "Git setup and aliases"}
-            ]
-        }
-    }
+    return AVAILABLE_RESPONSE
+
 
+async def run_language_setup(operation_id: str, codespace_name: str, script: bytes):
+    """Run the combined setup script after the response is sent and report the outcome"""
+    try:
+        result = await github_manager.execute_setup_script(
+            codespace_name=codespace_name,
+            script=script,
+            operation_name="Language Setup"
+        )
 
-@router.post("/setup")
+        if result["success"]:
+            await websocket_manager.send_operation_update(
+                operation_id=operation_id,
+                status="completed",
+                progress=100,
+                message="All languages setup completed successfully!",
+                data={"output": result["output"]}
+            )
+        else:
+            error = result.get("error") or result.get("output") or "Unknown error"
+            await websocket_manager.send_operation_update(
+                operation_id=operation_id,
+                status="failed",
+                message=f"Setup failed: {error}"
+            )
+
+    except Exception as e:
+        await websocket_manager.send_error(f"Error during language setup: {str(e)}")
+
+
+@router.post("/setup", status_code=202)
 async def setup_languages(request: LanguageSetupRequest, background_tasks: BackgroundTasks):
     """Setup selected languages in a codespace"""
     try:
         operation_id = f"setup_{request.codespace_name}_{len(request.languages)}_languages"
 
-        # Send initial WebSocket notification
-        await websocket_manager.send_operation_update(
+        # Progress messages are collected while the script is assembled and sent as one frame
+        pending_updates = [websocket_manager.build_operation_update(
             operation_id=operation_id,
             status="started",
             progress=0,
             message=f"Setting up {len(request.languages)} languages in {request.codespace_name}..."
-        )
-
-        # Build combined setup script
-        script_parts = ["#!/bin/bash", "set -e", ""]
-
-        # Add language setup scripts
-        total_steps = len(request.languages) + (1 if request.include_ai_agents else 0) + (1 if request.include_aliases else 0)
-        current_step = 0
+        )]
 
-        for language in request.languages:
-            if language in LANGUAGE_SCRIPTS:
-                script_parts.append(f"# {language.upper()} SETUP")
-                script_parts.append(LANGUAGE_SCRIPTS[language])
-                script_parts.append("")
-
-                current_step += 1
-                progress = int((current_step / total_steps) * 100)
-
-                await websocket_manager.send_operation_update(
-                    operation_id=operation_id,
-                    status="running",
-                    progress=progress,
-                    message=f"Setting up {language}..."
-                )
-
-        # Add AI agents if requested
+        # Each selected step contributes a progress message
+        steps = [language for language in request.languages if language in LANGUAGE_SCRIPT_BLOCKS]
         if request.include_ai_agents:
-            script_parts.append("# AI AGENTS SETUP")
-            script_parts.append(AI_AGENTS_SCRIPT)
-            script_parts.append("")
-
-            current_step += 1
-            progress = int((current_step / total_steps) * 100)
-
-            await websocket_manager.send_operation_update(
-                operation_id=operation_id,
-                status="running",
-                progress=progress,
-                message="Setting up AI agents..."
-            )
-
-        # Add aliases if requested
+            steps.append("AI agents")
         if request.include_aliases:
-            script_parts.append("# PROGRAMMING ALIASES")
-            script_parts.append(f"cat >> ~/.bashrc << 'EOF'\n{PROGRAMMING_ALIASES}\nEOF")
-            script_parts.append("")
+            steps.append("aliases")
 
-            current_step += 1
-            progress = int((current_step / total_steps) * 100)
+        # Language blocks are independent, so a sorted key lets any ordering hit the cache
+        combined_script = build_setup_script(
+            tuple(sorted(request.languages)), request.include_ai_agents, request.include_aliases
+        )
 
-            await websocket_manager.send_operation_update(
+        total_steps = len(request.languages) + (1 if request.include_ai_agents else 0) + (1 if request.include_aliases else 0)
+        pending_updates.extend(
+            websocket_manager.build_operation_update(
                 operation_id=operation_id,
                 status="running",
-                progress=progress,
-                message="Setting up aliases..."
+                progress=int((step / total_steps) * 100),
+                message=f"Setting up {label}..."
             )
-
-        # Final script
-        script_parts.append("echo '🎉 All language setups completed successfully!'")
-        combined_script = "\n".join(script_parts)
-
-        # Execute the script
-        result = await github_manager.execute_setup_script(
-            codespace_name=request.codespace_name,
-            script=combined_script,
-            operation_name="Language Setup"
+            for step, label in enumerate(steps, 1)
         )
 
-        if result["success"]:
-            await websocket_manager.send_operation_update(
-                operation_id=operation_id,
-                status="completed",
-                progress=100,
-                message="All languages setup completed successfully!",
-                data={"output": result["output"]}
-            )
+        await websocket_manager.send_operation_updates(pending_updates)
 
-            return {
-                "success": True,
-                "message": "Languages setup completed successfully",
-                "data": {
-                    "codespace_name": request.codespace_name,
-                    "languages_installed": request.languages,
-                    "ai_agents_included": request.include_ai_agents,
-                    "aliases_included": request.include_aliases,
-                    "output": result["output"]
-                }
+        # The script can run for minutes; the outcome is reported over the websocket
+        background_tasks.add_task(run_language_setup, operation_id, request.codespace_name, combined_script)
+
+        return {
+            "success": True,
+            "status": "scheduled",
+            "operation_id": operation_id,
+            "data": {
+                "codespace_name": request.codespace_name,
+                "languages_requested": request.languages,
+                "ai_agents_included": request.include_ai_agents,
+                "aliases_included": request.include_aliases
             }
-        else:
-            await websocket_manager.send_operation_update(
-                operation_id=operation_id,
-                status="failed",
-                message=f"Setup failed: {result.get('error', 'Unknown error')}"
-            )
-            raise HTTPException(status_code=400, detail=result.get("error", "Setup failed"))
+        }
 
-    except HTTPException:
-        raise
     except Exception as e:
         await websocket_manager.send_error(f"Error during language setup: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -2,15 +2,53 @@
 Metrics and monitoring API endpoints
 """
 
+import heapq
+from collections import defaultdict
 from fastapi import APIRouter, HTTPException
 from typing import Dict, Any
 
-from app.core.github_manager import WebGitHubManager
+from app.core.github_manager import github_manager
 
 router = APIRouter()
 
-# Initialize manager
-github_manager = WebGitHubManager()
+# Published GitHub Codespaces machine pricing
+MACHINE_PRICING = {
+    "basicLinux32gb": {"hourly": 0.18, "cores": 2, "ram_gb": 4, "storage_gb": 32},
+    "standardLinux32gb": {"hourly": 0.36, "cores": 4, "ram_gb": 8, "storage_gb": 32},
+    "premiumLinux64gb": {"hourly": 0.72, "cores": 8, "ram_gb": 16, "storage_gb": 64},
+    "largeLinux128gb": {"hourly": 1.44, "cores": 16, "ram_gb": 32, "storage_gb": 128}
+}
+
+COST_OPTIMIZATION_TIPS = [
+    "Stop codespaces when not in use to avoid charges",
+    "Use smaller machine types for lighter workloads",
+    "Consider deleting unused codespaces",
+    "Monitor usage patterns to optimize machine selection"
+]
+
+# Daily usage hours assumed per codespace state; stopped codespaces don't accrue compute cost
+DAILY_HOURS_BY_STATE = {"Available": 8}
+
+
+def to_cents(amount: float) -> float:
+    """Round a non-negative dollar amount to cents (cheaper than round(x, 2))"""
+    return int(amount * 100 + 0.5) / 100
+
+
+def codespace_cost_row(cs: Dict[str, Any]) -> Dict[str, Any]:
+    """Cost estimate for one codespace"""
+    state = cs["state"]
+    hourly_cost = cs.get("cost_estimate", 0.18)
+    daily_estimate = hourly_cost * DAILY_HOURS_BY_STATE.get(state, 0)
+    return {
+        "name": cs["name"],
+        "repository": cs["repository"],
+        "state": state,
+        "machine_type": cs["machine_type"],
+        "hourly_cost": hourly_cost,
+        "daily_estimate": to_cents(daily_estimate),
+        "monthly_estimate": to_cents(daily_estimate * 30)
+    }
 
 
 @router.get("/overview")
@@ -25,29 +63,36 @@ async def get_metrics_overview():
 
         codespaces = codespaces_result["codespaces"]
 
-        # Calculate metrics
+        # Counts, costs and machine type grouping in a single pass
         total_codespaces = len(codespaces)
-        running_codespaces = len([cs for cs in codespaces if cs["state"] == "Available"])
-        shutdown_codespaces = len([cs for cs in codespaces if cs["state"] == "Shutdown"])
+        running_codespaces = shutdown_codespaces = 0
+        total_hourly_cost = running_hourly_cost = 0.0
+        machine_types = {}
+        for cs in codespaces:
+            cost = cs.get("cost_estimate", 0.18)
+            total_hourly_cost += cost
 
-        # Calculate costs
-        total_hourly_cost = sum(cs.get("cost_estimate", 0.18) for cs in codespaces)
-        running_hourly_cost = sum(
-            cs.get("cost_estimate", 0.18) for cs in codespaces
-            if cs["state"] == "Available"
-        )
+            state = cs["state"]
+            if state == "Available":
+                running_codespaces += 1
+                running_hourly_cost += cost
+            elif state == "Shutdown":
+                shutdown_codespaces += 1
+
+            machine_type = cs.get("machine_type", "Unknown")
+            entry = machine_types.get(machine_type)
+            if entry is None:
+                machine_types[machine_type] = {"count": 1, "cost": cost}
+            else:
+                entry["count"] += 1
+                entry["cost"] += cost
 
         # Storage estimates (simplified)
         estimated_storage_gb = total_codespaces * 1.5  # Rough estimate
 
-        # Group by machine type
-        machine_types = {}
-        for cs in codespaces:
-            machine_type = cs.get("machine_type", "Unknown")
-            if machine_type not in machine_types:
-                machine_types[machine_type] = {"count": 0, "cost": 0}
-            machine_types[machine_type]["count"] += 1
-            machine_types[machine_type]["cost"] += cs.get("cost_estimate", 0.18)
+        # Round accumulated costs like the other figures so the encoder emits short numbers
+        for entry in machine_types.values():
+            entry["cost"] = to_cents(entry["cost"])
 
         return {
             "success": True,
@@ -56,15 +101,15 @@ async def get_metrics_overview():
                     "total_codespaces": total_codespaces,
                     "running_codespaces": running_codespaces,
                     "shutdown_codespaces": shutdown_codespaces,
-                    "total_hourly_cost": round(total_hourly_cost, 2),
-                    "running_hourly_cost": round(running_hourly_cost, 2),
+                    "total_hourly_cost": to_cents(total_hourly_cost),
+                    "running_hourly_cost": to_cents(running_hourly_cost),
                     "estimated_storage_gb": round(estimated_storage_gb, 1)
                 },
                 "machine_types": machine_types,
                 "cost_breakdown": {
-                    "running_cost_per_hour": round(running_hourly_cost, 2),
-                    "daily_cost_estimate": round(running_hourly_cost * 24, 2),
-                    "monthly_cost_estimate": round(running_hourly_cost * 24 * 30, 2)
+                    "running_cost_per_hour": to_cents(running_hourly_cost),
+                    "daily_cost_estimate": to_cents(running_hourly_cost * 24),
+                    "monthly_cost_estimate": to_cents(running_hourly_cost * 24 * 30)
                 }
             }
         }
@@ -85,45 +130,14 @@ async def get_cost_analysis():
         codespaces = codespaces_result["codespaces"]
 
         # Cost analysis per codespace
-        cost_analysis = []
-        for cs in codespaces:
-            hourly_cost = cs.get("cost_estimate", 0.18)
-
-            # Estimate usage based on state
-            if cs["state"] == "Available":
-                daily_estimate = hourly_cost * 8  # Assume 8 hours/day usage
-            else:
-                daily_estimate = 0  # Shutdown codespaces don't cost when stopped
-
-            cost_analysis.append({
-                "name": cs["name"],
-                "repository": cs["repository"],
-                "state": cs["state"],
-                "machine_type": cs["machine_type"],
-                "hourly_cost": hourly_cost,
-                "daily_estimate": round(daily_estimate, 2),
-                "monthly_estimate": round(daily_estimate * 30, 2)
-            })
-
-        # Machine type pricing
-        machine_pricing = {
-            "basicLinux32gb": {"hourly": 0.18, "cores": 2, "ram_gb": 4, "storage_gb": 32},
-            "standardLinux32gb": {"hourly": 0.36, "cores": 4, "ram_gb": 8, "storage_gb": 32},
-            "premiumLinux64gb": {"hourly": 0.72, "cores": 8, "ram_gb": 16, "storage_gb": 64},
-            "largeLinux128gb": {"hourly": 1.44, "cores": 16, "ram_gb": 32, "storage_gb": 128}
-        }
+        cost_analysis = [codespace_cost_row(cs) for cs in codespaces]
 
         return {
             "success": True,
             "data": {
                 "codespace_costs": cost_analysis,
-                "machine_pricing": machine_pricing,
-                "cost_optimization_tips": [
-                    "Stop codespaces when not in use to avoid charges",
-                    "Use smaller machine types for lighter workloads",
-                    "Consider deleting unused codespaces",
-                    "Monitor usage patterns to optimize machine selection"
-                ]
+                "machine_pricing": MACHINE_PRICING,
+                "cost_optimization_tips": COST_OPTIMIZATION_TIPS
             }
         }
 
@@ -143,36 +157,31 @@ async def get_usage_metrics():
         codespaces = codespaces_result["codespaces"]
 
         # Analyze usage patterns
-        repositories = {}
+        repositories = defaultdict(lambda: {"count": 0, "states": {"Available": 0, "Shutdown": 0}})
         states = {"Available": 0, "Shutdown": 0, "Unknown": 0}
 
         for cs in codespaces:
             # Repository usage
-            repo = cs["repository"]
-            if repo not in repositories:
-                repositories[repo] = {"count": 0, "states": {"Available": 0, "Shutdown": 0}}
-            repositories[repo]["count"] += 1
+            entry = repositories[cs["repository"]]
+            entry["count"] += 1
 
             # State distribution
             state = cs["state"]
             if state in states:
                 states[state] += 1
-                repositories[repo]["states"][state] = repositories[repo]["states"].get(state, 0) + 1
+                repo_states = entry["states"]
+                repo_states[state] = repo_states.get(state, 0) + 1
             else:
                 states["Unknown"] += 1
 
-        # Most active repositories
-        active_repos = sorted(
-            repositories.items(),
-            key=lambda x: x[1]["count"],
-            reverse=True
-        )[:10]
+        # Most active repositories; partial selection instead of sorting every repository
+        active_repos = heapq.nlargest(10, repositories.items(), key=lambda x: x[1]["count"])
 
         return {
             "success": True,
             "data": {
                 "state_distribution": states,
-                "repository_usage": dict(repositories),
+                "repository_usage": repositories,
                 "most_active_repositories": [
                     {"repository": repo, "codespace_count": data["count"]}
                     for repo, data in active_repos
@@ -3,49 +3,123 @@ System monitoring and status API endpoints
 """
 
 import os
+import time
+import asyncio
 import psutil
-import subprocess
 from fastapi import APIRouter, HTTPException
 from typing import Dict, Any
 
 router = APIRouter()
 
+# Host identity doesn't change while the server runs
+UNAME = os.uname()
+SYSTEM_INFO = {
+    "platform": UNAME.sysname,
+    "version": UNAME.release,
+    "architecture": UNAME.machine,
+    "hostname": UNAME.nodename
+}
+
+# Responses are reused for this many seconds; dashboards poll faster than the numbers move
+STATUS_CACHE_TTL = 3.0
+_response_cache: Dict[str, Any] = {}
+
+# gh auth state changes rarely; re-check at most this often
+GH_STATUS_TTL = 30.0
+GH_STATUS_TIMEOUT = 5.0
+_gh_status = {"ts": float("-inf"), "available": False, "status": "unknown"}
+
+# Kept for the life of the server so cpu_percent() measures since the previous call
+API_PROCESS = psutil.Process()
+# Prime the non-blocking CPU counters; the first call always reports 0.0
+psutil.cpu_percent(interval=None)
+API_PROCESS.cpu_percent()
+
+
+# Placeholder log entries served by /logs until real log collection exists
+SAMPLE_LOGS = [
+    {
+        "timestamp": "2025-09-26T19:46:00Z",
+        "level": "INFO",
+        "message": "Web API server started successfully",
+        "service": "api"
+    },
+    {
+        "timestamp": "2025-09-26T19:45:30Z",
+        "level": "INFO",
+        "message": "Database initialized",
+        "service": "database"
+    },
+    {
+        "timestamp": "2025-09-26T19:45:15Z",
+        "level": "INFO",
+        "message": "WebSocket manager initialized",
+        "service": "websocket"
+    }
+]
+SAMPLE_LOGS_COUNT = len(SAMPLE_LOGS)
+
+
+async def check_github_cli():
+    """Return (authenticated, status) for gh, re-running gh auth status at most every GH_STATUS_TTL seconds"""
+    if time.monotonic() - _gh_status["ts"] < GH_STATUS_TTL:
+        return _gh_status["available"], _gh_status["status"]
+
+    try:
+        process = await asyncio.create_subprocess_exec(
+            'gh', 'auth', 'status',
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.DEVNULL
+        )
+        try:
+            await asyncio.wait_for(process.wait(), timeout=GH_STATUS_TIMEOUT)
+            available = process.returncode == 0
+            status = "authenticated" if available else "not authenticated"
+        except asyncio.TimeoutError:
+            process.kill()
+            available, status = False, "timeout"
+    except OSError:
+        available, status = False, "not available"
+
+    _gh_status.update(ts=time.monotonic(), available=available, status=status)
+    return available, status
+
+
+def get_cached_response(key: str):
+    """Return a response cached within STATUS_CACHE_TTL, or None"""
+    entry = _response_cache.get(key)
+    if entry and time.monotonic() - entry[0] < STATUS_CACHE_TTL:
+        return entry[1]
+    return None
+
+
+def cache_response(key: str, response: Dict[str, Any]) -> Dict[str, Any]:
+    """Store a response for reuse and return it"""
+    _response_cache[key] = (time.monotonic(), response)
+    return response
+
 
 @router.get("/status")
 async def get_system_status():
     """Get system health and status"""
-    try:
-        # Basic system info
-        system_info = {
-            "platform": os.uname().sysname,
-            "version": os.uname().release,
-            "architecture": os.uname().machine,
-            "hostname": os.uname().nodename
-        }
+    cached = get_cached_response("status")
+    if cached:
+        return cached
 
-        # CPU and Memory
-        cpu_percent = psutil.cpu_percent(interval=1)
+    try:
+        # CPU and Memory; the non-blocking reading covers the time since the previous request
+        cpu_percent = psutil.cpu_percent(interval=None)
         memory = psutil.virtual_memory()
         disk = psutil.disk_usage('/')
 
         # Check GitHub CLI availability
-        try:
-            result = subprocess.run(
-                ['gh', 'auth', 'status'],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-            gh_authenticated = result.returncode == 0
-            gh_status = "authenticated" if gh_authenticated else "not authenticated"
-        except:
-            gh_authenticated = False
-            gh_status = "not available"
+        gh_authenticated, gh_status = await check_github_cli()
 
-        return {
+        return cache_response("status", {
             "success": True,
             "data": {
-                "system": system_info,
+                "system": SYSTEM_INFO,
                 "resources": {
                     "cpu_percent": round(cpu_percent, 1),
                     "memory": {
@@ -73,7 +147,7 @@ async def get_system_status():
                 },
                 "health": "healthy" if cpu_percent < 80 and memory.percent < 80 else "warning"
             }
-        }
+        })
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -85,32 +159,11 @@ async def get_system_logs(lines: int = 50):
     try:
         # This is a basic implementation
         # In production, you'd want to use proper logging
-        logs = [
-            {
-                "timestamp": "2025-09-26T19:46:00Z",
-                "level": "INFO",
-                "message": "Web API server started successfully",
-                "service": "api"
-            },
-            {
-                "timestamp": "2025-09-26T19:45:30Z",
-                "level": "INFO",
-                "message": "Database initialized",
-                "service": "database"
-            },
-            {
-                "timestamp": "2025-09-26T19:45:15Z",
-                "level": "INFO",
-                "message": "WebSocket manager initialized",
-                "service": "websocket"
-            }
-        ]
-
         return {
             "success": True,
             "data": {
-                "logs": logs[:lines],
-                "total_lines": len(logs)
+                "logs": SAMPLE_LOGS[:lines],
+                "total_lines": SAMPLE_LOGS_COUNT
             }
         }
 
@@ -121,6 +174,10 @@ async def get_system_logs(lines: int = 50):
 @router.get("/performance")
 async def get_performance_metrics():
     """Get detailed performance metrics"""
+    cached = get_cached_response("performance")
+    if cached:
+        return cached
+
     try:
         # CPU details
         cpu_count = psutil.cpu_count()
@@ -135,10 +192,9 @@ async def get_performance_metrics():
         network = psutil.net_io_counters()
 
         # Process info
-        process = psutil.Process()
-        api_memory = process.memory_info()
+        api_memory = API_PROCESS.memory_info()
 
-        return {
+        return cache_response("performance", {
             "success": True,
             "data": {
                 "cpu": {
@@ -169,10 +225,10 @@ async def get_performance_metrics():
                 },
                 "api_process": {
                     "memory_mb": round(api_memory.rss / (1024 * 1024), 1),
-                    "cpu_percent": round(process.cpu_percent(), 1)
+                    "cpu_percent": round(API_PROCESS.cpu_percent(), 1)
                 }
             }
-        }
+        })
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
\ No newline at end of file
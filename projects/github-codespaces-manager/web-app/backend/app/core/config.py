@@ -3,9 +3,24 @@ Configuration management for GitHub Codespaces Manager Web API
 """
 
 import os
-from typing import List
+from functools import lru_cache
+from typing import Tuple
+from pydantic import Field
 from pydantic_settings import BaseSettings
 
+# Fast event loop and HTTP parser when installed (uvicorn[standard] ships both; uvloop is POSIX-only)
+try:
+    import uvloop  # noqa: F401
+    SERVER_LOOP = "uvloop"
+except ImportError:
+    SERVER_LOOP = "asyncio"
+
+try:
+    import httptools  # noqa: F401
+    SERVER_HTTP = "httptools"
+except ImportError:
+    SERVER_HTTP = "h11"
+
 
 class Settings(BaseSettings):
     """Application settings"""
@@ -16,12 +31,12 @@ class Settings(BaseSettings):
     DEBUG: bool = True
 
     # CORS settings
-    ALLOWED_ORIGINS: List[str] = [
+    ALLOWED_ORIGINS: Tuple[str, ...] = (
         "http://localhost:3000",
         "http://127.0.0.1:3000",
         "http://localhost:8080",
         "http://127.0.0.1:8080",
-    ]
+    )
 
     # Database configuration
     DATABASE_URL: str = "sqlite:///./codespaces_web.db"
@@ -31,9 +46,12 @@ class Settings(BaseSettings):
 
     # WebSocket configuration
     WS_HEARTBEAT_INTERVAL: int = 30
+    # Negotiate permessage-deflate; setup output and batched JSON frames compress well
+    WS_PER_MESSAGE_DEFLATE: bool = True
 
     # Security
-    SECRET_KEY: str = "your-secret-key-change-in-production"
+    # Random per process unless set in the environment or .env
+    SECRET_KEY: str = Field(default_factory=lambda: os.urandom(32).hex())
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60 * 24 * 7  # 7 days
 
     # File paths
@@ -48,5 +66,11 @@ class Settings(BaseSettings):
         case_sensitive = True
 
 
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Parse the environment and .env once per process"""
+    return Settings()
+
+
 # Global settings instance
-settings = Settings()
\ No newline at end of file
+settings = get_settings()
@@ -6,15 +6,45 @@ Wraps the existing GitHub CLI functionality for web use
 import os
 import sys
 import json
+import shlex
+import string
+import time
 import asyncio
+import logging
 import subprocess
-from typing import Dict, List, Any, Optional, Tuple
+import urllib.parse
+from types import MappingProxyType
+from typing import Callable, Dict, List, Any, Optional, Tuple, Union
 from datetime import datetime
 
 # Add the parent CLI directory to import existing modules
 CLI_DIR = os.path.join(os.path.dirname(__file__), '../../../../')
 sys.path.append(CLI_DIR)
 
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
+try:
+    import httpx
+    HAS_HTTPX = True
+except ImportError:
+    HAS_HTTPX = False
+
+try:
+    import ijson
+    HAS_IJSON = True
+except ImportError:
+    HAS_IJSON = False
+
+try:
+    import h2  # noqa: F401 - httpx negotiates HTTP/2 only when h2 is installed
+    HAS_HTTP2 = True
+except ImportError:
+    HAS_HTTP2 = False
+
 try:
     # Import existing GitHub manager
     from codespaces_advanced import CodespacesAdvanced
@@ -22,6 +52,80 @@ try:
 except ImportError:
     HAS_ADVANCED = False
 
+# Seconds a fetched codespace list is served before asking gh again
+CODESPACE_CACHE_TTL = 15
+# Repository listings change rarely and codespace actions never touch them
+REPO_CACHE_TTL = 60
+# Advanced metrics probe every running codespace over ssh, so a result is reused for this long
+METRICS_CACHE_TTL = 30
+GITHUB_API_URL = "https://api.github.com"
+# The REST API caps per_page here; longer listings are fetched page by page
+API_PAGE_SIZE = 100
+# Upper bound on concurrent gh child processes across all requests
+MAX_GH_PROCESSES = 8
+# Estimated hourly cost per machine type; unknown types are priced as the basic machine
+MACHINE_HOURLY_COST = MappingProxyType({
+    'basicLinux32gb': 0.18,
+    'standardLinux32gb': 0.36,
+    'premiumLinux64gb': 0.72,
+    'largeLinux128gb': 1.44,
+})
+DEFAULT_HOURLY_COST = 0.18
+CODESPACE_WEB_URL = "https://github.com/codespaces/"
+# Lowercases an operation name and folds shell-unsafe characters to '_' in one pass
+SCRIPT_PREFIX_TABLE = str.maketrans({**{c: '_' for c in ' /\\:;&|$`"\'()<>*?!#~{}[]'},
+                                     **{c: c.lower() for c in string.ascii_uppercase}})
+
+
+def codespace_api_path(codespace_name: str, action: str = '') -> str:
+    """REST path for a codespace; the name comes from the URL, so '/' and '..' can't reach other endpoints"""
+    return f"/user/codespaces/{urllib.parse.quote(codespace_name, safe='')}{action}"
+
+
+def nested_field(value: Any, key: str) -> Any:
+    """Pull key out of a REST object; gh --json already returns the plain value"""
+    return value.get(key, 'Unknown') if type(value) is dict else value
+
+
+def process_codespace_data(cs: Dict[str, Any]) -> Dict[str, Any]:
+    """Process raw codespace data for web consumption"""
+    # gh --json uses camelCase fields; the REST API uses snake_case and nests repository, machine and owner
+    get = cs.get
+    name = get('name', 'Unknown')
+    machine_type = get('machineName') or nested_field(get('machine') or {}, 'name')
+    return {
+        "name": name,
+        "display_name": get('displayName') or get('display_name') or name,
+        "repository": nested_field(get('repository', 'Unknown'), 'full_name'),
+        "state": get('state', 'Unknown'),
+        "machine_type": machine_type,
+        "created_at": get('createdAt') or get('created_at', ''),
+        "last_used_at": get('lastUsedAt') or get('last_used_at', ''),
+        "git_status": get('gitStatus') or get('git_status') or {},
+        "owner": nested_field(get('owner', 'Unknown'), 'login'),
+        "web_url": CODESPACE_WEB_URL + name,
+        "cost_estimate": MACHINE_HOURLY_COST.get(machine_type, DEFAULT_HOURLY_COST)
+    }
+
+
+class SyncGhRunner:
+    """Blocking gh runner with the interface CodespacesAdvanced expects; only called from worker threads"""
+
+    def __init__(self, cli_path: str, env: Dict[str, str]):
+        self.cli_path = cli_path
+        self.env = env
+
+    def run_gh_command(self, cmd: List[str], binary: bool = False) -> Tuple[bool, Any]:
+        """Run a gh command and return success status and output (raw bytes on success if binary)"""
+        try:
+            result = subprocess.run([self.cli_path, *cmd], stdin=subprocess.DEVNULL,
+                                    capture_output=True, env=self.env)
+            if result.returncode == 0:
+                return True, result.stdout if binary else result.stdout.decode('utf-8', 'replace').strip()
+            return False, result.stderr.decode('utf-8', 'replace').strip()
+        except Exception as e:
+            return False, str(e)
+
 
 class WebGitHubManager:
     """Web-friendly GitHub CLI manager"""
@@ -29,49 +133,205 @@ class WebGitHubManager:
     def __init__(self):
         self.cli_path = "gh"
         self.advanced = None
-        if HAS_ADVANCED:
-            self.advanced = CodespacesAdvanced(self)
-
-    async def run_gh_command(self, cmd: List[str]) -> Tuple[bool, str]:
-        """Run GitHub CLI command asynchronously"""
+        self._metrics_cache: Tuple[float, Optional[Dict[str, Any]]] = (0.0, None)
+        self._cache = {'ts': 0.0, 'list': None, 'by_name': {}}
+        self._cache_lock = asyncio.Lock()
+        self._repo_cache: Dict[int, Tuple[float, Dict[str, Any]]] = {}
+        self._repo_lock = asyncio.Lock()
+        self._gh_sem = asyncio.Semaphore(MAX_GH_PROCESSES)
+        self._gh_env: Optional[Dict[str, str]] = None
+        self._http = None
+        self._etags: Dict[str, Tuple[str, Any]] = {}
+
+    async def get_gh_env(self) -> Dict[str, str]:
+        """Environment for gh children with the auth token resolved once per process"""
+        if self._gh_env is None:
+            env = dict(os.environ)
+            if not env.get('GH_TOKEN') and not env.get('GITHUB_TOKEN'):
+                process = await asyncio.create_subprocess_exec(
+                    self.cli_path, 'auth', 'token',
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.DEVNULL
+                )
+                stdout, _ = await process.communicate()
+                if process.returncode == 0 and stdout.strip():
+                    env['GH_TOKEN'] = stdout.decode().strip()
+            self._gh_env = env
+        return self._gh_env
+
+    async def use_rest_api(self) -> bool:
+        """True when requests can go straight to the REST API instead of forking gh"""
+        if not HAS_HTTPX:
+            return False
+        env = await self.get_gh_env()
+        return bool(env.get('GH_TOKEN') or env.get('GITHUB_TOKEN'))
+
+    async def get_http_client(self) -> "httpx.AsyncClient":
+        """Shared pooled API client, built on first use"""
+        if self._http is None:
+            env = await self.get_gh_env()
+            token = env.get('GH_TOKEN') or env.get('GITHUB_TOKEN')
+            self._http = httpx.AsyncClient(
+                base_url=GITHUB_API_URL,
+                headers={
+                    'Accept': 'application/vnd.github+json',
+                    'Authorization': f'Bearer {token}',
+                },
+                http2=HAS_HTTP2,
+                limits=httpx.Limits(max_keepalive_connections=20),
+            )
+        return self._http
+
+    async def api_get(self, path: str) -> Tuple[bool, Any]:
+        """GET a REST endpoint over a kept-alive connection, revalidating with the last ETag"""
+        client = await self.get_http_client()
+
+        headers = {}
+        cached = self._etags.get(path)
+        if cached:
+            headers['If-None-Match'] = cached[0]
+
+        response = await client.get(path, headers=headers)
+        # 304s carry no body and don't count against the rate limit
+        if response.status_code == 304 and cached:
+            return True, cached[1]
+        if response.status_code != 200:
+            return False, response.text
+
+        data = json_loads(response.content)
+        etag = response.headers.get('ETag')
+        if etag:
+            self._etags[path] = (etag, data)
+        return True, data
+
+    async def api_request(self, method: str, path: str, payload: Optional[Dict[str, Any]] = None) -> Tuple[bool, Any]:
+        """Send a mutating REST request, returning the decoded body (or error text)"""
+        client = await self.get_http_client()
+        response = await client.request(method, path, json=payload)
+        if not response.is_success:
+            return False, response.text
+        return True, json_loads(response.content) if response.content else None
+
+    async def close(self):
+        """Release the kept-alive API connection"""
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+
+    async def run_gh_bytes(self, cmd: List[str], input_data: Optional[Union[str, bytes]] = None) -> Tuple[bool, bytes]:
+        """Run GitHub CLI command and return raw stdout (or stderr on failure)"""
         try:
-            full_cmd = [self.cli_path] + cmd
+            # Prebuilt scripts arrive already encoded
+            if isinstance(input_data, str):
+                input_data = input_data.encode()
+            env = await self.get_gh_env()
+            async with self._gh_sem:
+                process = await asyncio.create_subprocess_exec(
+                    self.cli_path, *cmd,
+                    stdin=asyncio.subprocess.PIPE if input_data is not None else asyncio.subprocess.DEVNULL,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                    env=env
+                )
+                stdout, stderr = await process.communicate(input_data)
+
+            if process.returncode != 0:
+                return False, stderr.strip()
+            return True, stdout
 
-            # Run command asynchronously
+        except Exception as e:
+            return False, f"Command execution error: {str(e)}".encode()
+
+    async def run_gh_command(self, cmd: List[str], input_data: Optional[Union[str, bytes]] = None) -> Tuple[bool, str]:
+        """Run GitHub CLI command asynchronously, optionally feeding input_data on stdin"""
+        success, output = await self.run_gh_bytes(cmd, input_data)
+        return success, output.decode('utf-8', 'replace').strip()
+
+    async def run_gh_items(self, cmd: List[str], transform: Callable[[Any], Any]) -> Tuple[bool, Any]:
+        """Run a gh command that prints a JSON array, transforming each element as it is parsed"""
+        if not HAS_IJSON:
+            success, output = await self.run_gh_bytes(cmd)
+            if not success:
+                return False, output.decode('utf-8', 'replace')
+            return True, [transform(item) for item in (json_loads(output) if output.strip() else [])]
+
+        env = await self.get_gh_env()
+        async with self._gh_sem:
             process = await asyncio.create_subprocess_exec(
-                *full_cmd,
+                self.cli_path, *cmd,
+                stdin=asyncio.subprocess.DEVNULL,
                 stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
+                stderr=asyncio.subprocess.PIPE,
+                env=env
             )
 
-            stdout, stderr = await process.communicate()
-
-            success = process.returncode == 0
-            output = stdout.decode('utf-8') if success else stderr.decode('utf-8')
+            async def collect():
+                return [transform(item) async for item in ijson.items(process.stdout, 'item', use_float=True)]
 
-            return success, output.strip()
+            # Records are parsed as stdout arrives instead of after the whole array is buffered
+            items, stderr = await asyncio.gather(collect(), process.stderr.read(), return_exceptions=True)
+            await process.wait()
 
-        except Exception as e:
-            return False, f"Command execution error: {str(e)}"
+        if process.returncode != 0:
+            return False, stderr.decode('utf-8', 'replace').strip() if isinstance(stderr, bytes) else str(stderr)
+        if isinstance(items, Exception):
+            raise items
+        return True, items
 
     async def get_codespaces(self) -> Dict[str, Any]:
-        """Get list of all codespaces"""
+        """Get list of all codespaces, served from a short-lived cache"""
+        loop = asyncio.get_running_loop()
+        if self._cache['list'] is not None and loop.time() - self._cache['ts'] < CODESPACE_CACHE_TTL:
+            return self._cache['list']
+
+        # Concurrent requests wait for one gh call instead of each starting their own
+        async with self._cache_lock:
+            if self._cache['list'] is not None and loop.time() - self._cache['ts'] < CODESPACE_CACHE_TTL:
+                return self._cache['list']
+
+            result = await self.fetch_codespaces()
+            if result.get("success"):
+                self._cache['list'] = result
+                self._cache['by_name'] = {cs['name']: cs for cs in result['codespaces']}
+                self._cache['ts'] = loop.time()
+            return result
+
+    async def get_codespace_by_name(self, codespace_name: str) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        """Look up one codespace by name, returning (codespace, error)"""
+        result = await self.get_codespaces()
+        if "error" in result:
+            return None, result["error"]
+        return self._cache['by_name'].get(codespace_name), None
+
+    def invalidate_cache(self):
+        """Drop the cached codespace list after a codespace changes"""
+        self._cache['list'] = None
+        self._cache['by_name'] = {}
+
+    async def fetch_codespaces(self) -> Dict[str, Any]:
+        """Fetch the codespace list from gh"""
         try:
-            success, output = await self.run_gh_command([
-                'codespace', 'list', '--json',
-                'name,repository,state,displayName,gitStatus,machineName,lastUsedAt,createdAt,owner'
-            ])
-
-            if not success:
-                return {"error": output, "codespaces": []}
-
-            codespaces_data = json.loads(output) if output.strip() else []
-
-            # Process each codespace
-            processed_codespaces = []
-            for cs in codespaces_data:
-                processed_cs = self._process_codespace_data(cs)
-                processed_codespaces.append(processed_cs)
+            if await self.use_rest_api():
+                # Each page revalidates with its own ETag; a short page is the last one
+                processed_codespaces = []
+                page = 1
+                while True:
+                    success, data = await self.api_get(f'/user/codespaces?per_page={API_PAGE_SIZE}&page={page}')
+                    if not success:
+                        return {"error": data, "codespaces": []}
+                    batch = data.get('codespaces', [])
+                    processed_codespaces.extend(process_codespace_data(cs) for cs in batch)
+                    if len(batch) < API_PAGE_SIZE:
+                        break
+                    page += 1
+            else:
+                success, processed_codespaces = await self.run_gh_items([
+                    'codespace', 'list', '--json',
+                    'name,repository,state,displayName,gitStatus,machineName,lastUsedAt,createdAt,owner'
+                ], process_codespace_data)
+
+                if not success:
+                    return {"error": processed_codespaces, "codespaces": []}
 
             return {
                 "codespaces": processed_codespaces,
@@ -82,55 +342,27 @@ class WebGitHubManager:
         except Exception as e:
             return {"error": str(e), "codespaces": []}
 
-    def _process_codespace_data(self, cs: Dict[str, Any]) -> Dict[str, Any]:
-        """Process raw codespace data for web consumption"""
-        # Handle repository field (string vs object)
-        repository = cs.get('repository', 'Unknown')
-        if isinstance(repository, dict):
-            repository = repository.get('full_name', 'Unknown')
-
-        # Process timestamps
-        created_at = cs.get('createdAt', cs.get('created_at', ''))
-        last_used_at = cs.get('lastUsedAt', cs.get('last_used_at', ''))
-
-        return {
-            "name": cs.get('name', 'Unknown'),
-            "display_name": cs.get('displayName', cs.get('name', 'Unknown')),
-            "repository": repository,
-            "state": cs.get('state', 'Unknown'),
-            "machine_type": cs.get('machineName', cs.get('machine', {}).get('name', 'Unknown')),
-            "created_at": created_at,
-            "last_used_at": last_used_at,
-            "git_status": cs.get('gitStatus', {}),
-            "owner": cs.get('owner', 'Unknown'),
-            "web_url": f"https://github.com/codespaces/{cs.get('name', '')}",
-            "cost_estimate": self._estimate_cost(cs.get('machineName', 'basicLinux32gb'))
-        }
-
-    def _estimate_cost(self, machine_type: str) -> float:
-        """Estimate hourly cost for machine type"""
-        cost_map = {
-            'basicLinux32gb': 0.18,
-            'standardLinux32gb': 0.36,
-            'premiumLinux64gb': 0.72,
-            'largeLinux128gb': 1.44,
-        }
-        return cost_map.get(machine_type, 0.18)
-
     async def create_codespace(self, repo: str, branch: str = None,
                              machine: str = None, region: str = None) -> Dict[str, Any]:
         """Create a new codespace"""
         try:
-            cmd = ['codespace', 'create', '--repo', repo]
-
-            if branch:
-                cmd.extend(['--branch', branch])
-            if machine:
-                cmd.extend(['--machine', machine])
-            if region:
-                cmd.extend(['--location', region])
-
-            success, output = await self.run_gh_command(cmd)
+            if await self.use_rest_api():
+                # The web regions (EuropeWest, ...) are geo values; 'location' is the deprecated field with another vocabulary
+                payload = {k: v for k, v in (('ref', branch), ('machine', machine), ('geo', region)) if v}
+                success, data = await self.api_request('POST', f'/repos/{urllib.parse.quote(repo)}/codespaces', payload)
+                output = data.get('name', '') if success and data else data
+            else:
+                cmd = ['codespace', 'create', '--repo', repo]
+
+                if branch:
+                    cmd.extend(['--branch', branch])
+                if machine:
+                    cmd.extend(['--machine', machine])
+                if region:
+                    cmd.extend(['--location', region])
+
+                success, output = await self.run_gh_command(cmd)
+            self.invalidate_cache()
 
             return {
                 "success": success,
@@ -145,13 +377,18 @@ class WebGitHubManager:
             return {"success": False, "error": str(e)}
 
     async def start_codespace(self, codespace_name: str) -> Dict[str, Any]:
-        """Start a codespace (via SSH connection)"""
+        """Start a codespace (via the REST API, or an SSH connection through gh)"""
         try:
-            # Codespaces auto-start when you connect to them
-            success, output = await self.run_gh_command([
-                'codespace', 'ssh', '--codespace', codespace_name,
-                '--', 'echo "Codespace started successfully"'
-            ])
+            if await self.use_rest_api():
+                success, data = await self.api_request('POST', codespace_api_path(codespace_name, '/start'))
+                output = "Codespace started successfully" if success else data
+            else:
+                # Codespaces auto-start when you connect to them
+                success, output = await self.run_gh_command([
+                    'codespace', 'ssh', '--codespace', codespace_name,
+                    '--', 'echo "Codespace started successfully"'
+                ])
+            self.invalidate_cache()
 
             return {
                 "success": success,
@@ -166,9 +403,14 @@ class WebGitHubManager:
     async def stop_codespace(self, codespace_name: str) -> Dict[str, Any]:
         """Stop a codespace"""
         try:
-            success, output = await self.run_gh_command([
-                'codespace', 'stop', '--codespace', codespace_name
-            ])
+            if await self.use_rest_api():
+                success, data = await self.api_request('POST', codespace_api_path(codespace_name, '/stop'))
+                output = "Codespace stopped" if success else data
+            else:
+                success, output = await self.run_gh_command([
+                    'codespace', 'stop', '--codespace', codespace_name
+                ])
+            self.invalidate_cache()
 
             return {
                 "success": success,
@@ -183,9 +425,14 @@ class WebGitHubManager:
     async def delete_codespace(self, codespace_name: str) -> Dict[str, Any]:
         """Delete a codespace"""
         try:
-            success, output = await self.run_gh_command([
-                'codespace', 'delete', '--codespace', codespace_name, '--force'
-            ])
+            if await self.use_rest_api():
+                success, data = await self.api_request('DELETE', codespace_api_path(codespace_name))
+                output = "Codespace deleted" if success else data
+            else:
+                success, output = await self.run_gh_command([
+                    'codespace', 'delete', '--codespace', codespace_name, '--force'
+                ])
+            self.invalidate_cache()
 
             return {
                 "success": success,
@@ -198,26 +445,62 @@ class WebGitHubManager:
             return {"success": False, "error": str(e)}
 
     async def get_repositories(self, limit: int = 20) -> Dict[str, Any]:
-        """Get user's repositories"""
+        """Get user's repositories, served from a short-lived cache keyed by limit"""
+        loop = asyncio.get_running_loop()
+        cached = self._repo_cache.get(limit)
+        if cached and loop.time() - cached[0] < REPO_CACHE_TTL:
+            return cached[1]
+
+        async with self._repo_lock:
+            cached = self._repo_cache.get(limit)
+            if cached and loop.time() - cached[0] < REPO_CACHE_TTL:
+                return cached[1]
+
+            result = await self.fetch_repositories(limit)
+            if result.get("success"):
+                self._repo_cache[limit] = (loop.time(), result)
+            return result
+
+    async def fetch_repositories(self, limit: int) -> Dict[str, Any]:
+        """Fetch the repository list from the REST API or gh"""
         try:
-            success, output = await self.run_gh_command([
-                'repo', 'list', '--limit', str(limit)
+            if await self.use_rest_api():
+                # affiliation=owner matches gh repo list, which skips collaborator and org repos
+                # per_page stays fixed across requests so page numbers map to consistent offsets
+                per_page = min(API_PAGE_SIZE, limit)
+                data = []
+                page = 1
+                while len(data) < limit:
+                    success, batch = await self.api_get(
+                        f'/user/repos?affiliation=owner&sort=updated&per_page={per_page}&page={page}')
+                    if not success:
+                        return {"error": batch, "repositories": []}
+                    data.extend(batch)
+                    if len(batch) < per_page:
+                        break
+                    page += 1
+                repos = [{
+                    "name": repo["full_name"],
+                    "description": repo.get("description") or "",
+                    "visibility": repo.get("visibility") or ("private" if repo.get("private") else "public"),
+                    "updated_at": repo.get("updated_at") or ""
+                } for repo in data[:limit]]
+                return {"repositories": repos, "count": len(repos), "success": True}
+
+            success, output = await self.run_gh_bytes([
+                'repo', 'list', '--limit', str(limit),
+                '--json', 'nameWithOwner,description,visibility,updatedAt'
             ])
 
             if not success:
-                return {"error": output, "repositories": []}
-
-            repos = []
-            for line in output.strip().split('\n'):
-                if line.strip():
-                    parts = line.split('\t')
-                    if len(parts) >= 3:
-                        repos.append({
-                            "name": parts[0],
-                            "description": parts[1],
-                            "visibility": parts[2],
-                            "updated_at": parts[3] if len(parts) > 3 else ""
-                        })
+                return {"error": output.decode('utf-8', 'replace'), "repositories": []}
+
+            repos = [{
+                "name": repo["nameWithOwner"],
+                "description": repo.get("description") or "",
+                "visibility": (repo.get("visibility") or "").lower(),
+                "updated_at": repo.get("updatedAt") or ""
+            } for repo in (json_loads(output) if output.strip() else [])]
 
             return {
                 "repositories": repos,
@@ -228,33 +511,23 @@ class WebGitHubManager:
         except Exception as e:
             return {"error": str(e), "repositories": []}
 
-    async def execute_setup_script(self, codespace_name: str, script: str,
+    async def execute_setup_script(self, codespace_name: str, script: Union[str, bytes],
                                  operation_name: str) -> Dict[str, Any]:
         """Execute setup script in codespace"""
         try:
-            import time
-
             # Create unique script name
-            prefix = operation_name.lower().replace(' ', '_').replace('/', '_')
-            script_name = f'{prefix}_{int(time.time())}.sh'
-
-            # Create script via SSH
-            create_cmd = [
-                'codespace', 'ssh', '--codespace', codespace_name, '--',
-                f"cat > {script_name} << 'SCRIPT_EOF'\n{script}\nSCRIPT_EOF"
-            ]
+            prefix = operation_name.translate(SCRIPT_PREFIX_TABLE)
+            script_name = f'/tmp/{prefix}_{int(time.time())}.sh'
+            remote = shlex.quote(script_name)
 
-            success, output = await self.run_gh_command(create_cmd)
-            if not success:
-                return {"success": False, "error": f"Failed to create script: {output}"}
-
-            # Execute script
+            # Stream the script over stdin so argv stays small, then run and remove it in the same session.
+            # It runs from a file rather than 'bash -s' so commands inside it can't consume the script from stdin.
             exec_cmd = [
                 'codespace', 'ssh', '--codespace', codespace_name, '--',
-                f'chmod +x {script_name} && bash {script_name} && rm {script_name}'
+                f'cat > {remote} && bash {remote}; rc=$?; rm -f {remote}; exit $rc'
             ]
 
-            success, output = await self.run_gh_command(exec_cmd)
+            success, output = await self.run_gh_command(exec_cmd, input_data=script)
 
             return {
                 "success": success,
@@ -269,12 +542,27 @@ class WebGitHubManager:
     async def get_metrics(self) -> Dict[str, Any]:
         """Get codespace metrics using advanced module"""
         try:
-            if not self.advanced:
+            if not HAS_ADVANCED:
                 return {"error": "Advanced metrics not available"}
 
-            # Get metrics (this might need to be made async in the future)
-            metrics = self.advanced.get_codespace_metrics()
+            loop = asyncio.get_running_loop()
+            cached_at, cached = self._metrics_cache
+            if cached is not None and loop.time() - cached_at < METRICS_CACHE_TTL:
+                return cached
+
+            if self.advanced is None:
+                runner = SyncGhRunner(self.cli_path, await self.get_gh_env())
+                self.advanced = CodespacesAdvanced(logging.getLogger(__name__), runner)
+
+            # The advanced module is synchronous and shells out per codespace; keep it off the event loop
+            metrics = await asyncio.to_thread(self.advanced.get_codespace_metrics)
+            if "error" not in metrics:
+                self._metrics_cache = (loop.time(), metrics)
             return metrics
 
         except Exception as e:
-            return {"error": str(e)}
\ No newline at end of file
+            return {"error": str(e)}
+
+
+# One manager per process so every router shares the codespace cache and its invalidation
+github_manager = WebGitHubManager()
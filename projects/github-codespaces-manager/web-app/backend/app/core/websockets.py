@@ -3,74 +3,149 @@ WebSocket connection manager for real-time updates
 """
 
 import json
+import time
 import asyncio
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, NamedTuple, Union
 from fastapi import WebSocket
 from datetime import datetime
 
+# Payload values orjson/json can't encode natively (e.g. Decimal, Path) are sent as their str()
+try:
+    import orjson
+
+    def json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj, default=str).decode()
+except ImportError:
+    def json_dumps(obj: Any) -> str:
+        return json.dumps(obj, default=str)
+
+# Non-terminal operation updates are held this long so only the latest state per operation goes out
+UPDATE_DEBOUNCE = 0.05
+TERMINAL_STATUSES = frozenset({"completed", "failed"})
+# Broadcasts queued within this window are sent to a client as one frame, at most WS_BATCH_MAX at a time
+WS_BATCH_WINDOW = 0.005
+WS_BATCH_MAX = 64
+# Frames buffered per client; a client that falls further behind loses its oldest frames
+WS_QUEUE_MAX = 256
+
+# Message timestamps have one-second resolution; the formatted string is reused until the second changes
+_timestamp_cache = [0, ""]
+
+
+def now_iso() -> str:
+    """Current local time as an ISO string, formatted at most once per second"""
+    second = int(time.time())
+    if second != _timestamp_cache[0]:
+        _timestamp_cache[0] = second
+        _timestamp_cache[1] = datetime.fromtimestamp(second).isoformat()
+    return _timestamp_cache[1]
+
+
+class DirectFrame(NamedTuple):
+    """A frame for one client, sent exactly as given and never merged into a batch"""
+    data: Union[str, bytes]
+
+
+def enqueue(queue: asyncio.Queue, item: Union[str, DirectFrame]):
+    """Queue an outgoing frame, dropping the oldest one if the client has fallen too far behind"""
+    if queue.full():
+        queue.get_nowait()
+    queue.put_nowait(item)
+
 
 class WebSocketManager:
     """Manages WebSocket connections for real-time updates"""
 
     def __init__(self):
-        self.active_connections: List[WebSocket] = []
-        self.connection_data: Dict[WebSocket, Dict[str, Any]] = {}
+        # One entry per client: metadata plus its outgoing queue and sender task
+        self.connections: Dict[WebSocket, Dict[str, Any]] = {}
+        self._pending_updates: Dict[str, Dict[str, Any]] = {}
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
 
     async def connect(self, websocket: WebSocket):
         """Accept new WebSocket connection"""
         await websocket.accept()
-        self.active_connections.append(websocket)
-        self.connection_data[websocket] = {
+        queue = asyncio.Queue(maxsize=WS_QUEUE_MAX)
+        connection = {
             "connected_at": datetime.now(),
             "user_id": None,  # Can be set later with authentication
+            "queue": queue,
+            "sender": None,
         }
+        self.connections[websocket] = connection
 
-        # Send welcome message
-        await self.send_personal_message(json.dumps({
+        # The welcome message goes through the bounded queue too, so the sender task is the socket's only writer
+        queue.put_nowait(json_dumps({
             "type": "connection",
             "status": "connected",
             "message": "Connected to GitHub Codespaces Manager",
-            "timestamp": datetime.now().isoformat()
-        }), websocket)
+            "timestamp": now_iso()
+        }))
+        connection["sender"] = asyncio.create_task(self.send_loop(websocket, queue))
 
     def disconnect(self, websocket: WebSocket):
         """Remove WebSocket connection"""
-        if websocket in self.active_connections:
-            self.active_connections.remove(websocket)
-        if websocket in self.connection_data:
-            del self.connection_data[websocket]
+        connection = self.connections.pop(websocket, None)
+        sender = connection and connection["sender"]
+        if sender and sender is not asyncio.current_task():
+            sender.cancel()
+
+    async def send_loop(self, websocket: WebSocket, queue: asyncio.Queue):
+        """Drain a client's queue, sending everything that arrives within WS_BATCH_WINDOW as one frame"""
+        held = None
+        while True:
+            item = held if held is not None else await queue.get()
+            held = None
+            if isinstance(item, DirectFrame):
+                payload = item.data
+            else:
+                batch = [item]
+                await asyncio.sleep(WS_BATCH_WINDOW)
+                while len(batch) < WS_BATCH_MAX and not queue.empty():
+                    item = queue.get_nowait()
+                    if isinstance(item, DirectFrame):
+                        # Sent on its own right after this batch, keeping queue order
+                        held = item
+                        break
+                    batch.append(item)
+                # Messages are queued already encoded, so a batch is spliced together without re-encoding
+                payload = batch[0] if len(batch) == 1 else '{"type":"batch","updates":[' + ','.join(batch) + ']}'
+
+            try:
+                if isinstance(payload, bytes):
+                    await websocket.send_bytes(payload)
+                else:
+                    await websocket.send_text(payload)
+            except Exception:
+                self.disconnect(websocket)
+                return
 
     async def send_personal_message(self, message: str, websocket: WebSocket):
-        """Send message to specific connection"""
-        try:
-            await websocket.send_text(message)
-        except:
-            # Connection might be closed, remove it
-            self.disconnect(websocket)
+        """Queue a text frame for a specific connection"""
+        connection = self.connections.get(websocket)
+        if connection:
+            enqueue(connection["queue"], DirectFrame(message))
+
+    async def send_personal_bytes(self, data: bytes, websocket: WebSocket):
+        """Queue a binary frame for a specific connection"""
+        connection = self.connections.get(websocket)
+        if connection:
+            enqueue(connection["queue"], DirectFrame(data))
 
     async def broadcast(self, message: Dict[str, Any]):
-        """Broadcast message to all connected clients"""
-        message_str = json.dumps({
+        """Queue message for every connected client; each client's sender batches it into a frame"""
+        # Encode once for all clients; large payloads such as script output aren't re-serialized per connection
+        encoded = json_dumps({
             **message,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": now_iso()
         })
+        for connection in tuple(self.connections.values()):
+            enqueue(connection["queue"], encoded)
 
-        # Send to all connections
-        disconnected = []
-        for connection in self.active_connections:
-            try:
-                await connection.send_text(message_str)
-            except:
-                disconnected.append(connection)
-
-        # Clean up disconnected clients
-        for connection in disconnected:
-            self.disconnect(connection)
-
-    async def send_operation_update(self, operation_id: str, status: str,
-                                  progress: int = None, message: str = None,
-                                  data: Dict[str, Any] = None):
-        """Send operation status update"""
+    def build_operation_update(self, operation_id: str, status: str,
+                               progress: int = None, message: str = None,
+                               data: Dict[str, Any] = None) -> Dict[str, Any]:
+        """Build an operation_update message"""
         update = {
             "type": "operation_update",
             "operation_id": operation_id,
@@ -83,8 +158,37 @@ class WebSocketManager:
             update["message"] = message
         if data:
             update["data"] = data
+        return update
 
-        await self.broadcast(update)
+    async def send_operation_updates(self, updates: List[Dict[str, Any]]):
+        """Send several operation updates to every client in a single frame"""
+        if updates:
+            await self.broadcast({"type": "batch", "updates": updates})
+
+    async def send_operation_update(self, operation_id: str, status: str,
+                                  progress: int = None, message: str = None,
+                                  data: Dict[str, Any] = None, immediate: bool = False):
+        """Send operation status update, coalescing rapid intermediate states"""
+        update = self.build_operation_update(operation_id, status, progress, message, data)
+
+        # Terminal states supersede anything still queued for the operation
+        if immediate or status in TERMINAL_STATUSES:
+            self._pending_updates.pop(operation_id, None)
+            await self.broadcast(update)
+            return
+
+        self._pending_updates[operation_id] = update
+        if self._flush_handle is None:
+            loop = asyncio.get_running_loop()
+            self._flush_handle = loop.call_later(
+                UPDATE_DEBOUNCE, lambda: asyncio.ensure_future(self.flush_operation_updates()))
+
+    async def flush_operation_updates(self):
+        """Broadcast the latest queued state of each pending operation"""
+        self._flush_handle = None
+        pending, self._pending_updates = self._pending_updates, {}
+        for update in pending.values():
+            await self.broadcast(update)
 
     async def send_codespace_update(self, codespace_name: str, action: str,
                                   status: str, data: Dict[str, Any] = None):
@@ -123,7 +227,7 @@ class WebSocketManager:
 
     def get_connection_count(self) -> int:
         """Get number of active connections"""
-        return len(self.active_connections)
+        return len(self.connections)
 
     def get_connection_info(self) -> List[Dict[str, Any]]:
         """Get information about all connections"""
@@ -132,5 +236,9 @@ class WebSocketManager:
                 "connected_at": data["connected_at"].isoformat(),
                 "user_id": data["user_id"],
             }
-            for data in self.connection_data.values()
-        ]
\ No newline at end of file
+            for data in self.connections.values()
+        ]
+
+
+# Shared by the /ws endpoint and every router, so API updates reach connected clients
+websocket_manager = WebSocketManager()
@@ -6,20 +6,28 @@ FastAPI-based REST API with WebSocket support for real-time operations
 
 import os
 import sys
+import hashlib
 import uvicorn
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect
+from fastapi import FastAPI, Request, Response, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, JSONResponse
 from contextlib import asynccontextmanager
 
+try:
+    import orjson  # noqa: F401 - ORJSONResponse needs it at render time
+    from fastapi.responses import ORJSONResponse as DefaultResponse
+except ImportError:
+    DefaultResponse = JSONResponse
+
 # Add parent directory to path to import existing modules
 sys.path.append(os.path.join(os.path.dirname(__file__), '../../../'))
 
-from app.core.config import settings
-from app.core.websockets import WebSocketManager
+from app.core.config import settings, SERVER_LOOP, SERVER_HTTP
+from app.core.websockets import websocket_manager
+from app.core.github_manager import github_manager
 from app.api import codespaces, languages, metrics, system
-from app.models.database import init_database
+from app.models.database import init_database, close_database
 
 
 @asynccontextmanager
@@ -34,6 +42,8 @@ async def lifespan(app: FastAPI):
     yield
 
     # Shutdown
+    await github_manager.close()
+    await close_database()
     print("🛑 GitHub Codespaces Manager Web API shutting down")
 
 
@@ -44,7 +54,8 @@ app = FastAPI(
     version="2.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=DefaultResponse
 )
 
 # Configure CORS
@@ -56,9 +67,6 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# WebSocket manager for real-time updates
-websocket_manager = WebSocketManager()
-
 # Include API routers
 app.include_router(codespaces.router, prefix="/api/codespaces", tags=["codespaces"])
 app.include_router(languages.router, prefix="/api/languages", tags=["languages"])
@@ -69,10 +77,8 @@ app.include_router(system.router, prefix="/api/system", tags=["system"])
 app.mount("/static", StaticFiles(directory="static"), name="static")
 
 
-@app.get("/", response_class=HTMLResponse)
-async def root():
-    """Serve the main application"""
-    return """
+# The landing page never changes at runtime, so it is encoded and fingerprinted once
+ROOT_HTML = """
     <!DOCTYPE html>
     <html>
     <head>
@@ -102,7 +108,19 @@ async def root():
         </div>
     </body>
     </html>
-    """
+""".encode()
+ROOT_HTML_HEADERS = {
+    "Cache-Control": "public, max-age=3600",
+    "ETag": f'"{hashlib.sha1(ROOT_HTML).hexdigest()}"',
+}
+
+
+@app.get("/", response_class=HTMLResponse)
+async def root(request: Request):
+    """Serve the main application"""
+    if request.headers.get("if-none-match") == ROOT_HTML_HEADERS["ETag"]:
+        return Response(status_code=304, headers=ROOT_HTML_HEADERS)
+    return Response(content=ROOT_HTML, media_type="text/html", headers=ROOT_HTML_HEADERS)
 
 
 @app.websocket("/ws")
@@ -112,9 +130,14 @@ async def websocket_endpoint(websocket: WebSocket):
     try:
         while True:
             # Keep connection alive and handle incoming messages
-            data = await websocket.receive_text()
-            # Echo back for testing
-            await websocket_manager.send_personal_message(f"Echo: {data}", websocket)
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                raise WebSocketDisconnect(message.get("code", 1000))
+            # Echo back for testing; binary frames are passed through without a str round-trip
+            if message.get("bytes") is not None:
+                await websocket_manager.send_personal_bytes(b"Echo: " + message["bytes"], websocket)
+            else:
+                await websocket_manager.send_personal_message(f"Echo: {message.get('text')}", websocket)
     except WebSocketDisconnect:
         websocket_manager.disconnect(websocket)
 
@@ -135,5 +158,10 @@ if __name__ == "__main__":
         host=settings.HOST,
         port=settings.PORT,
         reload=settings.DEBUG,
-        access_log=True
+        access_log=settings.DEBUG,
+        server_header=False,
+        loop=SERVER_LOOP,
+        http=SERVER_HTTP,
+        ws="websockets",
+        ws_per_message_deflate=settings.WS_PER_MESSAGE_DEFLATE
     )
\ No newline at end of file
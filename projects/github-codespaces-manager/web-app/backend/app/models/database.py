@@ -3,20 +3,78 @@ Database models and initialization for the web application
 """
 
 import sqlite3
+import json
+import asyncio
 import aiosqlite
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 
+# Queued log rows are written together: up to LOG_BATCH_MAX rows per commit, gathered over LOG_FLUSH_INTERVAL
+LOG_BATCH_MAX = 256
+LOG_FLUSH_INTERVAL = 0.05
+
+try:
+    import orjson
+
+    def json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj, default=str).decode()
+
+    json_loads = orjson.loads
+except ImportError:
+    def json_dumps(obj: Any) -> str:
+        return json.dumps(obj, default=str)
+
+    json_loads = json.loads
+
+
+def decode_json_column(value: Optional[str]) -> Any:
+    """Parse a JSON TEXT column; rows written before JSON storage come back unchanged"""
+    if value is None:
+        return None
+    try:
+        return json_loads(value)
+    except ValueError:
+        return value
+
 
 class Database:
     """Simple SQLite database manager for the web application"""
 
     def __init__(self, db_path: str = "codespaces_web.db"):
         self.db_path = db_path
+        self._db: Optional[aiosqlite.Connection] = None
+        # Writers share the one connection, so their execute/commit pairs must not interleave
+        self._write_lock = asyncio.Lock()
+        self._log_queue: asyncio.Queue = asyncio.Queue()
+        self._log_writer: Optional[asyncio.Task] = None
+
+    async def connection(self) -> aiosqlite.Connection:
+        """Long-lived connection, opened and tuned on first use"""
+        if self._db is None:
+            db = await aiosqlite.connect(self.db_path)
+            db.row_factory = aiosqlite.Row
+            await db.execute("PRAGMA journal_mode=WAL")
+            await db.execute("PRAGMA synchronous=NORMAL")
+            await db.execute("PRAGMA temp_store=MEMORY")
+            await db.execute("PRAGMA mmap_size=268435456")
+            self._db = db
+        return self._db
+
+    async def close(self):
+        """Flush queued logs and close the long-lived connection"""
+        if self._log_writer is not None:
+            # The writer stops once it reaches this marker, after writing everything queued before it
+            self._log_queue.put_nowait(None)
+            await self._log_writer
+            self._log_writer = None
+        if self._db is not None:
+            await self._db.close()
+            self._db = None
 
     async def init_database(self):
         """Initialize database tables"""
-        async with aiosqlite.connect(self.db_path) as db:
+        db = await self.connection()
+        async with self._write_lock:
             # Sessions table for tracking operations
             await db.execute("""
                 CREATE TABLE IF NOT EXISTS sessions (
@@ -62,94 +120,126 @@ class Database:
                 )
             """)
 
+            # History queries filter by type and time range
+            await db.execute("""
+                CREATE INDEX IF NOT EXISTS idx_metrics_type_ts ON metrics_history(metric_type, timestamp)
+            """)
+
             await db.commit()
 
+        if self._log_writer is None:
+            self._log_writer = asyncio.create_task(self.log_writer())
+
     async def create_session(self, session_id: str, operation_type: str,
                            codespace_name: str = None, data: Dict[str, Any] = None) -> int:
         """Create a new operation session"""
-        async with aiosqlite.connect(self.db_path) as db:
+        db = await self.connection()
+        async with self._write_lock:
             cursor = await db.execute("""
                 INSERT INTO sessions (session_id, operation_type, codespace_name, status, data)
                 VALUES (?, ?, ?, 'started', ?)
-            """, (session_id, operation_type, codespace_name, str(data) if data else None))
+            """, (session_id, operation_type, codespace_name, json_dumps(data) if data else None))
 
             await db.commit()
             return cursor.lastrowid
 
     async def update_session_status(self, session_id: str, status: str, data: Dict[str, Any] = None):
         """Update session status"""
-        async with aiosqlite.connect(self.db_path) as db:
+        db = await self.connection()
+        async with self._write_lock:
             await db.execute("""
                 UPDATE sessions
                 SET status = ?, updated_at = CURRENT_TIMESTAMP, data = ?
                 WHERE session_id = ?
-            """, (status, str(data) if data else None, session_id))
+            """, (status, json_dumps(data) if data else None, session_id))
 
             await db.commit()
 
     async def log_operation(self, session_id: str, level: str, message: str, details: str = None):
-        """Log operation message"""
-        async with aiosqlite.connect(self.db_path) as db:
-            await db.execute("""
-                INSERT INTO operation_logs (session_id, level, message, details)
-                VALUES (?, ?, ?, ?)
-            """, (session_id, level, message, details))
-
-            await db.commit()
+        """Queue operation message for the batched log writer"""
+        if self._log_writer is None:
+            self._log_writer = asyncio.create_task(self.log_writer())
+        self._log_queue.put_nowait((session_id, level, message, details))
+
+    async def log_writer(self):
+        """Write queued log rows in batches with one commit each, until close() stops it"""
+        queue = self._log_queue
+        while True:
+            rows = [await queue.get()]
+            await asyncio.sleep(LOG_FLUSH_INTERVAL)
+            while len(rows) < LOG_BATCH_MAX and not queue.empty():
+                rows.append(queue.get_nowait())
+
+            stop = None in rows
+            rows = [row for row in rows if row is not None]
+            if rows:
+                try:
+                    db = await self.connection()
+                    async with self._write_lock:
+                        await db.executemany("""
+                            INSERT INTO operation_logs (session_id, level, message, details)
+                            VALUES (?, ?, ?, ?)
+                        """, rows)
+
+                        await db.commit()
+                except Exception as e:
+                    # Keep the writer alive; losing one batch beats losing every later log
+                    print(f"⚠️ Failed to write {len(rows)} operation log rows: {e}")
+            if stop:
+                return
 
     async def get_session_logs(self, session_id: str) -> List[Dict[str, Any]]:
         """Get logs for a specific session"""
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
-            cursor = await db.execute("""
-                SELECT * FROM operation_logs
-                WHERE session_id = ?
-                ORDER BY timestamp ASC
-            """, (session_id,))
+        db = await self.connection()
+        cursor = await db.execute("""
+            SELECT * FROM operation_logs
+            WHERE session_id = ?
+            ORDER BY timestamp ASC
+        """, (session_id,))
 
-            rows = await cursor.fetchall()
-            return [dict(row) for row in rows]
+        rows = await cursor.fetchall()
+        return [dict(row) for row in rows]
 
     async def get_recent_sessions(self, limit: int = 50) -> List[Dict[str, Any]]:
         """Get recent operation sessions"""
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
-            cursor = await db.execute("""
-                SELECT * FROM sessions
-                ORDER BY created_at DESC
-                LIMIT ?
-            """, (limit,))
+        db = await self.connection()
+        cursor = await db.execute("""
+            SELECT * FROM sessions
+            ORDER BY created_at DESC
+            LIMIT ?
+        """, (limit,))
 
-            rows = await cursor.fetchall()
-            return [dict(row) for row in rows]
+        rows = await cursor.fetchall()
+        return [{**row, "data": decode_json_column(row["data"])} for row in map(dict, rows)]
 
     async def store_metrics(self, metric_type: str, data: Dict[str, Any]):
         """Store metrics for historical tracking"""
-        async with aiosqlite.connect(self.db_path) as db:
+        db = await self.connection()
+        async with self._write_lock:
             await db.execute("""
                 INSERT INTO metrics_history (metric_type, metric_data)
                 VALUES (?, ?)
-            """, (metric_type, str(data)))
+            """, (metric_type, json_dumps(data)))
 
             await db.commit()
 
     async def get_metrics_history(self, metric_type: str, hours: int = 24) -> List[Dict[str, Any]]:
         """Get metrics history for specified period"""
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
-            cursor = await db.execute("""
-                SELECT * FROM metrics_history
-                WHERE metric_type = ?
-                AND timestamp > datetime('now', '-{} hours')
-                ORDER BY timestamp ASC
-            """.format(hours), (metric_type,))
+        db = await self.connection()
+        cursor = await db.execute("""
+            SELECT * FROM metrics_history
+            WHERE metric_type = ?
+            AND timestamp > datetime('now', ?)
+            ORDER BY timestamp ASC
+        """, (metric_type, f"-{int(hours)} hours"))
 
-            rows = await cursor.fetchall()
-            return [dict(row) for row in rows]
+        rows = await cursor.fetchall()
+        return [{**row, "metric_data": decode_json_column(row["metric_data"])} for row in map(dict, rows)]
 
     async def set_config(self, key: str, value: str):
         """Set configuration value"""
-        async with aiosqlite.connect(self.db_path) as db:
+        db = await self.connection()
+        async with self._write_lock:
             await db.execute("""
                 INSERT OR REPLACE INTO config (key, value, updated_at)
                 VALUES (?, ?, CURRENT_TIMESTAMP)
@@ -159,34 +249,37 @@ class Database:
 
     async def get_config(self, key: str) -> Optional[str]:
         """Get configuration value"""
-        async with aiosqlite.connect(self.db_path) as db:
-            cursor = await db.execute("""
-                SELECT value FROM config WHERE key = ?
-            """, (key,))
+        db = await self.connection()
+        cursor = await db.execute("""
+            SELECT value FROM config WHERE key = ?
+        """, (key,))
 
-            row = await cursor.fetchone()
-            return row[0] if row else None
+        row = await cursor.fetchone()
+        return row[0] if row else None
 
     async def cleanup_old_data(self, days: int = 30):
         """Clean up old data to keep database size manageable"""
-        async with aiosqlite.connect(self.db_path) as db:
+        # Constant SQL text lets sqlite3 reuse its cached statements; the age is bound as a parameter
+        cutoff = (f"-{int(days)} days",)
+        db = await self.connection()
+        async with self._write_lock:
             # Remove old logs
             await db.execute("""
                 DELETE FROM operation_logs
-                WHERE timestamp < datetime('now', '-{} days')
-            """.format(days))
+                WHERE timestamp < datetime('now', ?)
+            """, cutoff)
 
             # Remove old sessions
             await db.execute("""
                 DELETE FROM sessions
-                WHERE created_at < datetime('now', '-{} days')
-            """.format(days))
+                WHERE created_at < datetime('now', ?)
+            """, cutoff)
 
             # Keep only recent metrics
             await db.execute("""
                 DELETE FROM metrics_history
-                WHERE timestamp < datetime('now', '-{} days')
-            """.format(days))
+                WHERE timestamp < datetime('now', ?)
+            """, cutoff)
 
             await db.commit()
 
@@ -200,6 +293,11 @@ async def init_database():
     await db.init_database()
 
 
+async def close_database():
+    """Close the database connection"""
+    await db.close()
+
+
 async def get_database() -> Database:
     """Get database instance"""
     return db
\ No newline at end of file
@@ -15,7 +15,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent))
 
 from app.main import app
-from app.core.config import settings
+from app.core.config import settings, SERVER_LOOP, SERVER_HTTP
 
 
 class ServerManager:
@@ -61,8 +61,14 @@ class ServerManager:
                 host=settings.HOST,
                 port=settings.PORT,
                 reload=settings.DEBUG,
-                access_log=True,
-                log_level=settings.LOG_LEVEL.lower()
+                # Per-request access lines only while developing
+                access_log=settings.DEBUG,
+                server_header=False,
+                log_level=settings.LOG_LEVEL.lower(),
+                loop=SERVER_LOOP,
+                http=SERVER_HTTP,
+                ws="websockets",
+                ws_per_message_deflate=settings.WS_PER_MESSAGE_DEFLATE
             )
 
             server = uvicorn.Server(config)
@@ -3,16 +3,251 @@
 Simple web server for testing the GitHub Codespaces Manager web interface
 """
 
+import io
 import os
+import re
 import sys
+import gzip
+import errno
+import stat
+import time
+import socket
+import threading
+import mimetypes
 import http.server
-import socketserver
+import http.client
+import email.utils
+import urllib.parse
 import webbrowser
 from pathlib import Path
 
+# Serve through uvicorn's event loop when it's installed; the stdlib server is the no-dependency fallback
+try:
+    from starlette.applications import Starlette
+    from starlette.middleware import Middleware
+    from starlette.middleware.cors import CORSMiddleware
+    from starlette.datastructures import Headers
+    from starlette.responses import Response
+    from starlette.staticfiles import StaticFiles
+    HAS_STARLETTE = True
+except ImportError:
+    HAS_STARLETTE = False
+
+try:
+    import uvicorn
+    HAS_UVICORN = HAS_STARLETTE
+except ImportError:
+    HAS_UVICORN = False
+
+# Rust (hyper) HTTP core with multi-process workers for the same ASGI app, opt-in with --fast
+try:
+    from granian import Granian
+    from granian.constants import Interfaces
+    HAS_GRANIAN = HAS_STARLETTE
+except ImportError:
+    HAS_GRANIAN = False
+
+try:
+    import brotli
+    HAS_BROTLI = True
+except ImportError:
+    HAS_BROTLI = False
+
+# Optional io_uring engine for the stdlib fallback (Linux only, opt-in with --iouring)
+try:
+    import liburing
+    HAS_LIBURING = True
+except ImportError:
+    HAS_LIBURING = False
+
+try:
+    import resource
+    HAS_RESOURCE = True
+except ImportError:  # Windows
+    HAS_RESOURCE = False
+
 # Configuration
 PORT = 3000
 FRONTEND_DIR = Path(__file__).parent / "frontend"
+CORS_METHODS = ['GET', 'POST', 'PUT', 'DELETE', 'OPTIONS']
+CORS_HEADERS = ['Content-Type', 'Authorization']
+# Identical on every response, so the values are joined once; the io_uring engine sends the whole block pre-serialized
+CORS_METHODS_VALUE = ', '.join(CORS_METHODS)
+CORS_HEADERS_VALUE = ', '.join(CORS_HEADERS)
+CORS_HEADER_BLOCK = (f"Access-Control-Allow-Origin: *\r\n"
+                     f"Access-Control-Allow-Methods: {CORS_METHODS_VALUE}\r\n"
+                     f"Access-Control-Allow-Headers: {CORS_HEADERS_VALUE}\r\n").encode('latin-1')
+GRANIAN_WORKERS = os.cpu_count() or 1
+# SO_REUSEADDR covers TIME_WAIT; this covers a previous run that is still releasing the port
+BIND_RETRY_DELAY = 1.0
+# Give the server a moment to start listening before the browser's first request
+BROWSER_OPEN_DELAY = 0.2
+# Frontend files up to this size are held in memory; each entry is re-stat'ed at most once per interval
+STATIC_CACHE_MAX_FILE = 1024 * 1024
+STATIC_RECHECK_INTERVAL = 2.0
+# Absolute path -> (body, stat result, etag, content type, last checked, {encoding: compressed body})
+STATIC_CACHE = {}
+# Text assets are compressed once when cached; clients get the best encoding they accept, br before gzip
+COMPRESSIBLE_TYPES = ('text/', 'application/javascript', 'application/json', 'image/svg+xml')
+ENCODING_PREFERENCE = ('br', 'gzip')
+# Fingerprinted assets never change under the same URL; HTML entry points must always revalidate
+HASHED_ASSET_PATTERN = re.compile(r'\.[0-9a-f]{8,}\.(?:js|css|woff2?|png|svg|jpg)$')
+IMMUTABLE_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+# Same cap on header fields as http.client; bigger or unusual header blocks go through the stdlib parser
+HTTP_MAX_HEADERS = 100
+FAST_PATH_VERSIONS = (b'HTTP/1.0', b'HTTP/1.1')
+# Per-thread scratch buffer for copying bodies sendfile() can't take (64 KiB less allocator overhead)
+COPY_BUFFER_SIZE = 65472
+COPY_BUFFERS = threading.local()
+# io_uring engine: ring depth, per-connection receive buffer and the largest request head accepted
+IOURING_ENTRIES = 1024
+IOURING_RECV_SIZE = 16 * 1024
+IOURING_MAX_HEAD = 64 * 1024
+# A kernel thread polls the submission queue, so queuing work costs no syscall while it's awake
+IOURING_SQPOLL = True
+# Large uncached files are streamed front to back, so ask the kernel for aggressive readahead
+FADV_SEQUENTIAL = getattr(os, 'POSIX_FADV_SEQUENTIAL', None)
+# Linux-only; holds partial frames so response headers and body share segments (nginx's tcp_nopush)
+TCP_CORK = getattr(socket, 'TCP_CORK', None)
+
+
+def cached_file(path: str):
+    """Cache entry for a frontend file, reloading it when its size or mtime changes"""
+    now = time.monotonic()
+    entry = STATIC_CACHE.get(path)
+    if entry and now - entry[4] < STATIC_RECHECK_INTERVAL:
+        return entry
+
+    try:
+        st = os.stat(path)
+    except OSError:
+        STATIC_CACHE.pop(path, None)
+        return None
+    if not stat.S_ISREG(st.st_mode) or st.st_size > STATIC_CACHE_MAX_FILE:
+        return None
+
+    if entry and entry[1].st_mtime_ns == st.st_mtime_ns and entry[1].st_size == st.st_size:
+        entry = (*entry[:4], now, entry[5])
+    else:
+        with open(path, 'rb') as f:
+            body = f.read()
+        # Weak validator from size and mtime; no hash needed
+        etag = f'W/"{st.st_size:x}-{st.st_mtime_ns:x}"'
+        content_type = mimetypes.guess_type(path)[0] or 'application/octet-stream'
+        entry = (body, st, etag, content_type, now, compress_variants(body, content_type))
+    STATIC_CACHE[path] = entry
+    return entry
+
+
+def cache_control(target: str):
+    """Cache-Control value for a request target, or None to leave caching to the validators"""
+    path = urllib.parse.urlsplit(target).path
+    if HASHED_ASSET_PATTERN.search(path):
+        return IMMUTABLE_CACHE_CONTROL
+    if path.endswith(('/', '.html')):
+        return 'no-cache'
+    return None
+
+
+def copy_buffer() -> memoryview:
+    """This thread's reusable copy buffer, allocated on first use"""
+    buffer = getattr(COPY_BUFFERS, 'buffer', None)
+    if buffer is None:
+        buffer = COPY_BUFFERS.buffer = memoryview(bytearray(COPY_BUFFER_SIZE))
+    return buffer
+
+
+def raise_fd_limit():
+    """Lift the soft open-file limit to the hard limit so many concurrent connections don't hit EMFILE"""
+    if not HAS_RESOURCE:
+        return
+    try:
+        soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+        if hard == resource.RLIM_INFINITY or hard > soft:
+            resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))
+    except (ValueError, OSError):
+        pass
+
+
+def compress_variants(body: bytes, content_type: str) -> dict:
+    """Precompressed bodies for text assets, keeping only encodings that actually shrink them"""
+    if not content_type.startswith(COMPRESSIBLE_TYPES):
+        return {}
+    variants = {'gzip': gzip.compress(body, 9, mtime=0)}
+    if HAS_BROTLI:
+        variants['br'] = brotli.compress(body, quality=11)
+    return {encoding: data for encoding, data in variants.items() if len(data) < len(body)}
+
+
+def accepted_encodings(header: str) -> set:
+    """Content codings named in Accept-Encoding, minus any refused with q=0"""
+    accepted = set()
+    for part in header.split(','):
+        coding, _, params = part.partition(';')
+        q = params.strip().replace(' ', '')
+        if q.startswith('q=') and not q[2:].strip('0.'):
+            continue
+        accepted.add(coding.strip().lower())
+    return accepted
+
+
+def select_representation(entry, accept_encoding: str):
+    """Body, validator and content coding to serve for a cache entry given the client's Accept-Encoding"""
+    body, _, etag, _, _, variants = entry
+    if variants:
+        accepted = accepted_encodings(accept_encoding)
+        encoding = next((e for e in ENCODING_PREFERENCE if e in variants and e in accepted), None)
+        if encoding:
+            # Each representation needs its own validator
+            return variants[encoding], f'{etag[:-1]}-{encoding}"', encoding
+    return body, etag, None
+
+
+def request_not_modified(headers, etag: str, st: os.stat_result) -> bool:
+    """Check the request's validators; If-None-Match takes precedence over If-Modified-Since"""
+    if 'If-None-Match' in headers:
+        return etag in headers['If-None-Match']
+    if 'If-Modified-Since' in headers:
+        try:
+            since = email.utils.parsedate_to_datetime(headers['If-Modified-Since'])
+        except (TypeError, ValueError, IndexError, OverflowError):
+            return False
+        # Last-Modified has whole-second resolution
+        return since.tzinfo is not None and int(st.st_mtime) <= since.timestamp()
+    return False
+
+
+def parse_header_block(block: bytes):
+    """HTTPMessage for a raw header block, or None when it needs the full email parser (folded or malformed lines)"""
+    headers = http.client.HTTPMessage()
+    for line in block.decode('iso-8859-1').split('\r\n'):
+        if not line:
+            continue
+        name, sep, value = line.partition(':')
+        if not sep or line[0] in ' \t' or len(headers) >= HTTP_MAX_HEADERS:
+            return None
+        headers[name] = value.lstrip(' \t')
+    return headers
+
+
+def preload_static_cache():
+    """Load the frontend tree into memory before the first request"""
+    for root, _, files in os.walk(FRONTEND_DIR):
+        for name in files:
+            cached_file(os.path.join(root, name))
+
+
+class StaticHTTPServer(http.server.ThreadingHTTPServer):
+    """Threaded server whose port can optionally be shared by several worker processes"""
+
+    # Off by default: with SO_REUSEPORT a second copy binds silently and the kernel splits traffic
+    reuse_port = False
+
+    def server_bind(self):
+        if self.reuse_port and hasattr(socket, 'SO_REUSEPORT'):
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        super().server_bind()
+
 
 class CustomHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
     """Custom handler to serve from frontend directory"""
@@ -20,13 +255,463 @@ class CustomHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, directory=str(FRONTEND_DIR), **kwargs)
 
+    def setup(self):
+        super().setup()
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def do_GET(self):
+        """Serve a GET with the socket corked so headers and body go out together"""
+        if TCP_CORK is None:
+            return super().do_GET()
+        self.connection.setsockopt(socket.IPPROTO_TCP, TCP_CORK, 1)
+        try:
+            super().do_GET()
+        finally:
+            try:
+                self.connection.setsockopt(socket.IPPROTO_TCP, TCP_CORK, 0)
+            except OSError:
+                pass
+
+    def parse_request(self):
+        """Split an already-buffered header block directly; anything unusual goes to the stdlib parser"""
+        words = self.raw_requestline.split()
+        buffered = self.rfile.peek()
+        # Length of the header section including its terminating blank line, 0 if not fully buffered
+        end = buffered.find(b'\r\n\r\n')
+        size = 2 if buffered.startswith(b'\r\n') else end + 4 if end >= 0 else 0
+        if len(words) != 3 or words[2] not in FAST_PATH_VERSIONS or not size:
+            return super().parse_request()
+        headers = parse_header_block(buffered[:size])
+        if headers is None:
+            return super().parse_request()
+        self.rfile.read(size)
+
+        self.command, path, self.request_version = (word.decode('iso-8859-1') for word in words)
+        self.requestline = str(self.raw_requestline, 'iso-8859-1').rstrip('\r\n')
+        # Same open-redirect guard as the stdlib (gh-87389)
+        self.path = '/' + path.lstrip('/') if path.startswith('//') else path
+        self.headers = headers
+        self.close_connection = self.request_version == 'HTTP/1.0' or self.protocol_version < 'HTTP/1.1'
+        conntype = headers.get('Connection', '').lower()
+        if conntype == 'close':
+            self.close_connection = True
+        elif conntype == 'keep-alive' and self.protocol_version >= 'HTTP/1.1':
+            self.close_connection = False
+        if (headers.get('Expect', '').lower() == '100-continue' and
+                self.protocol_version >= 'HTTP/1.1' and self.request_version >= 'HTTP/1.1'):
+            return self.handle_expect_100()
+        return True
+
+    def not_modified(self, st: os.stat_result) -> bool:
+        """Check the request's validators against the current ETag"""
+        return request_not_modified(self.headers, self.etag, st)
+
+    def send_head(self):
+        """Serve cached files from memory and answer conditional GETs with 304 before touching the disk"""
+        self.etag = None
+        self.cache_policy = None
+        path = self.translate_path(self.path)
+        if urllib.parse.urlsplit(self.path).path.endswith('/'):
+            path = next((candidate for candidate in (os.path.join(path, 'index.html'), os.path.join(path, 'index.htm'))
+                         if candidate in STATIC_CACHE or os.path.isfile(candidate)), path)
+
+        entry = cached_file(path)
+        if entry or os.path.isfile(path):
+            # Only responses that serve the file carry a caching policy, never errors
+            self.cache_policy = cache_control(self.path)
+        if entry:
+            _, st, _, content_type, _, variants = entry
+            body, self.etag, encoding = select_representation(entry, self.headers.get('Accept-Encoding', ''))
+            if self.not_modified(st):
+                self.send_response(304)
+                if variants:
+                    self.send_header('Vary', 'Accept-Encoding')
+                self.end_headers()
+                return None
+            self.send_response(200)
+            self.send_header('Content-type', content_type)
+            self.send_header('Content-Length', str(len(body)))
+            self.send_header('Last-Modified', self.date_time_string(st.st_mtime))
+            if variants:
+                self.send_header('Vary', 'Accept-Encoding')
+            if encoding:
+                self.send_header('Content-Encoding', encoding)
+            self.end_headers()
+            return io.BytesIO(body)
+
+        if os.path.isfile(path):
+            st = os.stat(path)
+            self.etag = f'W/"{st.st_size:x}-{st.st_mtime_ns:x}"'
+            if self.not_modified(st):
+                self.send_response(304)
+                self.end_headers()
+                return None
+
+        return super().send_head()
+
     def end_headers(self):
+        if getattr(self, 'etag', None):
+            self.send_header('ETag', self.etag)
+        if getattr(self, 'cache_policy', None):
+            self.send_header('Cache-Control', self.cache_policy)
         # Add CORS headers
         self.send_header('Access-Control-Allow-Origin', '*')
-        self.send_header('Access-Control-Allow-Methods', 'GET, POST, PUT, DELETE, OPTIONS')
-        self.send_header('Access-Control-Allow-Headers', 'Content-Type, Authorization')
+        self.send_header('Access-Control-Allow-Methods', CORS_METHODS_VALUE)
+        self.send_header('Access-Control-Allow-Headers', CORS_HEADERS_VALUE)
         super().end_headers()
 
+    def copyfile(self, source, outputfile):
+        """Send file bodies with sendfile() so the kernel copies pages straight to the socket"""
+        if isinstance(source, io.BytesIO):
+            # getvalue() hands back the cached bytes object itself; getbuffer() would copy it first
+            outputfile.write(source.getvalue())
+            return
+        try:
+            if FADV_SEQUENTIAL is not None:
+                os.posix_fadvise(source.fileno(), 0, 0, FADV_SEQUENTIAL)
+            # socket.sendfile() runs the os.sendfile() loop itself, waiting for writability as needed
+            self.connection.sendfile(source)
+            return
+        except (AttributeError, OSError, ValueError):
+            pass
+        # Read into the thread's buffer rather than allocating a fresh chunk per read
+        buffer = copy_buffer()
+        while size := source.readinto(buffer):
+            outputfile.write(buffer[:size])
+
+
+class IoUringHTTPServer:
+    """Single-threaded io_uring loop answering GET/HEAD for frontend files from the in-memory cache"""
+
+    # Completion kinds, packed into the high half of each SQE's user data with the fd in the low half
+    ACCEPT, RECV, SEND, CLOSE = range(4)
+    REQUIRED_OPS = ('IORING_OP_ACCEPT', 'IORING_OP_RECV', 'IORING_OP_SEND', 'IORING_OP_CLOSE')
+    server_version = f'{CustomHTTPRequestHandler.server_version} {CustomHTTPRequestHandler.sys_version}'
+    # translate_path only needs the handler's directory attribute
+    directory = str(FRONTEND_DIR)
+
+    def __init__(self, server_address, reuse_port: bool = False):
+        self.ring, self.sqpoll = self.create_ring()
+        try:
+            self.socket = socket.create_server(server_address, backlog=socket.SOMAXCONN,
+                                               reuse_port=reuse_port and hasattr(socket, 'SO_REUSEPORT'))
+        except OSError:
+            liburing.io_uring_queue_exit(self.ring)
+            raise
+        self.multishot = True
+        self.buffers = {}   # fd -> receive buffer
+        self.pending = {}   # fd -> bytes received but not yet parsed
+        self.outgoing = {}  # fd -> (unsent response bytes, keep the connection open afterwards)
+
+    @staticmethod
+    def create_ring():
+        """Ring with a submission-polling kernel thread when allowed, and whether it got one"""
+        if IOURING_SQPOLL:
+            ring = liburing.Ring()
+            try:
+                liburing.io_uring_queue_init(IOURING_ENTRIES, ring, liburing.IORING_SETUP_SQPOLL)
+                return ring, True
+            except OSError:
+                # SQPOLL needs CAP_SYS_NICE before Linux 5.11
+                pass
+        ring = liburing.Ring()
+        liburing.io_uring_queue_init(IOURING_ENTRIES, ring)
+        return ring, False
+
+    @classmethod
+    def supported(cls) -> bool:
+        """Probe that the kernel allows io_uring and implements every operation the loop submits"""
+        if not HAS_LIBURING:
+            return False
+        try:
+            ring = liburing.Ring()
+            liburing.io_uring_queue_init(2, ring)
+            liburing.io_uring_queue_exit(ring)
+            probe = liburing.io_uring_get_probe()
+        except OSError:
+            return False
+        if probe is None:
+            return False
+        try:
+            return all(liburing.io_uring_opcode_supported(probe, getattr(liburing.io_uring_op, op))
+                       for op in cls.REQUIRED_OPS)
+        finally:
+            liburing.io_uring_free_probe(probe)
+
+    def queue(self, kind: int, fd: int, prep, *args):
+        """Prepare the next SQE, flushing the submission queue first if it's full"""
+        sqe = liburing.io_uring_get_sqe(self.ring)
+        while sqe is None:
+            liburing.io_uring_submit(self.ring)
+            if self.sqpoll:
+                # Submitting only wakes the poller; wait until it has actually consumed an entry
+                liburing.io_uring_sqring_wait(self.ring)
+            sqe = liburing.io_uring_get_sqe(self.ring)
+        prep(sqe, *args)
+        liburing.io_uring_sqe_set_data64(sqe, kind << 32 | fd)
+
+    def queue_accept(self):
+        fd = self.socket.fileno()
+        if self.multishot:
+            self.queue(self.ACCEPT, fd, liburing.io_uring_prep_multishot_accept, fd)
+        else:
+            self.queue(self.ACCEPT, fd, liburing.io_uring_prep_accept, fd)
+
+    def queue_recv(self, fd: int):
+        self.queue(self.RECV, fd, liburing.io_uring_prep_recv, fd, self.buffers[fd])
+
+    def queue_send(self, fd: int):
+        self.queue(self.SEND, fd, liburing.io_uring_prep_send, fd, self.outgoing[fd][0])
+
+    def close_connection(self, fd: int):
+        # Only one operation is ever in flight per connection, so its state can go now
+        self.buffers.pop(fd, None)
+        self.pending.pop(fd, None)
+        self.outgoing.pop(fd, None)
+        self.queue(self.CLOSE, fd, liburing.io_uring_prep_close, fd)
+
+    def serve_forever(self):
+        """Submit queued work and process completions until interrupted"""
+        cqe = liburing.Cqe()
+        self.queue_accept()
+        while True:
+            try:
+                liburing.io_uring_submit_and_wait(self.ring, 1)
+                liburing.io_uring_wait_cqe(self.ring, cqe)
+            except InterruptedError:
+                continue
+            # Harvest every ready completion before acting on any. Entries are taken one at a time
+            # through peek so the head index wraps with the ring mask; cqe[i] would run off its end
+            completions = []
+            for _ in range(liburing.io_uring_cq_ready(self.ring)):
+                liburing.io_uring_peek_cqe(self.ring, cqe)
+                entry = cqe[0]
+                user_data, flags = entry.user_data, entry.flags
+                try:
+                    result = entry.res
+                except OSError as e:
+                    result = -e.errno
+                completions.append((user_data, result, flags))
+                liburing.io_uring_cqe_seen(self.ring, entry)
+            for user_data, result, flags in completions:
+                self.complete(user_data >> 32, user_data & 0xFFFFFFFF, result, flags)
+
+    def complete(self, kind: int, fd: int, result: int, flags: int):
+        """Advance one connection's state machine after a completion"""
+        if kind == self.ACCEPT:
+            if result >= 0:
+                self.buffers[result] = bytearray(IOURING_RECV_SIZE)
+                self.pending[result] = bytearray()
+                self.queue_recv(result)
+            elif result == -errno.EINVAL and self.multishot:
+                # Multishot accept needs Linux 5.19; re-arm single accepts instead
+                self.multishot = False
+            if not flags & liburing.IORING_CQE_F_MORE:
+                self.queue_accept()
+        elif kind == self.RECV:
+            if result <= 0:
+                self.close_connection(fd)
+            else:
+                self.received(fd, result)
+        elif kind == self.SEND:
+            if result < 0:
+                self.close_connection(fd)
+            else:
+                self.sent(fd, result)
+
+    def received(self, fd: int, size: int):
+        """Answer every complete request head buffered on the connection, pipelined ones included"""
+        pending = self.pending[fd]
+        pending += memoryview(self.buffers[fd])[:size]
+        responses = []
+        keep_alive = True
+        while keep_alive:
+            head_end = pending.find(b'\r\n\r\n')
+            if head_end < 0:
+                break
+            head = bytes(pending[:head_end + 4])
+            del pending[:head_end + 4]
+            response, keep_alive = self.respond(head)
+            responses.append(response)
+
+        if responses:
+            self.outgoing[fd] = (b''.join(responses), keep_alive)
+            self.queue_send(fd)
+        elif len(pending) > IOURING_MAX_HEAD:
+            self.close_connection(fd)
+        else:
+            self.queue_recv(fd)
+
+    def sent(self, fd: int, size: int):
+        data, keep_alive = self.outgoing[fd]
+        if size < len(data):
+            self.outgoing[fd] = (data[size:], keep_alive)
+            self.queue_send(fd)
+        elif keep_alive:
+            del self.outgoing[fd]
+            self.queue_recv(fd)
+        else:
+            self.close_connection(fd)
+
+    def resolve(self, target: str) -> str:
+        """Filesystem path for a request target, mapping directories to their index page"""
+        path = http.server.SimpleHTTPRequestHandler.translate_path(self, target)
+        if urllib.parse.urlsplit(target).path.endswith('/'):
+            path = next((candidate for candidate in (os.path.join(path, 'index.html'), os.path.join(path, 'index.htm'))
+                         if candidate in STATIC_CACHE or os.path.isfile(candidate)), path)
+        return path
+
+    @staticmethod
+    def read_uncached(path: str):
+        """Cache-shaped entry for a file too large for STATIC_CACHE, read fresh for this request"""
+        try:
+            st = os.stat(path)
+            if not stat.S_ISREG(st.st_mode):
+                return None
+            # A blocking read stalls the loop briefly; only files over STATIC_CACHE_MAX_FILE come here
+            with open(path, 'rb') as f:
+                body = f.read()
+        except OSError:
+            return None
+        content_type = mimetypes.guess_type(path)[0] or 'application/octet-stream'
+        return (body, st, f'W/"{st.st_size:x}-{st.st_mtime_ns:x}"', content_type, 0, {})
+
+    def respond(self, head: bytes):
+        """Serialized response for one request head, and whether the connection stays open"""
+        request_line, _, header_block = head.partition(b'\r\n')
+        try:
+            method, target, version = request_line.decode('latin-1').split()
+        except ValueError:
+            return self.build_response(400, [], b'Bad request', False), False
+        headers = parse_header_block(header_block)
+        if headers is None:
+            headers = http.client.parse_headers(io.BytesIO(header_block))
+        connection = headers.get('Connection', '').lower()
+        keep_alive = connection == 'keep-alive' if version == 'HTTP/1.0' else connection != 'close'
+
+        if method not in ('GET', 'HEAD'):
+            # Request bodies aren't read, so the connection can't be reused
+            return self.build_response(501, [], b'Unsupported method', False), False
+        path = self.resolve(target)
+        entry = cached_file(path) or self.read_uncached(path)
+        if entry is None:
+            parts = urllib.parse.urlsplit(target)
+            if os.path.isdir(path) and not parts.path.endswith('/'):
+                # Same redirect the stdlib handler sends, so relative links resolve inside the directory
+                location = urllib.parse.urlunsplit(parts._replace(path=parts.path + '/'))
+                return self.build_response(301, [('Location', location)], b'', keep_alive), keep_alive
+            return self.build_response(404, [], b'File not found', keep_alive, method == 'HEAD'), keep_alive
+
+        _, st, _, content_type, _, variants = entry
+        body, etag, encoding = select_representation(entry, headers.get('Accept-Encoding', ''))
+        fields = [('Vary', 'Accept-Encoding')] if variants else []
+        policy = cache_control(target)
+        if policy:
+            fields.append(('Cache-Control', policy))
+        if request_not_modified(headers, etag, st):
+            return self.build_response(304, fields + [('ETag', etag)], None, keep_alive), keep_alive
+        fields.append(('Last-Modified', email.utils.formatdate(st.st_mtime, usegmt=True)))
+        if encoding:
+            fields.append(('Content-Encoding', encoding))
+        fields.append(('ETag', etag))
+        return self.build_response(200, fields, body, keep_alive, method == 'HEAD', content_type), keep_alive
+
+    def build_response(self, status: int, fields: list, body, keep_alive: bool,
+                       head_only: bool = False, content_type: str = 'text/plain') -> bytes:
+        lines = [f'HTTP/1.1 {status} {http.HTTPStatus(status).phrase}',
+                 f'Server: {self.server_version}',
+                 f'Date: {email.utils.formatdate(usegmt=True)}']
+        if body is not None:
+            lines += [f'Content-type: {content_type}', f'Content-Length: {len(body)}']
+        lines += [f'{name}: {value}' for name, value in fields]
+        lines.append(f'Connection: {"keep-alive" if keep_alive else "close"}')
+        head = ('\r\n'.join(lines) + '\r\n').encode('latin-1') + CORS_HEADER_BLOCK + b'\r\n'
+        return head if body is None or head_only else head + body
+
+    def server_close(self):
+        self.socket.close()
+        liburing.io_uring_queue_exit(self.ring)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.server_close()
+
+
+def bind_with_retry(factory):
+    """Create a listening server, retrying once if the port is still in use"""
+    try:
+        return factory()
+    except OSError as e:
+        if e.errno != errno.EADDRINUSE:
+            raise
+    time.sleep(BIND_RETRY_DELAY)
+    return factory()
+
+
+def create_stdlib_server(use_iouring: bool, reuse_port: bool):
+    """io_uring engine when requested and the kernel allows it, otherwise the threaded server"""
+    if use_iouring:
+        if IoUringHTTPServer.supported():
+            return bind_with_retry(lambda: IoUringHTTPServer(("", PORT), reuse_port))
+        print("⚠️ io_uring is unavailable here; using the threaded server")
+    StaticHTTPServer.reuse_port = reuse_port
+    return bind_with_retry(lambda: StaticHTTPServer(("", PORT), CustomHTTPRequestHandler))
+
+
+if HAS_STARLETTE:
+    class FrontendStaticFiles(StaticFiles):
+        """StaticFiles serving from the shared static cache with the stdlib handler's encodings and caching"""
+
+        def file_response(self, full_path, stat_result, scope, status_code=200):
+            entry = cached_file(str(full_path)) if status_code == 200 else None
+            if entry:
+                response = self.cached_response(entry, Headers(scope=scope))
+            else:
+                response = super().file_response(full_path, stat_result, scope, status_code)
+            policy = cache_control(scope['path'])
+            # Only responses that serve the file carry a caching policy, never a 404 page
+            if policy and response.status_code in (200, 304):
+                response.headers['Cache-Control'] = policy
+            return response
+
+        def cached_response(self, entry, request_headers: "Headers") -> "Response":
+            """Precompressed representation of a cached file, or a 304 when the client's copy is current"""
+            _, st, _, content_type, _, variants = entry
+            body, etag, encoding = select_representation(entry, request_headers.get('accept-encoding', ''))
+            headers = {'ETag': etag, 'Last-Modified': email.utils.formatdate(st.st_mtime, usegmt=True)}
+            if variants:
+                headers['Vary'] = 'Accept-Encoding'
+            if request_not_modified(request_headers, etag, st):
+                return Response(status_code=304, headers=headers)
+            if encoding:
+                headers['Content-Encoding'] = encoding
+            return Response(body, media_type=content_type, headers=headers)
+
+
+def create_asgi_app() -> "Starlette":
+    """Static frontend app with the same CORS policy and precompressed assets as the stdlib handler"""
+    # Compression happens once per file here, not per request as GZipMiddleware would do it
+    preload_static_cache()
+    app = Starlette(middleware=[
+        Middleware(CORSMiddleware, allow_origins=['*'], allow_methods=CORS_METHODS, allow_headers=CORS_HEADERS),
+    ])
+    app.mount('/', FrontendStaticFiles(directory=str(FRONTEND_DIR), html=True))
+    return app
+
+
+def open_browser():
+    """Open the frontend in a browser once the server has had time to start"""
+    time.sleep(BROWSER_OPEN_DELAY)
+    try:
+        # open() reports False rather than raising when no browser is available
+        opened = webbrowser.open(f'http://localhost:{PORT}')
+    except (webbrowser.Error, OSError):
+        opened = False
+    print("🌐 Opening web browser..." if opened else "⚠️ Could not open browser automatically")
+
+
 def main():
     """Start the simple web server"""
 
@@ -37,34 +722,66 @@ def main():
 
     # Change to frontend directory
     os.chdir(FRONTEND_DIR)
+    raise_fd_limit()
+    # --iouring opts into the io_uring engine and --fast into granian; both take precedence over uvicorn
+    use_iouring = '--iouring' in sys.argv[1:]
+    # --reuse-port lets several copies of the stdlib engines share the port as workers
+    reuse_port = '--reuse-port' in sys.argv[1:]
+    use_granian = '--fast' in sys.argv[1:] and not use_iouring
+    if use_granian and not HAS_GRANIAN:
+        print("⚠️ --fast needs granian and starlette installed; ignoring it")
+        use_granian = False
 
     try:
-        # Create server
-        with socketserver.TCPServer(("", PORT), CustomHTTPRequestHandler) as httpd:
-            print("🚀 GitHub Codespaces Manager - Simple Web Server")
-            print("=" * 60)
-            print(f"🌐 Server running at: http://localhost:{PORT}")
-            print(f"📁 Serving from: {FRONTEND_DIR}")
-            print(f"📄 Main page: http://localhost:{PORT}/index.html")
-            print("\n💡 This is a demo version with mock data")
-            print("💡 For full functionality, start the FastAPI backend")
-            print("\n🛑 Press Ctrl+C to stop the server")
-            print("=" * 60)
-
-            # Try to open browser
-            try:
-                webbrowser.open(f'http://localhost:{PORT}')
-                print("🌐 Opening web browser...")
-            except:
-                print("⚠️ Could not open browser automatically")
+        # Create server; the threaded fallback handles each connection on its own daemon thread
+        # (ThreadingHTTPServer sets daemon_threads and allow_reuse_address)
+        use_asgi = use_granian or (HAS_UVICORN and not use_iouring)
+        httpd = None if use_asgi else create_stdlib_server(use_iouring, reuse_port)
+        if httpd is not None:
+            preload_static_cache()
+        if use_granian:
+            engine = f'granian (workers: {GRANIAN_WORKERS})'
+        elif httpd is None:
+            engine = 'uvicorn (asyncio)'
+        elif isinstance(httpd, IoUringHTTPServer):
+            engine = 'io_uring (SQPOLL)' if httpd.sqpoll else 'io_uring'
+        else:
+            engine = 'http.server (threaded)'
 
-            # Start serving
-            httpd.serve_forever()
+        # Banner goes out in one write and flush rather than a print() per line
+        sys.stdout.write(
+            "🚀 GitHub Codespaces Manager - Simple Web Server\n"
+            f"{'=' * 60}\n"
+            f"🌐 Server running at: http://localhost:{PORT}\n"
+            f"📁 Serving from: {FRONTEND_DIR}\n"
+            f"📄 Main page: http://localhost:{PORT}/index.html\n"
+            f"⚙️ Engine: {engine}\n"
+            "\n💡 This is a demo version with mock data\n"
+            "💡 For full functionality, start the FastAPI backend\n"
+            "\n🛑 Press Ctrl+C to stop the server\n"
+            f"{'=' * 60}\n"
+        )
+        sys.stdout.flush()
+
+        # Try to open browser; launchers can block, so it runs off the startup path
+        threading.Thread(target=open_browser, daemon=True).start()
+
+        # Start serving; uvicorn picks uvloop and httptools itself when they're installed
+        if use_granian:
+            # Workers are separate processes, so each one imports this module and builds its own app
+            Granian(f'{Path(__file__).stem}:create_asgi_app', address="0.0.0.0", port=PORT,
+                    interface=Interfaces.ASGI, factory=True, workers=GRANIAN_WORKERS,
+                    working_dir=Path(__file__).parent, log_level="warning").serve()
+        elif httpd is None:
+            uvicorn.run(create_asgi_app(), host="0.0.0.0", port=PORT, loop="auto", http="auto", log_level="warning")
+        else:
+            with httpd:
+                httpd.serve_forever()
 
     except KeyboardInterrupt:
         print("\n🛑 Server stopped by user")
     except OSError as e:
-        if "Address already in use" in str(e):
+        if e.errno == errno.EADDRINUSE:
             print(f"❌ Port {PORT} is already in use")
             print("💡 Try stopping other servers or use a different port")
         else: